@@ -401,13 +401,17 @@ def get_focused_app() -> dict:
     return focused_app_actions.get_focused_app()
 
 
-def get_accessibility_tree() -> dict:
+def get_accessibility_tree(role: str | None = None, name: str | None = None) -> dict:
     """Get accessibility tree.
     
+    Args:
+        role: Only return nodes with this role
+        name: Only return nodes whose name contains this text
+    
     Returns:
-        Dictionary with accessibility tree data
+        Dictionary with accessibility tree data, or "matches" when filtered
     """
-    return accessibility_tree_actions.get_accessibility_tree()
+    return accessibility_tree_actions.get_accessibility_tree(role=role, name=name)
 
 
 # Configuration
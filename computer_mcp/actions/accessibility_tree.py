@@ -8,21 +8,29 @@ from computer_mcp.core.platform import (
 )
 
 import subprocess
-from typing import Any
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from computer_mcp.core.ui_changes import ui_generation
 
 if IS_WINDOWS:
-    import psutil
+    from computer_mcp.core.win_process import get_process_name
+
+    try:
+        import win32gui
+        import win32process
+        HAS_PYWIN32 = True
+    except ImportError:
+        HAS_PYWIN32 = False
 
-    def get_accessibility_tree() -> dict[str, Any]:
+    def _get_platform_tree() -> dict[str, Any]:
         """Get Windows accessibility tree.
         
         Returns:
             Dictionary with accessibility tree data or error
         """
-        try:
-            import win32gui
-            import win32process
-        except ImportError:
+        if not HAS_PYWIN32:
             return {"error": "pywin32 not installed", "note": "Install pywin32 for Windows accessibility tree support"}
         
         # Get focused window info
@@ -32,7 +40,7 @@ if IS_WINDOWS:
         
         try:
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            proc = psutil.Process(pid)
+            process_name = get_process_name(pid)
             window_title = win32gui.GetWindowText(hwnd)
             
             # Get window bounds
@@ -46,9 +54,9 @@ if IS_WINDOWS:
             
             return {
                 "tree": {
-                    "name": window_title or proc.name(),
+                    "name": window_title or process_name,
                     "control_type": "Window",
-                    "process": proc.name(),
+                    "process": process_name,
                     "pid": pid,
                     "bounds": bounds,
                     "children": [{
@@ -61,8 +69,20 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Error getting window info: {str(e)}"}
 
+    # The simplified tree costs no more than a cache check would
+    _focus_key: Optional[Callable[[], Any]] = None
+
 elif IS_DARWIN:
-    def get_accessibility_tree() -> dict[str, Any]:
+    from computer_mcp.actions.focused_app import get_focused_app
+    from computer_mcp.core.applescript import run_applescript
+    from computer_mcp.core.appkit import get_frontmost_app
+
+    def _focus_key() -> Any:
+        """Front app and window, from one Quartz call (AppleScript without pyobjc)."""
+        focused = get_frontmost_app() or get_focused_app()
+        return tuple(sorted((key, str(value)) for key, value in focused.items()))
+
+    def _get_platform_tree() -> dict[str, Any]:
         """Get macOS accessibility tree using AppleScript.
         
         Returns:
@@ -91,15 +111,9 @@ elif IS_DARWIN:
                 return resultText
             end tell
             '''
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=3,
-                check=False
-            )
-            if result.returncode == 0:
-                parts = result.stdout.strip().split("|")
+            output = run_applescript(script, timeout=3)
+            if output is not None:
+                parts = output.split("|")
                 app_name = parts[0] if parts else "Unknown"
                 elements = []
                 if len(parts) > 1 and parts[1]:
@@ -122,7 +136,109 @@ elif IS_DARWIN:
             return {"error": f"macOS accessibility error: {str(e)}"}
 
 elif IS_LINUX:
-    def get_accessibility_tree() -> dict[str, Any]:
+    from computer_mcp.core.x11 import get_active_window_title
+
+    if IS_LINUX_ACCESSIBILITY_MODULES_SUPPORTED:
+        # Version was already pinned by core.platform's availability check
+        from gi.repository import Atspi  # pyright: ignore[reportMissingImports]
+
+        def _focus_key() -> Any:
+            """Active window title (one in-process X request with python-xlib)."""
+            try:
+                return get_active_window_title(timeout=1)
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                return None
+    else:
+        # Without AT-SPI the tree is just the active window title, which
+        # costs the same as a cache check
+        _focus_key = None
+
+    # Every node costs several D-Bus round-trips, so the walk is bounded
+    _MAX_TREE_DEPTH = 8
+    _MAX_CHILDREN_PER_NODE = 50
+    _MAX_TREE_NODES = 1000
+
+    # Role name per role enum, resolved locally instead of over D-Bus
+    _role_names: dict[Any, str] = {}
+
+    def _role_name(obj) -> str:
+        """Get an object's role name, caching the string per role."""
+        role = obj.get_role()
+        name = _role_names.get(role)
+        if name is None:
+            name = _role_names[role] = str(Atspi.role_get_name(role))
+        return name
+
+    def walk_accessibility_tree(root) -> dict[str, Any]:
+        """Build the accessibility tree breadth-first within the size limits.
+        
+        Each node costs four D-Bus reads (name, role, extents, child count)
+        plus one per child. A failed read only loses that field: objects
+        without a Component interface (application roots, some containers)
+        get bounds None, and their children are still walked.
+        
+        Args:
+            root: AT-SPI object to start from (usually the desktop)
+        
+        Returns:
+            Dictionary with the tree, plus "truncated" if a limit was hit
+        """
+        tree: dict[str, Any] = {}
+        queue = deque([(root, 0, tree)])
+        visited = 0
+        truncated = False
+        
+        while queue:
+            obj, depth, node = queue.popleft()
+            visited += 1
+            try:
+                node["name"] = obj.get_name() or ""
+                node["role"] = _role_name(obj)
+            except Exception as e:
+                node["error"] = f"Error processing object: {str(e)}"
+            try:
+                extents = obj.get_extents(Atspi.CoordType.SCREEN)
+                node["bounds"] = {
+                    "x": extents.x,
+                    "y": extents.y,
+                    "width": extents.width,
+                    "height": extents.height
+                }
+            except Exception:
+                node["bounds"] = None
+            try:
+                child_count = obj.get_child_count()
+            except Exception:
+                child_count = 0
+            
+            # Queue children, stopping at the depth, fan-out and node limits
+            children: list[dict[str, Any]] = []
+            node["children"] = children
+            if child_count and depth >= _MAX_TREE_DEPTH:
+                truncated = True
+                continue
+            if child_count > _MAX_CHILDREN_PER_NODE:
+                child_count = _MAX_CHILDREN_PER_NODE
+                truncated = True
+            for i in range(child_count):
+                if visited + len(queue) >= _MAX_TREE_NODES:
+                    truncated = True
+                    break
+                try:
+                    child = obj.get_child_at_index(i)
+                except Exception:
+                    continue
+                if child:
+                    child_node: dict[str, Any] = {}
+                    children.append(child_node)
+                    queue.append((child, depth + 1, child_node))
+        
+        result: dict[str, Any] = {"tree": tree}
+        if truncated:
+            result["truncated"] = True
+        return result
+
+    def _get_platform_tree() -> dict[str, Any]:
         """Get Linux accessibility tree using AT-SPI.
         
         Returns:
@@ -130,74 +246,21 @@ elif IS_LINUX:
         """
         if IS_LINUX_ACCESSIBILITY_MODULES_SUPPORTED:
             try:
-                import gi
-                gi.require_version('Atspi', '2.0')
-                from gi.repository import Atspi
-                
                 # Initialize AT-SPI
                 Atspi.init()
                 
                 desktop = Atspi.get_desktop(0)
-                
-                def _object_to_dict(obj) -> dict[str, Any]:
-                    """Convert AT-SPI object to dictionary."""
-                    try:
-                        name = obj.get_name() if hasattr(obj, 'get_name') else ""
-                        role = str(obj.get_role_name()) if hasattr(obj, 'get_role_name') else ""
-                        
-                        # Get bounds
-                        bounds = None
-                        try:
-                            if hasattr(obj, 'get_extents'):
-                                extents = obj.get_extents(Atspi.CoordType.SCREEN)
-                                bounds = {
-                                    "x": extents.x,
-                                    "y": extents.y,
-                                    "width": extents.width,
-                                    "height": extents.height
-                                }
-                        except:  # noqa: E722
-                            pass
-                        
-                        # Get children
-                        children = []
-                        try:
-                            if hasattr(obj, 'get_child_count') and hasattr(obj, 'get_child_at_index'):
-                                child_count = obj.get_child_count()
-                                for i in range(child_count):
-                                    child = obj.get_child_at_index(i)
-                                    if child:
-                                        children.append(_object_to_dict(child))
-                        except:  # noqa: E722
-                            pass
-                        
-                        return {
-                            "name": name,
-                            "role": role,
-                            "bounds": bounds,
-                            "children": children
-                        }
-                    except Exception as e:
-                        return {"error": f"Error processing object: {str(e)}"}
-                
-                tree = _object_to_dict(desktop)
-                return {"tree": tree}
+                return walk_accessibility_tree(desktop)
             except Exception as e:
                 return {"error": f"Linux AT-SPI error: {str(e)}"}
         else:
-            # Fallback to xdotool for basic window info
+            # Fallback to the active window title for basic window info
             try:
-                result = subprocess.run(
-                    ["xdotool", "getactivewindow", "getwindowname"],
-                    capture_output=True,
-                    text=True,
-                    timeout=1,
-                    check=False
-                )
-                if result.returncode == 0:
+                title = get_active_window_title(timeout=1)
+                if title is not None:
                     return {
                         "tree": {
-                            "name": result.stdout.strip(),
+                            "name": title,
                             "note": "Simplified tree - install python3-gi and gir1.2-atspi-2.0 for full accessibility tree"
                         }
                     }
@@ -206,7 +269,7 @@ elif IS_LINUX:
             return {"error": "python-gi/AT-SPI not installed", "note": "Install python3-gi and gir1.2-atspi-2.0 for Linux accessibility tree support"}
 
 else:
-    def get_accessibility_tree() -> dict[str, Any]:
+    def _get_platform_tree() -> dict[str, Any]:
         """Get accessibility tree (unsupported platform).
         
         Returns:
@@ -215,3 +278,60 @@ else:
         import platform
         return {"error": f"Unsupported platform: {platform.system()}"}
 
+    _focus_key = None
+
+
+# Reuse a built tree while the UI is unchanged: same focused window, no
+# input or window action run since (see core.ui_changes), and younger than
+# the TTL. Platforms whose tree is as cheap as _focus_key set it to None.
+_TREE_CACHE_TTL = 2.0
+_tree_cache: Optional[tuple[tuple, float, dict[str, Any]]] = None
+
+
+def _find_nodes(tree: dict[str, Any], role: Optional[str], name: Optional[str]) -> list[dict[str, Any]]:
+    """Collect subtrees whose role/control type and name match (case-insensitive)."""
+    role = role.lower() if role else None
+    name = name.lower() if name else None
+    matches = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        node_role = str(node.get("role") or node.get("control_type") or "").lower()
+        node_name = str(node.get("name") or "").lower()
+        if (role is None or node_role == role) and (name is None or name in node_name):
+            matches.append(node)
+        stack.extend(reversed(node.get("children") or node.get("elements") or []))
+    return matches
+
+
+def get_accessibility_tree(role: Optional[str] = None, name: Optional[str] = None) -> dict[str, Any]:
+    """Get the accessibility tree of the focused UI.
+    
+    Where building the tree costs many platform round-trips, the result is
+    cached until the focused window changes, an input or window action runs,
+    or _TREE_CACHE_TTL seconds pass. The cached dict is shared; do not modify it.
+    
+    Args:
+        role: Only return nodes with this role (or control type on Windows)
+        name: Only return nodes whose name contains this text
+    
+    Returns:
+        Dictionary with accessibility tree data or error. With role/name,
+        "matches" holds the matching subtrees instead of "tree".
+    """
+    global _tree_cache
+    if _focus_key is None:
+        result = _get_platform_tree()
+    else:
+        key = (ui_generation(), _focus_key())
+        cached = _tree_cache
+        if cached is not None and cached[0] == key and time.monotonic() - cached[1] < _TREE_CACHE_TTL:
+            result = cached[2]
+        else:
+            result = _get_platform_tree()
+            if "error" not in result:
+                _tree_cache = (key, time.monotonic(), result)
+    
+    if (role is None and name is None) or "tree" not in result:
+        return result
+    return {"matches": _find_nodes(result["tree"], role, name)}
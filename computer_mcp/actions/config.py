@@ -14,6 +14,8 @@ def set_config(
     constrain_mouse_to_window: int | str | None = None,
     observe_system_metrics: bool | None = None,
     terminal_output_mode: str | None = None,
+    precise_drag: bool | None = None,
+    screenshot_format: str | None = None,
     config_dict: dict[str, Any] | None = None
 ) -> dict[str, Any]:
     """Update configuration settings.
@@ -28,26 +30,38 @@ def set_config(
         disallowed_hotkeys: List of hotkey strings to disallow (e.g., ["ctrl+c", "alt+f4"])
         constrain_mouse_to_window: Constrain mouse to window bounds (hwnd int, title str, or None to disable)
         observe_system_metrics: Track and include system performance metrics (CPU, memory, disk, network)
+        precise_drag: Spin briefly between drag steps instead of sleeping
+        screenshot_format: Format of observed screenshots and the screenshot tool's default ("png", "jpeg" or "webp")
         config_dict: Optional dictionary to update config from
     
     Returns:
         Dictionary with updated configuration
     """
-    config = {
-        "observe_screen": observe_screen,
-        "observe_mouse_position": observe_mouse_position,
-        "observe_mouse_button_states": observe_mouse_button_states,
-        "observe_keyboard_key_states": observe_keyboard_key_states,
-        "observe_focused_app": observe_focused_app,
-        "observe_accessibility_tree": observe_accessibility_tree,
-        "disallowed_hotkeys": disallowed_hotkeys,
-        "constrain_mouse_to_window": constrain_mouse_to_window,
-        "observe_system_metrics": observe_system_metrics,
-        "terminal_output_mode": terminal_output_mode,
-    }
-    
-    # Remove None values
-    config = {k: v for k, v in config.items() if v is not None}
+    config: dict[str, Any] = {}
+    if observe_screen is not None:
+        config["observe_screen"] = observe_screen
+    if observe_mouse_position is not None:
+        config["observe_mouse_position"] = observe_mouse_position
+    if observe_mouse_button_states is not None:
+        config["observe_mouse_button_states"] = observe_mouse_button_states
+    if observe_keyboard_key_states is not None:
+        config["observe_keyboard_key_states"] = observe_keyboard_key_states
+    if observe_focused_app is not None:
+        config["observe_focused_app"] = observe_focused_app
+    if observe_accessibility_tree is not None:
+        config["observe_accessibility_tree"] = observe_accessibility_tree
+    if disallowed_hotkeys is not None:
+        config["disallowed_hotkeys"] = disallowed_hotkeys
+    if constrain_mouse_to_window is not None:
+        config["constrain_mouse_to_window"] = constrain_mouse_to_window
+    if observe_system_metrics is not None:
+        config["observe_system_metrics"] = observe_system_metrics
+    if terminal_output_mode is not None:
+        config["terminal_output_mode"] = terminal_output_mode
+    if precise_drag is not None:
+        config["precise_drag"] = precise_drag
+    if screenshot_format is not None:
+        config["screenshot_format"] = screenshot_format
     
     # Merge with config_dict if provided
     if config_dict:
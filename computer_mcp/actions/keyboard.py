@@ -1,78 +1,92 @@
 """Keyboard actions."""
 
+from functools import lru_cache
 from typing import Any
 
 from pynput.keyboard import Controller, KeyCode
 
+from computer_mcp.core.fast_type import type_fast
 from computer_mcp.core.platform import IS_DARWIN, IS_LINUX, IS_WINDOWS
+from computer_mcp.core.ui_changes import changes_ui
 from computer_mcp.core.utils import key_from_string
 
 
+@lru_cache(maxsize=1)
+def _default_controller() -> Controller:
+    """Return the shared controller used when none is passed in."""
+    return Controller()
+
+
+@changes_ui
 def type_text(text: str, controller: Controller | None = None) -> dict[str, Any]:
     """Type the specified text.
     
     Args:
         text: Text to type
-        controller: Keyboard controller instance (creates one if None)
+        controller: Keyboard controller instance (uses a shared default if None)
     
     Returns:
         Dictionary with action result
     """
-    if controller is None:
-        controller = Controller()
-    
-    controller.type(text)
+    # Send the whole string in one native call where supported
+    if not type_fast(text):
+        if controller is None:
+            controller = _default_controller()
+        controller.type(text)
     return {"success": True, "action": "type", "text": text}
 
 
+@changes_ui
 def key_down(key: str, controller: Controller | None = None) -> dict[str, Any]:
     """Press and hold a key.
     
     Args:
         key: Key to press (e.g., 'ctrl', 'a', 'space')
-        controller: Keyboard controller instance (creates one if None)
+        controller: Keyboard controller instance (uses a shared default if None)
     
     Returns:
         Dictionary with action result
     """
     if controller is None:
-        controller = Controller()
+        controller = _default_controller()
     
     key_obj = key_from_string(key)
     controller.press(key_obj)
     return {"success": True, "action": "key_down", "key": key}
 
 
+@changes_ui
 def key_up(key: str, controller: Controller | None = None) -> dict[str, Any]:
     """Release a key.
     
     Args:
         key: Key to release (e.g., 'ctrl', 'a', 'space')
-        controller: Keyboard controller instance (creates one if None)
+        controller: Keyboard controller instance (uses a shared default if None)
     
     Returns:
         Dictionary with action result
     """
     if controller is None:
-        controller = Controller()
+        controller = _default_controller()
     
     key_obj = key_from_string(key)
     controller.release(key_obj)
     return {"success": True, "action": "key_up", "key": key}
 
 
+@changes_ui
 def key_press(key: str, controller: Controller | None = None) -> dict[str, Any]:
     """Press and release a key (convenience method).
     
     Args:
         key: Key to press and release (e.g., 'ctrl', 'a', 'space')
-        controller: Keyboard controller instance (creates one if None)
+        controller: Keyboard controller instance (uses a shared default if None)
     
     Returns:
         Dictionary with action result
     """
     if controller is None:
-        controller = Controller()
+        controller = _default_controller()
     
     key_obj = key_from_string(key)
     controller.press(key_obj)
@@ -82,6 +96,7 @@ def key_press(key: str, controller: Controller | None = None) -> dict[str, Any]:
 
 # Window-targeted keyboard functions
 if IS_WINDOWS:
+    @changes_ui
     def type_text_to_window(text: str, hwnd: int) -> dict[str, Any]:
         """Type text to a specific window on Windows."""
         try:
@@ -115,6 +130,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to type to window: {str(e)}"}
     
+    @changes_ui
     def key_down_to_window(key: str, hwnd: int) -> dict[str, Any]:
         """Press a key down to a specific window on Windows."""
         try:
@@ -162,6 +178,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to press key to window: {str(e)}"}
     
+    @changes_ui
     def key_up_to_window(key: str, hwnd: int) -> dict[str, Any]:
         """Release a key to a specific window on Windows."""
         try:
@@ -210,6 +227,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to release key to window: {str(e)}"}
     
+    @changes_ui
     def key_press_to_window(key: str, hwnd: int) -> dict[str, Any]:
         """Press and release a key to a specific window on Windows."""
         result_down = key_down_to_window(key, hwnd)
@@ -221,6 +239,7 @@ if IS_WINDOWS:
         return {"success": True, "action": "key_press", "key": key, "hwnd": hwnd}
 
 elif IS_DARWIN:
+    @changes_ui
     def type_text_to_window(text: str, window_id: int) -> dict[str, Any]:
         """Type text to a specific window on macOS."""
         try:
@@ -258,6 +277,7 @@ elif IS_DARWIN:
         except Exception as e:
             return {"error": f"Failed to type to window: {str(e)}"}
     
+    @changes_ui
     def key_down_to_window(key: str, window_id: int) -> dict[str, Any]:
         """Press a key down to a specific window on macOS."""
         try:
@@ -315,6 +335,7 @@ elif IS_DARWIN:
         except Exception as e:
             return {"error": f"Failed to press key to window: {str(e)}"}
     
+    @changes_ui
     def key_up_to_window(key: str, window_id: int) -> dict[str, Any]:
         """Release a key to a specific window on macOS."""
         try:
@@ -372,6 +393,7 @@ elif IS_DARWIN:
         except Exception as e:
             return {"error": f"Failed to release key to window: {str(e)}"}
     
+    @changes_ui
     def key_press_to_window(key: str, window_id: int) -> dict[str, Any]:
         """Press and release a key to a specific window on macOS."""
         try:
@@ -430,6 +452,7 @@ elif IS_DARWIN:
             return {"error": f"Failed to press key to window: {str(e)}"}
 
 elif IS_LINUX:
+    @changes_ui
     def type_text_to_window(text: str, window_id: int) -> dict[str, Any]:
         """Type text to a specific window on Linux."""
         try:
@@ -457,6 +480,7 @@ elif IS_LINUX:
         except Exception as e:
             return {"error": f"Failed to type to window: {str(e)}"}
     
+    @changes_ui
     def key_down_to_window(key: str, window_id: int) -> dict[str, Any]:
         """Press a key down to a specific window on Linux."""
         try:
@@ -484,6 +508,7 @@ elif IS_LINUX:
         except Exception as e:
             return {"error": f"Failed to press key to window: {str(e)}"}
     
+    @changes_ui
     def key_up_to_window(key: str, window_id: int) -> dict[str, Any]:
         """Release a key to a specific window on Linux."""
         try:
@@ -511,6 +536,7 @@ elif IS_LINUX:
         except Exception as e:
             return {"error": f"Failed to release key to window: {str(e)}"}
     
+    @changes_ui
     def key_press_to_window(key: str, window_id: int) -> dict[str, Any]:
         """Press and release a key to a specific window on Linux."""
         try:
@@ -540,18 +566,22 @@ elif IS_LINUX:
 
 else:
     # Unsupported platform
+    @changes_ui
     def type_text_to_window(text: str, window_id: int) -> dict[str, Any]:
         import platform
         return {"error": f"Window keyboard targeting not supported on {platform.system()}"}
     
+    @changes_ui
     def key_down_to_window(key: str, window_id: int) -> dict[str, Any]:
         import platform
         return {"error": f"Window keyboard targeting not supported on {platform.system()}"}
     
+    @changes_ui
     def key_up_to_window(key: str, window_id: int) -> dict[str, Any]:
         import platform
         return {"error": f"Window keyboard targeting not supported on {platform.system()}"}
     
+    @changes_ui
     def key_press_to_window(key: str, window_id: int) -> dict[str, Any]:
         import platform
         return {"error": f"Window keyboard targeting not supported on {platform.system()}"}
@@ -1,144 +1,218 @@
 """Mouse actions."""
 
+import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import Any
 
-from pynput.mouse import Button, Controller
+from pynput.mouse import Controller
 
-from computer_mcp.core.utils import button_from_string
+from computer_mcp.core.input_sync import wait_for_button, wait_for_position
+from computer_mcp.core.ui_changes import changes_ui
+from computer_mcp.core.utils import button_from_string, precise_sleep
 
+# Pause between drag steps when the OS cannot confirm the previous event
+# landed. Precise mode spins for roughly the input settling time; otherwise
+# fall back to a coarser sleep that yields the CPU.
+_PRECISE_DRAG_DELAY = 0.002
+_DRAG_DELAY = 0.01
 
+# drag_async runs drags here so their polling and pauses stay off the event loop
+_DRAG_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="computer-mcp-drag")
+
+
+@lru_cache(maxsize=1)
+def _default_controller() -> Controller:
+    """Return the shared controller used when none is passed in."""
+    return Controller()
+
+
+@changes_ui
 def click(button: str = "left", controller: Controller | None = None) -> dict[str, Any]:
     """Perform a mouse click.
     
     Args:
         button: Mouse button ("left", "right", "middle")
-        controller: Mouse controller instance (creates one if None)
+        controller: Mouse controller instance (uses a shared default if None)
     
     Returns:
         Dictionary with action result
     """
     if controller is None:
-        controller = Controller()
+        controller = _default_controller()
     
     btn = button_from_string(button)
     controller.click(btn)
     return {"success": True, "action": "click", "button": button}
 
 
+@changes_ui
 def double_click(button: str = "left", controller: Controller | None = None) -> dict[str, Any]:
     """Perform a double mouse click.
     
     Args:
         button: Mouse button ("left", "right", "middle")
-        controller: Mouse controller instance (creates one if None)
+        controller: Mouse controller instance (uses a shared default if None)
     
     Returns:
         Dictionary with action result
     """
     if controller is None:
-        controller = Controller()
+        controller = _default_controller()
     
     btn = button_from_string(button)
     controller.click(btn, 2)
     return {"success": True, "action": "double_click", "button": button}
 
 
+@changes_ui
 def triple_click(button: str = "left", controller: Controller | None = None) -> dict[str, Any]:
     """Perform a triple mouse click.
     
     Args:
         button: Mouse button ("left", "right", "middle")
-        controller: Mouse controller instance (creates one if None)
+        controller: Mouse controller instance (uses a shared default if None)
     
     Returns:
         Dictionary with action result
     """
     if controller is None:
-        controller = Controller()
+        controller = _default_controller()
     
     btn = button_from_string(button)
     controller.click(btn, 3)
     return {"success": True, "action": "triple_click", "button": button}
 
 
+@changes_ui
 def button_down(button: str = "left", controller: Controller | None = None) -> dict[str, Any]:
     """Press and hold a mouse button.
     
     Args:
         button: Mouse button ("left", "right", "middle")
-        controller: Mouse controller instance (creates one if None)
+        controller: Mouse controller instance (uses a shared default if None)
     
     Returns:
         Dictionary with action result
     """
     if controller is None:
-        controller = Controller()
+        controller = _default_controller()
     
     btn = button_from_string(button)
     controller.press(btn)
     return {"success": True, "action": "button_down", "button": button}
 
 
+@changes_ui
 def button_up(button: str = "left", controller: Controller | None = None) -> dict[str, Any]:
     """Release a mouse button.
     
     Args:
         button: Mouse button ("left", "right", "middle")
-        controller: Mouse controller instance (creates one if None)
+        controller: Mouse controller instance (uses a shared default if None)
     
     Returns:
         Dictionary with action result
     """
     if controller is None:
-        controller = Controller()
+        controller = _default_controller()
     
     btn = button_from_string(button)
     controller.release(btn)
     return {"success": True, "action": "button_up", "button": button}
 
 
-def drag(start: dict[str, int], end: dict[str, int], button: str = "left", controller: Controller | None = None) -> dict[str, Any]:
+def _drag_pause(precise: bool) -> None:
+    """Wait between drag steps."""
+    if precise:
+        precise_sleep(_PRECISE_DRAG_DELAY)
+    else:
+        time.sleep(_DRAG_DELAY)
+
+
+@changes_ui
+def drag(
+    start: dict[str, int],
+    end: dict[str, int],
+    button: str = "left",
+    controller: Controller | None = None,
+    precise: bool = True
+) -> dict[str, Any]:
     """Drag mouse from start to end position.
     
     Args:
         start: Start position with "x" and "y" keys
         end: End position with "x" and "y" keys
         button: Mouse button to use ("left", "right", "middle")
-        controller: Mouse controller instance (creates one if None)
+        controller: Mouse controller instance (uses a shared default if None)
+        precise: Spin briefly between steps instead of sleeping (lower latency, uses CPU)
     
     Returns:
         Dictionary with action result
     """
     if controller is None:
-        controller = Controller()
+        controller = _default_controller()
     
     btn = button_from_string(button)
     
+    start_pos = (start["x"], start["y"])
+    end_pos = (end["x"], end["y"])
+    
     # Move to start, press button, move to end, release button
-    controller.position = (start["x"], start["y"])
+    controller.position = start_pos
     controller.press(btn)
-    time.sleep(0.01)  # Small delay
-    controller.position = (end["x"], end["y"])
-    time.sleep(0.01)
+    if not wait_for_button(btn, True):
+        _drag_pause(precise)
+    controller.position = end_pos
+    if not wait_for_position(controller, end_pos):
+        _drag_pause(precise)
     controller.release(btn)
     
     return {"success": True, "action": "drag", "start": start, "end": end, "button": button}
 
 
+async def drag_async(
+    start: dict[str, int],
+    end: dict[str, int],
+    button: str = "left",
+    controller: Controller | None = None,
+    precise: bool = True
+) -> dict[str, Any]:
+    """Drag mouse from start to end position without blocking the event loop.
+    
+    Runs drag() on a dedicated thread: its landing confirmation polls for a
+    few milliseconds per step and precise pauses spin, neither of which may
+    run on the loop. Drags run one at a time, in the order they were requested.
+    
+    Args:
+        start: Start position with "x" and "y" keys
+        end: End position with "x" and "y" keys
+        button: Mouse button to use ("left", "right", "middle")
+        controller: Mouse controller instance (uses a shared default if None)
+        precise: Spin briefly between steps instead of sleeping
+    
+    Returns:
+        Dictionary with action result
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_DRAG_EXECUTOR, partial(drag, start, end, button, controller, precise))
+
+
+@changes_ui
 def move_mouse(x: int, y: int, controller: Controller | None = None) -> dict[str, Any]:
     """Move the mouse cursor to specified coordinates.
     
     Args:
         x: X coordinate
         y: Y coordinate
-        controller: Mouse controller instance (creates one if None)
+        controller: Mouse controller instance (uses a shared default if None)
     
     Returns:
         Dictionary with action result
     """
     if controller is None:
-        controller = Controller()
+        controller = _default_controller()
     
     controller.position = (x, y)
     return {"success": True, "action": "mouse_move", "x": x, "y": y}
@@ -1,15 +1,68 @@
 """Screenshot actions."""
 
-from typing import Any
+from typing import Any, Optional
 
-from computer_mcp.core.screenshot import capture_screenshot
+from computer_mcp.core.screenshot import (
+    capture_screenshot,
+    capture_screenshot_async,
+    capture_screenshot_png,
+)
 
 
-def get_screenshot() -> dict[str, Any]:
+def get_screenshot(
+    force: bool = False,
+    region: Optional[dict[str, int]] = None,
+    image_format: str = "png"
+) -> dict[str, Any]:
     """Capture a screenshot of the display.
     
+    Args:
+        force: Re-encode even if the screen is unchanged since the last capture
+        region: Optional {x, y, width, height} area to capture instead of the full display
+        image_format: "png" (lossless), "jpeg" or "webp" (much smaller payloads)
+    
     Returns:
         Dictionary with screenshot data (format, data, width, height) or error
     """
-    return capture_screenshot()
+    try:
+        return capture_screenshot(force, region, image_format)
+    except ValueError as e:
+        return {"error": str(e)}
+
+
+async def get_screenshot_async(
+    force: bool = False,
+    region: Optional[dict[str, int]] = None,
+    image_format: str = "png"
+) -> dict[str, Any]:
+    """Capture a screenshot in a worker thread without blocking the event loop.
+    
+    While another capture is in flight, the previous frame may be returned
+    instead of waiting (see capture_screenshot_async).
+    
+    Args:
+        force: Always wait for a fresh capture
+        region: Optional {x, y, width, height} area to capture instead of the full display
+        image_format: "png" (lossless), "jpeg" or "webp" (much smaller payloads)
+    
+    Returns:
+        Dictionary with screenshot data (format, data, width, height) or error
+    """
+    try:
+        return await capture_screenshot_async(force, region, image_format)
+    except ValueError as e:
+        return {"error": str(e)}
+
+
+def get_screenshot_png(force: bool = False, region: Optional[dict[str, int]] = None) -> bytes:
+    """Capture a screenshot of the display as raw PNG bytes.
+    
+    Args:
+        force: Re-encode even if the screen is unchanged since the last capture
+        region: Optional {x, y, width, height} area to capture instead of the full display
+    
+    Returns:
+        PNG-encoded image bytes
+    """
+    return capture_screenshot_png(force, region)[0]
 
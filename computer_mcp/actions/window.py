@@ -1,6 +1,7 @@
 """Window management actions."""
 
 from computer_mcp.core.platform import IS_DARWIN, IS_LINUX, IS_WINDOWS
+from computer_mcp.core.ui_changes import changes_ui
 
 import subprocess
 from typing import Any
@@ -11,6 +12,9 @@ if IS_WINDOWS:
     import ctypes
     from ctypes import wintypes
 
+    from computer_mcp.core.screenshot import capture_screen_rect
+    from computer_mcp.core.win_process import get_process_name
+
     # DWM constants
     DWMWA_EXTENDED_FRAME_BOUNDS = 9
     _dwmapi = ctypes.windll.dwmapi
@@ -51,8 +55,7 @@ if IS_WINDOWS:
             
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
             try:
-                proc = psutil.Process(pid)
-                process_name = proc.name()
+                process_name = get_process_name(pid)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 process_name = "Unknown"
             
@@ -244,6 +247,7 @@ if IS_WINDOWS:
         
         return {"success": True, "action": "list_windows", "windows": windows, "count": len(windows)}
 
+    @changes_ui
     def switch_to_window(hwnd: int | None = None, title: str | None = None) -> dict[str, Any]:
         """Switch focus to a window by handle or title pattern."""
         try:
@@ -269,6 +273,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to switch to window: {str(e)}"}
 
+    @changes_ui
     def move_window(hwnd: int, x: int, y: int, width: int | None = None, height: int | None = None) -> dict[str, Any]:
         """Move and/or resize a window."""
         try:
@@ -294,6 +299,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to move window: {str(e)}"}
 
+    @changes_ui
     def resize_window(hwnd: int, width: int, height: int) -> dict[str, Any]:
         """Resize a window."""
         try:
@@ -318,6 +324,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to resize window: {str(e)}"}
 
+    @changes_ui
     def minimize_window(hwnd: int) -> dict[str, Any]:
         """Minimize a window."""
         try:
@@ -333,6 +340,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to minimize window: {str(e)}"}
 
+    @changes_ui
     def maximize_window(hwnd: int) -> dict[str, Any]:
         """Maximize a window."""
         try:
@@ -348,6 +356,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to maximize window: {str(e)}"}
 
+    @changes_ui
     def restore_window(hwnd: int) -> dict[str, Any]:
         """Restore a minimized or maximized window."""
         try:
@@ -363,6 +372,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to restore window: {str(e)}"}
 
+    @changes_ui
     def set_window_topmost(hwnd: int, topmost: bool = True) -> dict[str, Any]:
         """Set or remove a window's always-on-top property."""
         try:
@@ -394,6 +404,7 @@ if IS_WINDOWS:
         
         return {"success": True, "action": "get_window_info", "window": window_data}
 
+    @changes_ui
     def close_window(hwnd: int) -> dict[str, Any]:
         """Close a window."""
         try:
@@ -408,6 +419,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to close window: {str(e)}"}
 
+    @changes_ui
     def snap_window_left(hwnd: int) -> dict[str, Any]:
         """Snap window to fill left half of screen."""
         try:
@@ -435,6 +447,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to snap window left: {str(e)}"}
 
+    @changes_ui
     def snap_window_right(hwnd: int) -> dict[str, Any]:
         """Snap window to fill right half of screen."""
         try:
@@ -462,6 +475,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to snap window right: {str(e)}"}
 
+    @changes_ui
     def snap_window_top(hwnd: int) -> dict[str, Any]:
         """Snap window to fill top half of screen."""
         try:
@@ -489,6 +503,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to snap window top: {str(e)}"}
 
+    @changes_ui
     def snap_window_bottom(hwnd: int) -> dict[str, Any]:
         """Snap window to fill bottom half of screen."""
         try:
@@ -520,12 +535,7 @@ if IS_WINDOWS:
         """Capture screenshot of a specific window."""
         try:
             import win32gui
-            import win32ui
             import win32con
-            import win32api
-            from PIL import Image
-            import base64
-            from io import BytesIO
         except ImportError:
             return {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window screenshot support"}
         
@@ -557,83 +567,17 @@ if IS_WINDOWS:
             client_height = client_rect[3] - client_rect[1]
             
             # Get client area coordinates in screen space (for screen capture)
-            client_point_left_top = win32gui.ClientToScreen(hwnd, (0, 0))
-            client_point_right_bottom = win32gui.ClientToScreen(hwnd, (client_width, client_height))
-            
-            client_screen_x = client_point_left_top[0]
-            client_screen_y = client_point_left_top[1]
-            
-            # Create a memory DC compatible with the screen
-            screen_dc = win32gui.GetDC(0)
-            mem_dc = win32ui.CreateDCFromHandle(screen_dc)
-            save_dc = mem_dc.CreateCompatibleDC()
-            
-            # Create bitmap for the exact client area size
-            bitmap = win32ui.CreateBitmap()
-            bitmap.CreateCompatibleBitmap(mem_dc, client_width, client_height)
-            save_dc.SelectObject(bitmap)
-            
-            # Capture from screen at the window's client area coordinates
-            # This directly captures the screen region where the window's client area is
-            save_dc.BitBlt(
-                (0, 0),
-                (client_width, client_height),
-                mem_dc,
-                (client_screen_x, client_screen_y),
-                win32con.SRCCOPY
-            )
-            
-            # Convert bitmap to PIL Image
-            bmp_info = bitmap.GetInfo()
-            bmp_str = bitmap.GetBitmapBits(True)
-            
-            # Get actual bitmap dimensions
-            bmp_width = bmp_info["bmWidth"]
-            bmp_height = bmp_info["bmHeight"]
-            
-            # Create image from bitmap data
-            img = Image.frombuffer(
-                "RGB",
-                (bmp_width, bmp_height),
-                bmp_str,
-                "raw",
-                "BGRX",
-                0,
-                1
-            )
-            
-            # The bitmap should already be exactly client_width x client_height since we
-            # created it with those dimensions and BitBlt'd the exact region
-            # Just verify and fix if needed
-            if img.size != (client_width, client_height):
-                if img.size[0] >= client_width and img.size[1] >= client_height:
-                    img = img.crop((0, 0, client_width, client_height))
-                else:
-                    img = img.resize((client_width, client_height), Image.Resampling.LANCZOS)
-            
-            actual_width = client_width
-            actual_height = client_height
-            
-            # Cleanup
-            win32gui.DeleteObject(bitmap.GetHandle())
-            save_dc.DeleteDC()
-            mem_dc.DeleteDC()
-            win32gui.ReleaseDC(0, screen_dc)
+            client_screen_x, client_screen_y = win32gui.ClientToScreen(hwnd, (0, 0))
             
-            # Convert to base64
-            buffer = BytesIO()
-            img.save(buffer, format="PNG")
-            img_bytes = buffer.getvalue()
-            img_base64 = base64.b64encode(img_bytes).decode("utf-8")
+            # Grab the client area with the shared mss grabber instead of
+            # creating and tearing down DCs and a bitmap on every call
+            screenshot_data = capture_screen_rect(client_screen_x, client_screen_y, client_width, client_height)
             
             return {
                 "success": True,
                 "action": "screenshot_window",
                 "hwnd": hwnd,
-                "format": "base64_png",
-                "data": img_base64,
-                "width": actual_width,
-                "height": actual_height
+                **screenshot_data
             }
         except Exception as e:
             return {"error": f"Failed to screenshot window: {str(e)}"}
@@ -682,6 +626,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to list virtual desktops: {str(e)}"}
 
+    @changes_ui
     def switch_virtual_desktop(desktop_id: int | None = None, name: str | None = None) -> dict[str, Any]:
         """Switch to a virtual desktop by ID or name."""
         try:
@@ -724,6 +669,7 @@ if IS_WINDOWS:
         except Exception as e:
             return {"error": f"Failed to switch virtual desktop: {str(e)}"}
 
+    @changes_ui
     def move_window_to_virtual_desktop(hwnd: int, desktop_id: int) -> dict[str, Any]:
         """Move a window to a different virtual desktop."""
         try:
@@ -774,30 +720,37 @@ elif IS_DARWIN:
         """List all visible windows (macOS - not yet implemented)."""
         return {"error": "Window management not yet implemented for macOS"}
     
+    @changes_ui
     def switch_to_window(hwnd: int | None = None, title: str | None = None) -> dict[str, Any]:
         """Switch focus to a window (macOS - not yet implemented)."""
         return {"error": "Window management not yet implemented for macOS"}
     
+    @changes_ui
     def move_window(hwnd: int, x: int, y: int, width: int | None = None, height: int | None = None) -> dict[str, Any]:
         """Move and/or resize a window (macOS - not yet implemented)."""
         return {"error": "Window management not yet implemented for macOS"}
     
+    @changes_ui
     def resize_window(hwnd: int, width: int, height: int) -> dict[str, Any]:
         """Resize a window (macOS - not yet implemented)."""
         return {"error": "Window management not yet implemented for macOS"}
     
+    @changes_ui
     def minimize_window(hwnd: int) -> dict[str, Any]:
         """Minimize a window (macOS - not yet implemented)."""
         return {"error": "Window management not yet implemented for macOS"}
     
+    @changes_ui
     def maximize_window(hwnd: int) -> dict[str, Any]:
         """Maximize a window (macOS - not yet implemented)."""
         return {"error": "Window management not yet implemented for macOS"}
     
+    @changes_ui
     def restore_window(hwnd: int) -> dict[str, Any]:
         """Restore a window (macOS - not yet implemented)."""
         return {"error": "Window management not yet implemented for macOS"}
     
+    @changes_ui
     def set_window_topmost(hwnd: int, topmost: bool = True) -> dict[str, Any]:
         """Set window topmost (macOS - not yet implemented)."""
         return {"error": "Window management not yet implemented for macOS"}
@@ -806,6 +759,7 @@ elif IS_DARWIN:
         """Get window info (macOS - not yet implemented)."""
         return {"error": "Window management not yet implemented for macOS"}
     
+    @changes_ui
     def close_window(hwnd: int) -> dict[str, Any]:
         """Close a window."""
         window_id = hwnd
@@ -838,6 +792,7 @@ elif IS_DARWIN:
         except Exception as e:
             return {"error": f"Failed to close window: {str(e)}"}
     
+    @changes_ui
     def snap_window_left(hwnd: int) -> dict[str, Any]:
         """Snap window to fill left half of screen."""
         window_id = hwnd
@@ -861,6 +816,7 @@ elif IS_DARWIN:
         except Exception as e:
             return {"error": f"Failed to snap window left: {str(e)}"}
     
+    @changes_ui
     def snap_window_right(hwnd: int) -> dict[str, Any]:
         """Snap window to fill right half of screen."""
         window_id = hwnd
@@ -884,6 +840,7 @@ elif IS_DARWIN:
         except Exception as e:
             return {"error": f"Failed to snap window right: {str(e)}"}
     
+    @changes_ui
     def snap_window_top(hwnd: int) -> dict[str, Any]:
         """Snap window to fill top half of screen."""
         window_id = hwnd
@@ -907,6 +864,7 @@ elif IS_DARWIN:
         except Exception as e:
             return {"error": f"Failed to snap window top: {str(e)}"}
     
+    @changes_ui
     def snap_window_bottom(hwnd: int) -> dict[str, Any]:
         """Snap window to fill bottom half of screen."""
         window_id = hwnd
@@ -1032,6 +990,7 @@ elif IS_DARWIN:
             "note": "macOS Spaces enumeration is limited via AppleScript. Multiple Spaces may exist but are not easily enumerated."
         }
     
+    @changes_ui
     def switch_virtual_desktop(desktop_id: int | None = None, name: str | None = None) -> dict[str, Any]:
         """Switch to a virtual desktop (macOS Spaces - limited)."""
         return {
@@ -1041,6 +1000,7 @@ elif IS_DARWIN:
             "note": "macOS Spaces switching via script is limited. Use Control+Left/Right manually or Mission Control API."
         }
     
+    @changes_ui
     def move_window_to_virtual_desktop(hwnd: int, desktop_id: int) -> dict[str, Any]:
         """Move a window to a different virtual desktop (macOS Spaces - limited)."""
         return {
@@ -1057,30 +1017,37 @@ elif IS_LINUX:
         """List all visible windows (Linux - not yet implemented)."""
         return {"error": "Window management not yet implemented for Linux"}
     
+    @changes_ui
     def switch_to_window(hwnd: int | None = None, title: str | None = None) -> dict[str, Any]:
         """Switch focus to a window (Linux - not yet implemented)."""
         return {"error": "Window management not yet implemented for Linux"}
     
+    @changes_ui
     def move_window(hwnd: int, x: int, y: int, width: int | None = None, height: int | None = None) -> dict[str, Any]:
         """Move and/or resize a window (Linux - not yet implemented)."""
         return {"error": "Window management not yet implemented for Linux"}
     
+    @changes_ui
     def resize_window(hwnd: int, width: int, height: int) -> dict[str, Any]:
         """Resize a window (Linux - not yet implemented)."""
         return {"error": "Window management not yet implemented for Linux"}
     
+    @changes_ui
     def minimize_window(hwnd: int) -> dict[str, Any]:
         """Minimize a window (Linux - not yet implemented)."""
         return {"error": "Window management not yet implemented for Linux"}
     
+    @changes_ui
     def maximize_window(hwnd: int) -> dict[str, Any]:
         """Maximize a window (Linux - not yet implemented)."""
         return {"error": "Window management not yet implemented for Linux"}
     
+    @changes_ui
     def restore_window(hwnd: int) -> dict[str, Any]:
         """Restore a window (Linux - not yet implemented)."""
         return {"error": "Window management not yet implemented for Linux"}
     
+    @changes_ui
     def set_window_topmost(hwnd: int, topmost: bool = True) -> dict[str, Any]:
         """Set window topmost (Linux - not yet implemented)."""
         return {"error": "Window management not yet implemented for Linux"}
@@ -1106,6 +1073,7 @@ elif IS_LINUX:
         except Exception as e:
             return {"error": f"Failed to get window info: {str(e)}"}
     
+    @changes_ui
     def close_window(hwnd: int) -> dict[str, Any]:
         """Close a window."""
         window_id = hwnd
@@ -1117,6 +1085,7 @@ elif IS_LINUX:
         except Exception as e:
             return {"error": f"Failed to close window: {str(e)}"}
     
+    @changes_ui
     def snap_window_left(hwnd: int) -> dict[str, Any]:
         """Snap window to fill left half of screen."""
         window_id = hwnd
@@ -1144,6 +1113,7 @@ elif IS_LINUX:
         except Exception as e:
             return {"error": f"Failed to snap window left: {str(e)}"}
     
+    @changes_ui
     def snap_window_right(hwnd: int) -> dict[str, Any]:
         """Snap window to fill right half of screen."""
         window_id = hwnd
@@ -1172,6 +1142,7 @@ elif IS_LINUX:
         except Exception as e:
             return {"error": f"Failed to snap window right: {str(e)}"}
     
+    @changes_ui
     def snap_window_top(hwnd: int) -> dict[str, Any]:
         """Snap window to fill top half of screen."""
         window_id = hwnd
@@ -1199,6 +1170,7 @@ elif IS_LINUX:
         except Exception as e:
             return {"error": f"Failed to snap window top: {str(e)}"}
     
+    @changes_ui
     def snap_window_bottom(hwnd: int) -> dict[str, Any]:
         """Snap window to fill bottom half of screen."""
         window_id = hwnd
@@ -1343,6 +1315,7 @@ elif IS_LINUX:
         except Exception as e:
             return {"error": f"Failed to list virtual desktops: {str(e)}"}
     
+    @changes_ui
     def switch_virtual_desktop(desktop_id: int | None = None, name: str | None = None) -> dict[str, Any]:
         """Switch to a virtual desktop (Linux workspaces)."""
         if desktop_id is None and name is None:
@@ -1379,6 +1352,7 @@ elif IS_LINUX:
         except Exception as e:
             return {"error": f"Failed to switch virtual desktop: {str(e)}"}
     
+    @changes_ui
     def move_window_to_virtual_desktop(hwnd: int, desktop_id: int) -> dict[str, Any]:
         """Move a window to a different virtual desktop (Linux workspaces)."""
         window_id = hwnd
@@ -1405,42 +1379,54 @@ else:
     def list_windows() -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def switch_to_window(hwnd: int | None = None, title: str | None = None) -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def move_window(hwnd: int, x: int, y: int, width: int | None = None, height: int | None = None) -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def resize_window(hwnd: int, width: int, height: int) -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def minimize_window(hwnd: int) -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def maximize_window(hwnd: int) -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def restore_window(hwnd: int) -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def set_window_topmost(hwnd: int, topmost: bool = True) -> dict[str, Any]:
         return {"error": _platform_error}
     
     def get_window_info(hwnd: int) -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def close_window(hwnd: int) -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def snap_window_left(hwnd: int) -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def snap_window_right(hwnd: int) -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def snap_window_top(hwnd: int) -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def snap_window_bottom(hwnd: int) -> dict[str, Any]:
         return {"error": _platform_error}
     
@@ -1450,9 +1436,11 @@ else:
     def list_virtual_desktops() -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def switch_virtual_desktop(desktop_id: int | None = None, name: str | None = None) -> dict[str, Any]:
         return {"error": _platform_error}
     
+    @changes_ui
     def move_window_to_virtual_desktop(hwnd: int, desktop_id: int) -> dict[str, Any]:
         return {"error": _platform_error}
 
@@ -1,6 +1,5 @@
 """HTTP REST API server for computer control."""
 
-import base64
 from typing import Any, Optional
 
 from fastapi import FastAPI, HTTPException
@@ -141,7 +140,7 @@ async def mouse_button_up(request: ClickRequest) -> dict[str, Any]:
 @app.post("/mouse/drag")
 async def mouse_drag(request: DragRequest) -> dict[str, Any]:
     """Drag mouse from start to end position."""
-    result = mouse_actions.drag(
+    result = await mouse_actions.drag_async(
         start=request.start,
         end=request.end,
         button=request.button,
@@ -194,21 +193,18 @@ async def keyboard_key_press(request: KeyRequest) -> dict[str, Any]:
 @app.get("/screenshot")
 async def get_screenshot() -> dict[str, Any]:
     """Capture a screenshot of the display."""
-    result = screenshot_actions.get_screenshot()
+    result = await screenshot_actions.get_screenshot_async()
     return result
 
 
 @app.get("/screenshot/image")
 async def get_screenshot_image():
     """Get screenshot as PNG image."""
-    result = screenshot_actions.get_screenshot()
-    if "error" in result:
-        raise HTTPException(status_code=500, detail=result["error"])
+    try:
+        image_data = screenshot_actions.get_screenshot_png()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
     
-    if "data" not in result:
-        raise HTTPException(status_code=500, detail="No screenshot data available")
-    
-    image_data = base64.b64decode(result["data"])
     from fastapi.responses import Response
     return Response(content=image_data, media_type="image/png")
 
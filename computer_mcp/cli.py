@@ -1,7 +1,6 @@
 """CLI implementation for computer control commands and server management."""
 
 import argparse
-import asyncio
 import json
 import sys
 from typing import Any
@@ -12,6 +11,7 @@ from computer_mcp.actions import (
     screenshot as screenshot_actions,
     window as window_actions,
 )
+from computer_mcp.core import event_loop
 from pynput.keyboard import Controller as KeyboardController
 from pynput.mouse import Controller as MouseController
 
@@ -270,7 +270,7 @@ def main():
         elif args.mode == "screenshot":
             handle_screenshot_command(args)
         elif args.mode == "serve":
-            asyncio.run(handle_serve_command(args))
+            event_loop.run(handle_serve_command(args))
         else:
             parser.print_help()
             sys.exit(1)
@@ -0,0 +1,49 @@
+"""Frontmost application queries on macOS.
+
+With pyobjc installed, the frontmost app and its front window title come from
+the Quartz window list, in-process and without AppleScript. The list is read
+fresh on every call; NSWorkspace's frontmostApplication is not used because
+it only updates while a Cocoa run loop is running, which this process never
+does. Window titles from Quartz need the Screen Recording permission; callers
+fall back to AppleScript when no title is available.
+"""
+
+from typing import Any
+
+from computer_mcp.core.platform import IS_DARWIN
+
+__all__ = ["get_frontmost_app"]
+
+HAS_QUARTZ = False
+if IS_DARWIN:
+    try:
+        import Quartz  # pyright: ignore[reportMissingImports]
+        HAS_QUARTZ = True
+    except ImportError:
+        pass
+
+
+def get_frontmost_app() -> dict[str, Any] | None:
+    """Return the frontmost application's name, pid and front window title.
+
+    The frontmost app is the owner of the first normal-layer (layer 0) window
+    in the on-screen list, which is ordered front to back.
+
+    Returns:
+        Dictionary with name, pid and title (possibly ""), or None without
+        pyobjc or if no normal window is on screen
+    """
+    if not HAS_QUARTZ:
+        return None
+    windows = Quartz.CGWindowListCopyWindowInfo(
+        Quartz.kCGWindowListOptionOnScreenOnly | Quartz.kCGWindowListExcludeDesktopElements,
+        Quartz.kCGNullWindowID
+    )
+    for window in windows or ():
+        if window.get(Quartz.kCGWindowLayer) == 0:
+            return {
+                "name": str(window.get(Quartz.kCGWindowOwnerName) or ""),
+                "pid": int(window.get(Quartz.kCGWindowOwnerPID)),
+                "title": window.get(Quartz.kCGWindowName) or ""
+            }
+    return None
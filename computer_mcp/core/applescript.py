@@ -0,0 +1,36 @@
+"""AppleScript execution on macOS.
+
+Scripts run through osascript with a timeout. NSAppleScript would avoid the
+process start, but it has to run on the main thread and cannot be abandoned:
+a hung System Events or a pending Accessibility permission prompt would then
+freeze the event loop with no bound. An osascript child can always be killed.
+"""
+
+import subprocess
+
+__all__ = ["run_applescript"]
+
+
+def run_applescript(script: str, timeout: float) -> str | None:
+    """Run an AppleScript and return its result as text.
+    
+    Args:
+        script: AppleScript source
+        timeout: Seconds to wait for osascript
+    
+    Returns:
+        The script's result with surrounding whitespace stripped, or None if it failed
+    
+    Raises:
+        subprocess.TimeoutExpired: If osascript times out
+    """
+    result = subprocess.run(
+        ["osascript", "-e", script],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        check=False
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
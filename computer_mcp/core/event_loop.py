@@ -0,0 +1,40 @@
+"""Event loop selection for the server entry points.
+
+When uvloop (or winloop on Windows) is installed it replaces the stdlib
+asyncio loop. Both are built on libuv, with batched I/O and a faster Task
+implementation, which cuts the per-request overhead of the stdio and HTTP
+transports. Without them the default asyncio loop is used.
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+from computer_mcp.core.platform import IS_WINDOWS
+
+__all__ = ["HAS_FAST_LOOP", "run"]
+
+try:
+    if IS_WINDOWS:
+        import winloop as _fast_loop  # pyright: ignore[reportMissingImports]
+    else:
+        import uvloop as _fast_loop  # pyright: ignore[reportMissingImports]
+    HAS_FAST_LOOP = True
+except ImportError:
+    HAS_FAST_LOOP = False
+
+_T = TypeVar("_T")
+
+
+def run(main: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion, like asyncio.run.
+    
+    Args:
+        main: Coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    if not HAS_FAST_LOOP:
+        return asyncio.run(main)
+    with asyncio.Runner(loop_factory=_fast_loop.new_event_loop) as runner:
+        return runner.run(main)
@@ -0,0 +1,194 @@
+"""Bulk text injection.
+
+pynput types text one character at a time, issuing a separate press and
+release per character. On Windows the whole string is sent with a single
+SendInput call instead. On Linux with python-xlib, XTest events for the
+whole string are queued on one connection and flushed with a single sync,
+rather than a round-trip per key. Elsewhere type_fast() returns False and
+callers fall back to the pynput controller.
+"""
+
+from computer_mcp.core.platform import IS_LINUX, IS_WINDOWS
+
+__all__ = ["type_fast"]
+
+
+if IS_WINDOWS:
+    import ctypes
+    from ctypes import wintypes
+
+    _INPUT_KEYBOARD = 1
+    _KEYEVENTF_KEYUP = 0x0002
+    _KEYEVENTF_UNICODE = 0x0004
+
+    # Control characters pynput types as real keys rather than Unicode input
+    _CONTROL_VKS = {"\n": 0x0D, "\r": 0x0D, "\t": 0x09}
+
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _INPUTUNION(ctypes.Union):
+        # MOUSEINPUT is the largest member and sets the size SendInput expects
+        _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT)]
+
+    class _INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    _SendInput = ctypes.windll.user32.SendInput
+    _SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int)
+    _SendInput.restype = wintypes.UINT
+
+    def _key_events(text: str) -> list[tuple[int, int, int]]:
+        """Build (virtual key, scan code, flags) press/release pairs for text."""
+        events = []
+        for char in text:
+            vk = _CONTROL_VKS.get(char)
+            if vk is not None:
+                events.append((vk, 0, 0))
+                events.append((vk, 0, _KEYEVENTF_KEYUP))
+                continue
+            # Characters outside the BMP are sent as two UTF-16 code units
+            data = char.encode("utf-16-le")
+            for i in range(0, len(data), 2):
+                unit = data[i] | (data[i + 1] << 8)
+                events.append((0, unit, _KEYEVENTF_UNICODE))
+                events.append((0, unit, _KEYEVENTF_UNICODE | _KEYEVENTF_KEYUP))
+        return events
+
+    def type_fast(text: str) -> bool:
+        """Type text with one SendInput call.
+        
+        Args:
+            text: Text to type
+        
+        Returns:
+            True if the text was injected, False if the caller should fall back
+        """
+        events = _key_events(text)
+        if not events:
+            return True
+        
+        inputs = (_INPUT * len(events))()
+        for inp, (vk, scan, flags) in zip(inputs, events):
+            inp.type = _INPUT_KEYBOARD
+            inp.u.ki.wVk = vk
+            inp.u.ki.wScan = scan
+            inp.u.ki.dwFlags = flags
+        
+        sent = _SendInput(len(events), inputs, ctypes.sizeof(_INPUT))
+        if sent == 0:
+            # Nothing went through (e.g. blocked by UIPI); let pynput try
+            return False
+        if sent != len(events):
+            raise ctypes.WinError()
+        return True
+
+elif IS_LINUX:
+    from computer_mcp.core import x11
+
+    if x11.HAS_XLIB:
+        from Xlib import X, XK  # pyright: ignore[reportMissingImports]
+        from Xlib.ext import xtest  # pyright: ignore[reportMissingImports]
+
+    # Control characters typed as real keys
+    _CONTROL_KEYSYMS = {"\n": 0xFF0D, "\r": 0xFF0D, "\t": 0xFF09}  # Return, Tab
+    # Shift and Lock bits, and the XKB group bits (0 for the first group), of
+    # the core X modifier state
+    _SHIFT_LOCK_MASK = 0x3
+    _GROUP_MASK = 0x6000
+    # Mode_switch and ISO_Level3_Shift select other groups/levels of a key
+    _LEVEL_SWITCH_KEYSYMS = (0xFF7E, 0xFE03)
+
+    def _char_keysym(char: str) -> int:
+        """Keysym for a character: Latin-1 maps directly, other Unicode is offset."""
+        keysym = _CONTROL_KEYSYMS.get(char)
+        if keysym is not None:
+            return keysym
+        code = ord(char)
+        if 0x20 <= code <= 0x7E or 0xA0 <= code <= 0xFF:
+            return code
+        return 0x01000000 | code
+
+    def _level_switch_mask(display) -> int:
+        """Modifier bits bound to Mode_switch or ISO_Level3_Shift."""
+        keycodes = {
+            keycode
+            for keysym in _LEVEL_SWITCH_KEYSYMS
+            for keycode, _index in display.keysym_to_keycodes(keysym)
+        }
+        mask = 0
+        for bit, modifier_keycodes in enumerate(display.get_modifier_mapping()):
+            if keycodes.intersection(modifier_keycodes):
+                mask |= 1 << bit
+        return mask
+
+    def _keystrokes(display, text: str) -> list[tuple[int, bool]] | None:
+        """(keycode, needs shift) per character, or None if a character has no key."""
+        strokes = []
+        for char in text:
+            for keycode, index in display.keysym_to_keycodes(_char_keysym(char)):
+                # Index 0/1 are the unshifted/shifted levels of the first group
+                if index in (0, 1):
+                    strokes.append((keycode, index == 1))
+                    break
+            else:
+                return None
+        return strokes
+
+    def type_fast(text: str) -> bool:
+        """Type text with XTest, flushing all key events at once.
+        
+        Falls back (returns False) when python-xlib is missing, a character
+        is not on the current keyboard map, or the keys would not produce the
+        first group's unshifted/shifted levels: Shift or Caps Lock is active,
+        another keyboard group (layout) is selected, or Mode_switch/AltGr is
+        held.
+        
+        Args:
+            text: Text to type
+        
+        Returns:
+            True if the text was injected, False if the caller should fall back
+        """
+        # Also opens the shared connection; None means no Xlib or no display
+        mask = x11.get_pointer_state_mask()
+        if mask is None or mask & (_SHIFT_LOCK_MASK | _GROUP_MASK):
+            return False
+        with x11.locked_display() as display:
+            if mask & _level_switch_mask(display):
+                return False
+            strokes = _keystrokes(display, text)
+            if strokes is None:
+                return False
+            shift = display.keysym_to_keycode(XK.XK_Shift_L)
+            # fake_input only queues requests; sync sends them in one flush
+            for keycode, shifted in strokes:
+                if shifted:
+                    xtest.fake_input(display, X.KeyPress, shift)
+                xtest.fake_input(display, X.KeyPress, keycode)
+                xtest.fake_input(display, X.KeyRelease, keycode)
+                if shifted:
+                    xtest.fake_input(display, X.KeyRelease, shift)
+            display.sync()
+        return True
+
+else:
+    def type_fast(text: str) -> bool:  # noqa: ARG001
+        """Bulk injection is only implemented on Windows and X11; always returns False."""
+        return False
@@ -0,0 +1,131 @@
+"""Confirming that injected mouse input has reached the OS.
+
+Drags pause after pressing the button and after moving, so the OS has
+processed each event before the next one. wait_for_button() and
+wait_for_position() poll the system's own view of the pointer instead and
+return as soon as the event has landed, bounded by a short timeout. When
+the state cannot be read on this platform they return False at once and
+callers keep their fixed pause.
+"""
+
+import time
+from typing import Callable, Optional
+
+from pynput.mouse import Button, Controller
+
+from computer_mcp.core.platform import IS_DARWIN, IS_LINUX, IS_WINDOWS
+
+__all__ = ["INPUT_SETTLE_TIMEOUT", "wait_for_button", "wait_for_position"]
+
+# Longest to poll for an event to land before falling back to a fixed pause
+INPUT_SETTLE_TIMEOUT = 0.005
+
+
+if IS_WINDOWS:
+    import ctypes
+
+    _GetAsyncKeyState = ctypes.windll.user32.GetAsyncKeyState
+    _BUTTON_VKS = {Button.left: 0x01, Button.right: 0x02, Button.middle: 0x04}
+
+    def _button_down(button: Button) -> Optional[bool]:
+        """Whether the system input state has button held, or None if unknown."""
+        vk = _BUTTON_VKS.get(button)
+        if vk is None:
+            return None
+        return bool(_GetAsyncKeyState(vk) & 0x8000)
+
+elif IS_DARWIN:
+    try:
+        import Quartz  # pyright: ignore[reportMissingImports]
+
+        _BUTTON_NUMBERS = {
+            Button.left: Quartz.kCGMouseButtonLeft,
+            Button.right: Quartz.kCGMouseButtonRight,
+            Button.middle: Quartz.kCGMouseButtonCenter,
+        }
+
+        def _button_down(button: Button) -> Optional[bool]:
+            """Whether the session event state has button held, or None if unknown."""
+            number = _BUTTON_NUMBERS.get(button)
+            if number is None:
+                return None
+            return bool(Quartz.CGEventSourceButtonState(Quartz.kCGEventSourceStateCombinedSessionState, number))
+    except ImportError:
+        def _button_down(button: Button) -> Optional[bool]:  # noqa: ARG001
+            """Button state is unavailable without Quartz."""
+            return None
+
+elif IS_LINUX:
+    from computer_mcp.core.x11 import get_pointer_state_mask
+
+    # X11 Button1Mask..Button3Mask: left, middle, right
+    _BUTTON_MASKS = {Button.left: 1 << 8, Button.middle: 1 << 9, Button.right: 1 << 10}
+
+    def _button_down(button: Button) -> Optional[bool]:
+        """Whether the X server has button held, or None if unknown."""
+        bit = _BUTTON_MASKS.get(button)
+        if bit is None:
+            return None
+        mask = get_pointer_state_mask()
+        if mask is None:
+            return None
+        return bool(mask & bit)
+
+else:
+    def _button_down(button: Button) -> Optional[bool]:  # noqa: ARG001
+        """Button state is unavailable on this platform."""
+        return None
+
+
+def _wait_until(condition: Callable[[], Optional[bool]], timeout: float) -> bool:
+    """Spin until condition() is True; False on timeout or if it returns None."""
+    end = time.perf_counter_ns() + int(timeout * 1_000_000_000)
+    while True:
+        state = condition()
+        if state is None:
+            return False
+        if state:
+            return True
+        if time.perf_counter_ns() >= end:
+            return False
+
+
+def wait_for_button(button: Button, pressed: bool, timeout: float = INPUT_SETTLE_TIMEOUT) -> bool:
+    """Wait until the OS reports button as pressed (or released).
+
+    Args:
+        button: pynput mouse button
+        pressed: State to wait for
+        timeout: Longest time to poll, in seconds
+
+    Returns:
+        True once the state is observed, False on timeout or if the platform
+        cannot report button state
+    """
+    def landed() -> Optional[bool]:
+        down = _button_down(button)
+        return None if down is None else down == pressed
+
+    return _wait_until(landed, timeout)
+
+
+def wait_for_position(
+    controller: Controller,
+    position: tuple[int, int],
+    timeout: float = INPUT_SETTLE_TIMEOUT
+) -> bool:
+    """Wait until the OS reports the cursor at position.
+
+    Args:
+        controller: pynput mouse controller (its position reads the OS cursor)
+        position: Expected (x, y)
+        timeout: Longest time to poll, in seconds
+
+    Returns:
+        True once the cursor is observed there, False on timeout
+    """
+    def landed() -> bool:
+        x, y = controller.position
+        return (int(x), int(y)) == position
+
+    return _wait_until(landed, timeout)
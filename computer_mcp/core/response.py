@@ -10,55 +10,123 @@ from computer_mcp.core.utils import screenshot_to_image_content
 if TYPE_CHECKING:
     from computer_mcp.core.state import ComputerState
 
+# Optional fast JSON serializer
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-def format_response(
+
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def to_json(obj: Any) -> str:
+        """Serialize a response payload to a JSON string using orjson."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+else:
+    # Reuse one encoder; compact output without ASCII escaping matches orjson
+    _encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def to_json(obj: Any) -> str:
+        """Serialize a response payload to a JSON string."""
+        return _encode(obj)
+
+
+def text_content(text: str) -> TextContent:
+    """Wrap JSON text from to_json in a TextContent, skipping pydantic validation."""
+    return TextContent.model_construct(type="text", text=text)
+
+
+def _build_response(
     result: dict[str, Any],
-    state: "ComputerState",
-    screenshot_data: Optional[dict[str, Any]] = None
+    result_state: dict[str, Any],
+    screenshot_data: Optional[dict[str, Any]]
 ) -> list[Union[TextContent, ImageContent]]:
-    """Format a tool response with optional screenshot as ImageContent.
-    
-    Args:
-        result: Dictionary with tool action result (will be merged with state)
-        state: ComputerState instance
-        screenshot_data: Optional pre-captured screenshot data to use instead of capturing new one
-        
-    Returns:
-        List containing ImageContent (if screenshot enabled) and TextContent
-    """
-    result_state = state.get_state(include_screenshot=screenshot_data is None)
-    
-    # Use provided screenshot or extract from state
+    """Merge collected state into the result and build the content list."""
+    # Use provided screenshot or the one from state
     if screenshot_data is None:
-        screenshot_data = result_state.pop("screenshot", None)
+        screenshot_data = result_state.get("screenshot")
     
-    # Store screenshot metadata (without base64 data) for TextContent
-    screenshot_metadata = None
+    # Merge state into the result in one pass (result_state is a shared
+    # snapshot, so it is read, never modified)
+    if result_state:
+        result.update(result_state)
+    
+    # Replace the full screenshot with metadata (without base64 data) for TextContent
     if screenshot_data and not screenshot_data.get("error"):
-        screenshot_metadata = {
+        result["screenshot"] = {
             "format": screenshot_data.get("format", "base64_png"),
             "width": screenshot_data.get("width"),
             "height": screenshot_data.get("height")
         }
-    
-    # Add screenshot metadata to result if present
-    if screenshot_metadata:
-        result["screenshot"] = screenshot_metadata
-    
-    # Merge result with remaining state
-    result.update(result_state)
+        if "cached" in screenshot_data:
+            result["screenshot"]["cached"] = screenshot_data["cached"]
+    else:
+        result.pop("screenshot", None)
     
     # Build response list
     response: list[Union[TextContent, ImageContent]] = []
     
-    # Add ImageContent if screenshot is enabled and valid
-    if state.config.get("observe_screen", True) and screenshot_data:
+    # Add ImageContent if screenshot was provided or captured above, and is valid
+    if screenshot_data:
         image_content = screenshot_to_image_content(screenshot_data)
         if image_content:
             response.append(image_content)
     
     # Add TextContent with the result data
-    response.append(TextContent(type="text", text=json.dumps(result)))
+    response.append(text_content(to_json(result)))
     
     return response
 
+
+def format_response(
+    result: dict[str, Any],
+    state: "ComputerState",
+    screenshot_data: Optional[dict[str, Any]] = None,
+    include_state: bool = True
+) -> list[Union[TextContent, ImageContent]]:
+    """Format a tool response with optional screenshot as ImageContent.
+    
+    Args:
+        result: Dictionary with tool action result (will be merged with state)
+        state: ComputerState instance
+        screenshot_data: Optional pre-captured screenshot data to use instead of capturing new one.
+            An explicitly provided screenshot is always returned as ImageContent.
+        include_state: Collect observed state; False returns only the result
+        
+    Returns:
+        List containing ImageContent (if screenshot enabled or provided) and TextContent
+    """
+    explicit_screenshot = screenshot_data is not None
+    
+    # Nothing to observe (or caller opted out): skip state collection entirely
+    if not explicit_screenshot and not (include_state and state._any_observe):
+        return [text_content(to_json(result))]
+    
+    # Only grab the screen when the caller did not supply a frame and
+    # observe_screen is on; other tools never capture otherwise
+    capture = not explicit_screenshot and state.config.get("observe_screen", True)
+    result_state = state.get_state(include_screenshot=capture) if include_state else {}
+    return _build_response(result, result_state, screenshot_data)
+
+
+async def format_response_async(
+    result: dict[str, Any],
+    state: "ComputerState",
+    screenshot_data: Optional[dict[str, Any]] = None,
+    include_state: bool = True
+) -> list[Union[TextContent, ImageContent]]:
+    """Like format_response, but collects state with get_state_async.
+    
+    The blocking observations run concurrently in worker threads instead of
+    one after another on the event loop.
+    """
+    explicit_screenshot = screenshot_data is not None
+    
+    if not explicit_screenshot and not (include_state and state._any_observe):
+        return [text_content(to_json(result))]
+    
+    capture = not explicit_screenshot and state.config.get("observe_screen", True)
+    result_state = await state.get_state_async(include_screenshot=capture) if include_state else {}
+    return _build_response(result, result_state, screenshot_data)
@@ -1,36 +1,472 @@
 """Screenshot capture functionality."""
 
+import asyncio
+import atexit
 import base64
-from io import BytesIO
+import io
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import mss
 from PIL import Image
 
+from computer_mcp.core.platform import IS_WINDOWS
 
-def capture_screenshot() -> dict[str, Any]:
-    """Capture screenshot and return as base64-encoded PNG.
+# Optional SIMD base64 encoder; b64encode_as_string builds the str directly
+# instead of going through an intermediate bytes object
+try:
+    import pybase64
+    _b64encode_str = pybase64.b64encode_as_string
+except ImportError:
+    def _b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
+# Optional ISA-L deflate: a drop-in for zlib's compress API using SIMD,
+# several times faster at its lowest level
+try:
+    from isal import isal_zlib as _deflate
+    _DEFLATE_FAST_LEVEL = _deflate.ISAL_BEST_SPEED
+except ImportError:
+    _deflate = zlib
+    _DEFLATE_FAST_LEVEL = 1
+
+# Optional NumPy for converting BGRA frames straight into PNG scanlines
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Optional DXGI Desktop Duplication capture on Windows (faster than GDI BitBlt)
+HAS_DXCAM = False
+if IS_WINDOWS:
+    try:
+        import dxcam
+        HAS_DXCAM = True
+    except ImportError:
+        pass
+
+# One mss instance per thread: it holds display/DC handles that are not
+# safe to share across threads, and opening one costs a display round-trip
+_local = threading.local()
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_IDAT_CRC = zlib.crc32(b"IDAT")
+# Fast deflate; screenshots are re-encoded on every observed tool call
+_PNG_COMPRESSION_LEVEL = _DEFLATE_FAST_LEVEL
+
+# Lossy formats favour encode speed: Pillow's libjpeg-turbo/libwebp at
+# settings that are ample for vision models reading the screen
+_LOSSY_SAVE_OPTIONS: dict[str, dict[str, Any]] = {
+    "jpeg": {"format": "JPEG", "quality": 85, "optimize": False},
+    "webp": {"format": "WEBP", "quality": 80, "method": 0},
+}
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    """Build a PNG chunk (length, tag, data, CRC)."""
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(data, zlib.crc32(tag)))
+
+
+def _encode_png(rgb: bytes, width: int, height: int) -> bytes:
+    """Encode packed 8-bit RGB pixels as a PNG.
+    
+    Rows are written unfiltered and deflated at a low level, which skips
+    the per-pixel prediction pass and most of the compression work Pillow's
+    default encoder does on a full-screen frame.
+    
+    Args:
+        rgb: Packed RGB bytes, row-major, width * height * 3 long
+        width: Image width in pixels
+        height: Image height in pixels
+    
+    Returns:
+        PNG file bytes
+    """
+    stride = width * 3
+    view = memoryview(rgb)
+    compressor = _deflate.compressobj(_PNG_COMPRESSION_LEVEL)
+    idat = []
+    for offset in range(0, stride * height, stride):
+        idat.append(compressor.compress(b"\x00"))  # Filter type: None
+        idat.append(compressor.compress(view[offset:offset + stride]))
+    idat.append(compressor.flush())
+    return _png_file(idat, width, height)
+
+
+def _encode_png_bgra(bgra: bytes, width: int, height: int) -> bytes:
+    """Encode packed BGRA pixels (as captured by mss) as an RGB PNG using NumPy.
+    
+    The channel swap and alpha drop are written directly into a scanline
+    buffer that already holds the filter bytes, so the frame is deflated in
+    one call with no intermediate RGB copy. The image is identical to
+    _encode_png's on the same pixels.
+    
+    Args:
+        bgra: Packed BGRA bytes, row-major, width * height * 4 long
+        width: Image width in pixels
+        height: Image height in pixels
+    
+    Returns:
+        PNG file bytes
+    """
+    pixels = np.frombuffer(bgra, dtype=np.uint8).reshape(height, width, 4)
+    scanlines = _scanline_buffer(width, height)
+    scanlines[:, 1:].reshape(height, width, 3)[...] = pixels[..., 2::-1]
+    return _png_file((_deflate.compress(scanlines, _PNG_COMPRESSION_LEVEL),), width, height)
+
+
+def _scanline_buffer(width: int, height: int) -> "np.ndarray":
+    """Return this thread's RGB scanline scratch array for a frame size.
+    
+    The array is reused across captures of the same size instead of
+    allocating (and zero-filling) a new frame-sized buffer each time.
+    Column 0 of each row is the filter type byte and is never written, so
+    it stays 0 (filter: None).
+    """
+    scanlines = getattr(_local, "scanlines", None)
+    if scanlines is None or scanlines.shape != (height, width * 3 + 1):
+        scanlines = _local.scanlines = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    return scanlines
+
+
+def _png_file(idat: list[bytes] | tuple[bytes, ...], width: int, height: int) -> bytes:
+    """Assemble PNG file bytes around deflated RGB scanline data.
+    
+    The deflate output pieces are joined straight into the file, so the
+    compressed data is copied once rather than into an IDAT chunk first.
+    """
+    # Bit depth 8, color type 2 (RGB), default compression/filter, no interlace
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    crc = _PNG_IDAT_CRC
+    for part in idat:
+        crc = zlib.crc32(part, crc)
+    return b"".join((
+        _PNG_SIGNATURE,
+        _png_chunk(b"IHDR", ihdr),
+        struct.pack(">I", sum(map(len, idat))),
+        b"IDAT",
+        *idat,
+        struct.pack(">I", crc),
+        _png_chunk(b"IEND", b""),
+    ))
+
+
+def _get_sct() -> "mss.base.MSSBase":
+    """Return this thread's mss instance, creating it on first use."""
+    sct = getattr(_local, "sct", None)
+    if sct is None:
+        sct = _local.sct = mss.mss()
+        atexit.register(sct.close)
+    return sct
+
+
+# Last captured frame and its encodings, reused while the screen is unchanged
+_frame_lock = threading.Lock()
+_last_raw: bytes | bytearray | None = None
+_last_image: tuple[bytes, int, int] | None = None
+_last_key: tuple[tuple[int, int, int, int] | None, str] | None = None
+_last_payload: tuple[bytes, dict[str, Any]] | None = None
+
+def _clip_region(region: dict[str, int], width: int, height: int) -> tuple[int, int, int, int]:
+    """Clip a {x, y, width, height} region to a width x height frame.
+    
+    Returns:
+        Tuple of (x, y, width, height) inside the frame
+    
+    Raises:
+        ValueError: If the region does not overlap the frame
+    """
+    x, y = region["x"], region["y"]
+    left, top = max(0, x), max(0, y)
+    right, bottom = min(width, x + region["width"]), min(height, y + region["height"])
+    if right <= left or bottom <= top:
+        raise ValueError(f"Region {region} is outside the {width}x{height} screen")
+    return left, top, right - left, bottom - top
+
+
+_dxcam_lock = threading.Lock()
+_dxcam_camera = None
+_dxcam_last_frame = None
+# (region, grab result) last built from _dxcam_last_frame
+_dxcam_last_grab: tuple[tuple[int, int, int, int] | None, tuple[bytes, int, int]] | None = None
+
+
+def _grab_dxcam(region: dict[str, int] | None = None) -> tuple[bytes, int, int] | None:
+    """Grab the primary output as packed RGB via DXcam.
+    
+    DXcam returns None when nothing changed since the last grab. The
+    previous result for the same region is then returned as the same bytes
+    object, without copying the frame again, so callers can detect an
+    unchanged screen by identity. A region is cropped from the full frame so
+    that reuse works for any region.
+    
+    Args:
+        region: Optional {x, y, width, height} area of the screen to keep
+    
+    Returns:
+        Tuple of (rgb_bytes, width, height), or None if no frame is available
+    """
+    global _dxcam_camera, _dxcam_last_frame, _dxcam_last_grab
+    region_key = None if region is None else (region["x"], region["y"], region["width"], region["height"])
+    with _dxcam_lock:
+        if _dxcam_camera is None:
+            _dxcam_camera = dxcam.create(output_color="RGB")
+        frame = _dxcam_camera.grab()
+        if frame is None:
+            last_grab = _dxcam_last_grab
+            if last_grab is not None and last_grab[0] == region_key:
+                return last_grab[1]
+            frame = _dxcam_last_frame
+        else:
+            _dxcam_last_frame = frame
+        if frame is None:
+            return None
+        height, width = frame.shape[:2]
+        if region is not None:
+            x, y, width, height = _clip_region(region, width, height)
+            frame = frame[y:y + height, x:x + width]
+        grabbed = (frame.tobytes(), width, height)
+        _dxcam_last_grab = (region_key, grabbed)
+    return grabbed
+
+
+def _grab(region: dict[str, int] | None = None) -> tuple[bytes, int, int, str]:
+    """Grab the primary display, or a region of it.
+    
+    Args:
+        region: Optional {x, y, width, height} area of the screen to capture
+    
+    Returns:
+        Tuple of (raw pixel bytes, width, height, Pillow raw mode: "RGB" or "BGRX")
+    """
+    global HAS_DXCAM
+    if HAS_DXCAM:
+        try:
+            grabbed = _grab_dxcam(region)
+        except ValueError:
+            raise
+        except Exception:
+            # Desktop Duplication unavailable (e.g. remote session); stay on mss
+            HAS_DXCAM = False
+            grabbed = None
+        if grabbed is not None:
+            rgb, width, height = grabbed
+            return rgb, width, height, "RGB"
+    
+    sct = _get_sct()
+    monitor = sct.monitors[1]  # Index 0 is all monitors, 1+ are individual
+    if region is not None and not HAS_NUMPY:
+        # Without NumPy to crop a view, have mss grab only the region
+        x, y, w, h = _clip_region(region, monitor["width"], monitor["height"])
+        monitor = {"left": monitor["left"] + x, "top": monitor["top"] + y, "width": w, "height": h}
+    screenshot = sct.grab(monitor)
+    raw, width, height = screenshot.raw, screenshot.width, screenshot.height
+    if region is not None and HAS_NUMPY:
+        # Crop the BGRA frame before converting, so only the region is
+        # swapped to RGB and encoded
+        x, y, width, height = _clip_region(region, width, height)
+        pixels = np.frombuffer(raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
+        raw = pixels[y:y + height, x:x + width].tobytes()
+    return raw, width, height, "BGRX"
+
+
+def _bgra_to_rgb(bgra: bytes) -> bytearray:
+    """Drop alpha and swap BGRA pixels to packed RGB with C-level slicing."""
+    rgb = bytearray(len(bgra) // 4 * 3)
+    rgb[0::3] = bgra[2::4]
+    rgb[1::3] = bgra[1::4]
+    rgb[2::3] = bgra[0::4]
+    return rgb
+
+
+def _encode_image(raw: bytes, width: int, height: int, rawmode: str, image_format: str) -> bytes:
+    """Encode grabbed pixels as PNG (own encoder) or JPEG/WebP (Pillow)."""
+    if image_format == "png":
+        if rawmode == "RGB":
+            return _encode_png(raw, width, height)
+        if HAS_NUMPY:
+            return _encode_png_bgra(raw, width, height)
+        return _encode_png(_bgra_to_rgb(raw), width, height)
+    
+    save_options = _LOSSY_SAVE_OPTIONS.get(image_format)
+    if save_options is None:
+        raise ValueError(f"Unsupported screenshot format: {image_format}")
+    # Pillow reads BGRX directly, so there is no separate conversion pass
+    image = Image.frombuffer("RGB", (width, height), raw, "raw", rawmode, 0, 1)
+    buffer = io.BytesIO()
+    image.save(buffer, **save_options)
+    return buffer.getvalue()
+
+
+def capture_screenshot_image(
+    force: bool = False,
+    region: dict[str, int] | None = None,
+    image_format: str = "png"
+) -> tuple[bytes, int, int]:
+    """Capture screenshot and return the encoded image bytes.
+    
+    If the pixels match the previous capture, the previous image is returned
+    without encoding again.
+    
+    Args:
+        force: Always encode a new image, even if the screen is unchanged
+        region: Optional {x, y, width, height} area of the primary display;
+            only that area is converted and encoded
+        image_format: "png" (lossless), or "jpeg"/"webp" for much smaller
+            lossy images
+    
+    Returns:
+        Tuple of (image_bytes, width, height)
+    
+    Raises:
+        ValueError: If the region does not overlap the screen, or the format is unsupported
+    """
+    global _last_raw, _last_image, _last_key
+    raw, width, height, rawmode = _grab(region)
+    region_key = None if region is None else (region["x"], region["y"], width, height)
+    key = (region_key, image_format)
+    
+    with _frame_lock:
+        # DXcam hands back the same object for an unchanged screen; otherwise
+        # a byte comparison is a memcmp, far cheaper than encoding the frame
+        if not force and _last_image is not None and key == _last_key and (raw is _last_raw or raw == _last_raw):
+            return _last_image
+    
+    image = (_encode_image(raw, width, height, rawmode, image_format), width, height)
+    with _frame_lock:
+        _last_raw, _last_image, _last_key = raw, image, key
+    return image
+
+
+def capture_screenshot_png(
+    force: bool = False,
+    region: dict[str, int] | None = None
+) -> tuple[bytes, int, int]:
+    """Capture screenshot and return the raw PNG bytes.
+    
+    Args:
+        force: Always encode a new PNG, even if the screen is unchanged
+        region: Optional {x, y, width, height} area of the primary display
+    
+    Returns:
+        Tuple of (png_bytes, width, height)
+    """
+    return capture_screenshot_image(force, region, "png")
+
+
+def capture_screenshot(
+    force: bool = False,
+    region: dict[str, int] | None = None,
+    image_format: str = "png"
+) -> dict[str, Any]:
+    """Capture screenshot and return as a base64-encoded image.
+    
+    Args:
+        force: Always encode a new image, even if the screen is unchanged
+        region: Optional {x, y, width, height} area of the primary display
+        image_format: "png", "jpeg" or "webp"
+    
+    Returns:
+        Dictionary with format, data (base64), width, height, and cached
+        (True when the screen was unchanged and the previous image is reused)
+    """
+    global _last_payload
+    img_bytes, width, height = capture_screenshot_image(force, region, image_format)
+    
+    # Reuse the base64 payload while the image is the same object
+    cached = _last_payload
+    reused = cached is not None and cached[0] is img_bytes
+    if not reused:
+        cached = _last_payload = (img_bytes, {
+            "format": f"base64_{image_format}",
+            "data": _b64encode_str(img_bytes),
+            "width": width,
+            "height": height
+        })
+    payload = dict(cached[1])
+    payload["cached"] = reused
+    return payload
+
+
+def capture_screen_rect(left: int, top: int, width: int, height: int) -> dict[str, Any]:
+    """Capture a rectangle in virtual-screen coordinates as a base64 PNG.
+    
+    Uses this thread's persistent mss grabber, so no device context or
+    display connection is opened per call. The rectangle may lie on any
+    monitor, which suits window captures.
+    
+    Args:
+        left: Left edge in screen coordinates
+        top: Top edge in screen coordinates
+        width: Width in pixels
+        height: Height in pixels
     
     Returns:
         Dictionary with format, data (base64), width, and height
     """
-    with mss.mss() as sct:
-        monitor = sct.monitors[1]  # Index 0 is all monitors, 1+ are individual
-        screenshot = sct.grab(monitor)
-        
-        # Convert to PIL Image
-        img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-        
-        # Convert to base64
-        buffer = BytesIO()
-        img.save(buffer, format="PNG")
-        img_bytes = buffer.getvalue()
-        img_base64 = base64.b64encode(img_bytes).decode("utf-8")
-        
-        return {
-            "format": "base64_png",
-            "data": img_base64,
-            "width": screenshot.width,
-            "height": screenshot.height
-        }
+    screenshot = _get_sct().grab({"left": left, "top": top, "width": width, "height": height})
+    png = _encode_image(screenshot.raw, screenshot.width, screenshot.height, "BGRX", "png")
+    return {
+        "format": "base64_png",
+        "data": _b64encode_str(png),
+        "width": screenshot.width,
+        "height": screenshot.height
+    }
+
 
+# Asynchronous captures (the screenshot tool and observed screenshots) run
+# here, one at a time, off the event loop. A single thread means a single
+# mss grabber and scanline buffer rather than one per pool thread.
+capture_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="computer-mcp-capture")
+# (request key, future) of the capture in flight, and (request key, grab
+# start time, payload) of the most recent completed one
+_pending_capture: tuple[tuple, "asyncio.Future[dict[str, Any]]"] | None = None
+_latest_capture: tuple[tuple, float, dict[str, Any]] | None = None
+# Oldest previous frame (seconds since its grab started) that may be returned
+# while a newer capture is running; older frames wait for that capture instead
+_MAX_REUSED_FRAME_AGE = 0.1
+
+
+async def capture_screenshot_async(
+    force: bool = False,
+    region: dict[str, int] | None = None,
+    image_format: str = "png"
+) -> dict[str, Any]:
+    """Capture a screenshot in a worker thread without blocking the event loop.
+    
+    If a capture for the same region and format is already running and the
+    previous frame is younger than _MAX_REUSED_FRAME_AGE, that frame is
+    returned immediately (marked cached) instead of queueing another grab
+    behind it; otherwise the running capture is awaited. force always waits
+    for a new capture.
+    
+    Args:
+        force: Always capture and encode a new image
+        region: Optional {x, y, width, height} area of the primary display
+        image_format: "png", "jpeg" or "webp"
+    
+    Returns:
+        Dictionary with format, data (base64), width, height, and cached
+    """
+    global _pending_capture, _latest_capture
+    key = (None if region is None else tuple(region[k] for k in ("x", "y", "width", "height")), image_format)
+    
+    pending, latest = _pending_capture, _latest_capture
+    if not force and pending is not None and pending[0] == key and not pending[1].done():
+        if latest is not None and latest[0] == key and time.monotonic() - latest[1] <= _MAX_REUSED_FRAME_AGE:
+            return {**latest[2], "cached": True}
+        return dict(await asyncio.shield(pending[1]))
+    
+    started = time.monotonic()
+    future = asyncio.get_running_loop().run_in_executor(
+        capture_executor, capture_screenshot, force, region, image_format
+    )
+    _pending_capture = (key, future)
+    payload = await future
+    _latest_capture = (key, started, payload)
+    return dict(payload)
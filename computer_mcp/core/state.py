@@ -1,17 +1,124 @@
 """Computer state tracking and management."""
 
-from typing import Any, Optional
+import asyncio
+import threading
+import time
+from functools import partial
+from typing import Any, Callable, Optional
 
 from pynput import keyboard, mouse
 from pynput.keyboard import Controller as KeyboardController, Key, KeyCode
 from pynput.mouse import Button, Controller as MouseController
 
-from computer_mcp.core.screenshot import capture_screenshot
+from computer_mcp.actions.accessibility_tree import get_accessibility_tree
+from computer_mcp.actions.focused_app import get_focused_app
+from computer_mcp.core.screenshot import capture_executor, capture_screenshot
+from computer_mcp.core.system_metrics import get_system_metrics
+
+# Config flags that add data to every tool response
+_OBSERVE_KEYS = (
+    "observe_screen",
+    "observe_mouse_position",
+    "observe_mouse_button_states",
+    "observe_keyboard_key_states",
+    "observe_focused_app",
+    "observe_accessibility_tree",
+    "observe_system_metrics",
+)
+
+# Back-to-back tool calls within this window share one state snapshot
+_STATE_CACHE_TTL_NS = 2_000_000
+
+
+def _format_key(key) -> str:
+    """Format key for display."""
+    if isinstance(key, Key):
+        return key.name if hasattr(key, 'name') else str(key)
+    elif isinstance(key, KeyCode):
+        return key.char if key.char else f"<{key.vk}>"
+    return str(key)
+
+
+class _BitRegistry:
+    """Assigns each distinct key/button a bit index and remembers its display name.
+    
+    Held keys and buttons are then tracked as an int bitmask: press/release
+    are single bit operations, and names are formatted once per key rather
+    than on every state read. Each registry is only written from one
+    listener thread.
+    """
+    
+    __slots__ = ("_bits", "_names", "_format", "_last_mask", "_last_names")
+    
+    def __init__(self, format_name: Callable[[Any], str]):
+        self._bits: dict[Any, int] = {}
+        self._names: list[str] = []
+        self._format = format_name
+        self._last_mask = 0
+        self._last_names: list[str] = []
+    
+    def bit(self, item) -> int:
+        """Return the mask bit for item, registering it on first sight."""
+        bit = self._bits.get(item)
+        if bit is None:
+            self._names.append(self._format(item))
+            bit = self._bits[item] = 1 << (len(self._names) - 1)
+        return bit
+    
+    def names(self, mask: int) -> list[str]:
+        """Display names of the items set in mask, lowest bit first.
+        
+        While the mask is unchanged the previous list is returned again, so
+        polling with the same keys held allocates nothing. Callers must not
+        modify it.
+        """
+        # Bits are never reassigned, so a mask always maps to the same names
+        if mask == self._last_mask:
+            return self._last_names
+        names = []
+        remaining = mask
+        while remaining:
+            low = remaining & -remaining
+            names.append(self._names[low.bit_length() - 1])
+            remaining ^= low
+        self._last_mask, self._last_names = mask, names
+        return names
+
+
+_MOUSE_BUTTON_BITS = _BitRegistry(str)
+_KEYBOARD_KEY_BITS = _BitRegistry(_format_key)
+
+
+def _capture_screenshot_or_error(image_format: str) -> dict[str, Any]:
+    """Capture a screenshot, reporting failures in place of the image."""
+    try:
+        return capture_screenshot(image_format=image_format)
+    except Exception as e:
+        return {"error": str(e)}
 
 
 class ComputerState:
     """Manages computer state tracking."""
     
+    __slots__ = (
+        "config",
+        "mouse_position",
+        "mouse_buttons_mask",
+        "keyboard_keys_mask",
+        "_held_keys_for_hotkeys",
+        "mouse_listener",
+        "keyboard_listener",
+        "_mouse_listener_desired",
+        "_kb_listener_desired",
+        "_listener_lock",
+        "_any_observe",
+        "mouse_controller",
+        "keyboard_controller",
+        "_state_cache",
+        "_state_cache_screenshot",
+        "_state_cache_ts",
+    )
+    
     def __init__(self):
         self.config = {
             "observe_screen": True,  # Default true
@@ -24,16 +131,30 @@ class ComputerState:
             "constrain_mouse_to_window": None,  # None (disabled), int (hwnd), or str (window title pattern)
             "observe_system_metrics": False,  # Track system performance metrics
             "terminal_output_mode": "chars",  # "chars" or "text" - how to return terminal output
+            "precise_drag": True,  # Spin ~2 ms between drag steps instead of sleeping 10 ms
+            "screenshot_format": "jpeg",  # Observed screenshots and the screenshot tool's default: "png", "jpeg" or "webp"
         }
         self.mouse_position = (0, 0)
-        self.mouse_buttons = set()
-        self.keyboard_keys = set()
+        # Held buttons/keys as bitmasks (see _BitRegistry)
+        self.mouse_buttons_mask = 0
+        self.keyboard_keys_mask = 0
         # Track held keys for hotkey checking (always active, not dependent on config)
         self._held_keys_for_hotkeys = set()
         self.mouse_listener: Optional[mouse.Listener] = None
         self.keyboard_listener: Optional[keyboard.Listener] = None
+        # Listener state last applied from config; only set_config changes it,
+        # so tool calls never touch listeners
+        self._mouse_listener_desired = False
+        self._kb_listener_desired = False
+        self._listener_lock = threading.Lock()
+        # Whether any observe_* flag is on; lets responses skip state collection
+        self._any_observe = True
         self.mouse_controller = MouseController()
         self.keyboard_controller = KeyboardController()
+        # Last get_state() snapshot, reused for _STATE_CACHE_TTL_NS
+        self._state_cache: Optional[dict[str, Any]] = None
+        self._state_cache_screenshot = False
+        self._state_cache_ts = 0
         
     def start_mouse_listener(self):
         """Start mouse state tracking."""
@@ -66,6 +187,37 @@ class ComputerState:
             self.keyboard_listener.stop()
             self.keyboard_listener = None
     
+    def invalidate_state(self):
+        """Drop the cached snapshot (call after an action that changes the UI or input state)."""
+        self._state_cache = None
+    
+    def mark_config_changed(self):
+        """Apply an updated config (call after changing observe_* flags)."""
+        self._any_observe = any(self.config[key] for key in _OBSERVE_KEYS)
+        self.invalidate_state()
+        self.apply_listener_config()
+    
+    def apply_listener_config(self):
+        """Start or stop listeners to match the observe_* config."""
+        # Serialize transitions so concurrent config updates cannot start a
+        # listener twice or stop one another is starting
+        with self._listener_lock:
+            desired_mouse = bool(self.config["observe_mouse_position"] or self.config["observe_mouse_button_states"])
+            if desired_mouse != self._mouse_listener_desired:
+                self._mouse_listener_desired = desired_mouse
+                if desired_mouse:
+                    self.start_mouse_listener()
+                else:
+                    self.stop_mouse_listener()
+            
+            desired_kb = bool(self.config["observe_keyboard_key_states"])
+            if desired_kb != self._kb_listener_desired:
+                self._kb_listener_desired = desired_kb
+                if desired_kb:
+                    self.start_keyboard_listener()
+                else:
+                    self.stop_keyboard_listener()
+    
     def _on_mouse_move(self, x: int, y: int):
         if self.config["observe_mouse_position"]:
             self.mouse_position = (x, y)
@@ -75,30 +227,62 @@ class ComputerState:
             self.mouse_position = (x, y)
         if self.config["observe_mouse_button_states"]:
             if pressed:
-                self.mouse_buttons.add(button)
+                self.mouse_buttons_mask |= _MOUSE_BUTTON_BITS.bit(button)
             else:
-                self.mouse_buttons.discard(button)
+                self.mouse_buttons_mask &= ~_MOUSE_BUTTON_BITS.bit(button)
     
     def _on_mouse_scroll(self, x: int, y: int, dx: int, dy: int):  # noqa: ARG002
         if self.config["observe_mouse_position"]:
             self.mouse_position = (x, y)
     
     def _on_key_press(self, key):
-        self.keyboard_keys.add(key)
+        self.keyboard_keys_mask |= _KEYBOARD_KEY_BITS.bit(key)
     
     def _on_key_release(self, key):
-        self.keyboard_keys.discard(key)
+        self.keyboard_keys_mask &= ~_KEYBOARD_KEY_BITS.bit(key)
     
-    def get_state(self, include_screenshot: bool = True) -> dict[str, Any]:
-        """Get current state based on configuration."""
-        state = {}
+    def _cached_state(self, include_screenshot: bool) -> Optional[dict[str, Any]]:
+        """Return the last snapshot if it is recent enough to reuse."""
+        if (
+            self._state_cache is not None
+            and self._state_cache_screenshot == include_screenshot
+            and time.perf_counter_ns() - self._state_cache_ts < _STATE_CACHE_TTL_NS
+        ):
+            return self._state_cache
+        return None
+    
+    def _cache_state(self, state: dict[str, Any], include_screenshot: bool) -> dict[str, Any]:
+        """Remember a snapshot for back-to-back calls and return it."""
+        self._state_cache = state
+        self._state_cache_screenshot = include_screenshot
+        self._state_cache_ts = time.perf_counter_ns()
+        return state
+    
+    def _blocking_observers(self, include_screenshot: bool) -> list[tuple[str, Callable[[], Any]]]:
+        """Enabled observations that block on the OS (capture, AT-SPI/AppleScript, psutil)."""
+        observers: list[tuple[str, Callable[[], Any]]] = []
         
         # Screenshot (default true)
         if include_screenshot and self.config["observe_screen"]:
-            try:
-                state["screenshot"] = capture_screenshot()
-            except Exception as e:
-                state["screenshot"] = {"error": str(e)}
+            observers.append(("screenshot", partial(_capture_screenshot_or_error, self.config["screenshot_format"])))
+        
+        # Focused app
+        if self.config["observe_focused_app"]:
+            observers.append(("focused_app", get_focused_app))
+        
+        # Accessibility tree
+        if self.config["observe_accessibility_tree"]:
+            observers.append(("accessibility_tree", get_accessibility_tree))
+        
+        # System metrics
+        if self.config["observe_system_metrics"]:
+            observers.append(("system_metrics", get_system_metrics))
+        
+        return observers
+    
+    def _input_state(self) -> dict[str, Any]:
+        """Mouse and keyboard observations (in-memory or a single cheap query)."""
+        state = {}
         
         # Mouse position
         if self.config["observe_mouse_position"]:
@@ -107,34 +291,56 @@ class ComputerState:
         
         # Mouse button states
         if self.config["observe_mouse_button_states"]:
-            state["mouse_button_states"] = [str(btn) for btn in self.mouse_buttons]
+            state["mouse_button_states"] = _MOUSE_BUTTON_BITS.names(self.mouse_buttons_mask)
         
         # Keyboard key states
         if self.config["observe_keyboard_key_states"]:
-            state["keyboard_key_states"] = [self._format_key(key) for key in self.keyboard_keys]
+            state["keyboard_key_states"] = _KEYBOARD_KEY_BITS.names(self.keyboard_keys_mask)
         
-        # Focused app
-        if self.config["observe_focused_app"]:
-            from computer_mcp.actions.focused_app import get_focused_app as get_focused_app_impl
-            state["focused_app"] = get_focused_app_impl()
-        
-        # Accessibility tree
-        if self.config["observe_accessibility_tree"]:
-            from computer_mcp.actions.accessibility_tree import get_accessibility_tree as get_accessibility_tree_impl
-            state["accessibility_tree"] = get_accessibility_tree_impl()
+        return state
+    
+    @staticmethod
+    def _merge_state(blocking: dict[str, Any], input_state: dict[str, Any]) -> dict[str, Any]:
+        """Combine observations in response order (screenshot first)."""
+        state = {}
+        if "screenshot" in blocking:
+            state["screenshot"] = blocking.pop("screenshot")
+        state.update(input_state)
+        state.update(blocking)
+        return state
+    
+    def get_state(self, include_screenshot: bool = True) -> dict[str, Any]:
+        """Get current state based on configuration.
         
-        # System metrics
-        if self.config["observe_system_metrics"]:
-            from computer_mcp.core.system_metrics import get_system_metrics
-            state["system_metrics"] = get_system_metrics()
+        Calls within a couple of milliseconds of each other reuse the previous
+        snapshot. The returned dict is shared with that cache; do not modify it.
+        """
+        cached = self._cached_state(include_screenshot)
+        if cached is not None:
+            return cached
         
-        return state
+        blocking = {key: observe() for key, observe in self._blocking_observers(include_screenshot)}
+        state = self._merge_state(blocking, self._input_state())
+        return self._cache_state(state, include_screenshot)
     
-    def _format_key(self, key) -> str:
-        """Format key for display."""
-        if isinstance(key, Key):
-            return key.name if hasattr(key, 'name') else str(key)
-        elif isinstance(key, KeyCode):
-            return key.char if key.char else f"<{key.vk}>"
-        return str(key)
+    async def get_state_async(self, include_screenshot: bool = True) -> dict[str, Any]:
+        """Get current state, running the blocking observations concurrently.
+        
+        Screenshot capture, focused app, accessibility tree and system metrics
+        each run in a worker thread, so the wait is the slowest of them rather
+        than their sum. The screenshot uses the shared capture thread, like
+        the screenshot tool. Caching is as for get_state().
+        """
+        cached = self._cached_state(include_screenshot)
+        if cached is not None:
+            return cached
+        
+        loop = asyncio.get_running_loop()
+        futures = {
+            key: loop.run_in_executor(capture_executor if key == "screenshot" else None, observe)
+            for key, observe in self._blocking_observers(include_screenshot)
+        }
+        blocking = {key: await future for key, future in futures.items()}
+        state = self._merge_state(blocking, self._input_state())
+        return self._cache_state(state, include_screenshot)
 
@@ -0,0 +1,45 @@
+"""Tracking of actions that may have changed the UI.
+
+Caches of UI-derived data (the accessibility tree) are keyed on
+ui_generation(). Every function that sends input or rearranges windows is
+decorated with changes_ui, so the caches are invalidated whichever entry
+point ran the action: the MCP servers, the REST API or the Python API.
+"""
+
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+__all__ = ["changes_ui", "mark_ui_changed", "ui_generation"]
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_generation = 0
+
+
+def ui_generation() -> int:
+    """Return a counter that changes whenever the UI may have changed."""
+    return _generation
+
+
+def mark_ui_changed() -> None:
+    """Invalidate caches of UI-derived data."""
+    global _generation
+    _generation += 1
+
+
+def changes_ui(func: _F) -> _F:
+    """Decorate an action that may change the UI.
+
+    The generation is bumped when the action starts, so state collected
+    inside it (the legacy handlers respond with observations) is rebuilt, and
+    again when it returns or raises, so a result cached while it was running
+    is not reused.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        mark_ui_changed()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            mark_ui_changed()
+    return wrapper  # pyright: ignore[reportReturnType]
@@ -1,55 +1,87 @@
 """Utility functions."""
 
+import time
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Optional
 
 from mcp.types import ImageContent
 from pynput.keyboard import Key, KeyCode
 from pynput.mouse import Button
 
+__all__ = [
+    "key_from_string",
+    "button_from_string",
+    "key_to_string",
+    "normalize_hotkey_string",
+    "is_hotkey_disallowed",
+    "get_window_bounds",
+    "constrain_mouse_coordinates",
+    "screenshot_to_image_content",
+    "precise_sleep",
+]
 
+
+# Read-only so the shared table cannot be mutated by callers. Every pynput
+# Key member is included by name (caps_lock, f13, media_play_pause, ...),
+# followed by the common aliases. Aliases only name keys that exist on every
+# platform (macOS has no insert, for example).
+_KEY_MAP = MappingProxyType({
+    **{key.name: key for key in Key},
+    "ctrl": Key.ctrl, "control": Key.ctrl,
+    "alt": Key.alt,
+    "shift": Key.shift,
+    "cmd": Key.cmd, "command": Key.cmd, "win": Key.cmd, "windows": Key.cmd, "meta": Key.cmd,
+    "space": Key.space,
+    "enter": Key.enter, "return": Key.enter,
+    "tab": Key.tab,
+    "esc": Key.esc, "escape": Key.esc,
+    "backspace": Key.backspace,
+    "delete": Key.delete,
+    "up": Key.up, "down": Key.down, "left": Key.left, "right": Key.right,
+    "pageup": Key.page_up, "pagedown": Key.page_down,
+    "home": Key.home, "end": Key.end,
+    "f1": Key.f1, "f2": Key.f2, "f3": Key.f3, "f4": Key.f4,
+    "f5": Key.f5, "f6": Key.f6, "f7": Key.f7, "f8": Key.f8,
+    "f9": Key.f9, "f10": Key.f10, "f11": Key.f11, "f12": Key.f12,
+})
+
+_BUTTON_MAP = {
+    "left": Button.left, "1": Button.left,
+    "right": Button.right, "2": Button.right,
+    "middle": Button.middle, "3": Button.middle,
+}
+
+_FORMAT_TO_MIME = {
+    "base64_png": "image/png", "png": "image/png",
+    "base64_jpeg": "image/jpeg", "jpeg": "image/jpeg", "jpg": "image/jpeg",
+    "base64_webp": "image/webp", "webp": "image/webp",
+}
+
+
+@lru_cache(maxsize=256)
 def key_from_string(key_str: str):
     """Convert string key name to pynput Key or KeyCode."""
     key_str = key_str.lower().strip()
     
-    key_map = {
-        "ctrl": Key.ctrl, "control": Key.ctrl,
-        "alt": Key.alt,
-        "shift": Key.shift,
-        "cmd": Key.cmd, "command": Key.cmd, "win": Key.cmd, "windows": Key.cmd, "meta": Key.cmd,
-        "space": Key.space,
-        "enter": Key.enter, "return": Key.enter,
-        "tab": Key.tab,
-        "esc": Key.esc, "escape": Key.esc,
-        "backspace": Key.backspace,
-        "delete": Key.delete,
-        "up": Key.up, "down": Key.down, "left": Key.left, "right": Key.right,
-        "pageup": Key.page_up, "pagedown": Key.page_down,
-        "home": Key.home, "end": Key.end, "insert": Key.insert,
-        "f1": Key.f1, "f2": Key.f2, "f3": Key.f3, "f4": Key.f4,
-        "f5": Key.f5, "f6": Key.f6, "f7": Key.f7, "f8": Key.f8,
-        "f9": Key.f9, "f10": Key.f10, "f11": Key.f11, "f12": Key.f12,
-    }
-    
-    if key_str in key_map:
-        return key_map[key_str]
+    key = _KEY_MAP.get(key_str)
+    if key is not None:
+        return key
     
     if len(key_str) == 1:
         return KeyCode.from_char(key_str)
     
-    return KeyCode.from_vk(int(key_str)) if key_str.isdigit() else key_str
+    # Check the first character before scanning the whole string
+    if key_str[:1].isdigit() and key_str.isdigit():
+        return KeyCode.from_vk(int(key_str))
+    
+    return key_str
 
 
+@lru_cache(maxsize=256)
 def button_from_string(button_str: str) -> Button:
     """Convert string button name to pynput Button."""
-    button_str = button_str.lower().strip()
-    if button_str in ["left", "1"]:
-        return Button.left
-    elif button_str in ["right", "2"]:
-        return Button.right
-    elif button_str in ["middle", "3"]:
-        return Button.middle
-    else:
-        return Button.left
+    return _BUTTON_MAP.get(button_str.lower().strip(), Button.left)
 
 
 def key_to_string(key) -> str:
@@ -84,6 +116,7 @@ def key_to_string(key) -> str:
     return str(key).lower()
 
 
+@lru_cache(maxsize=256)
 def normalize_hotkey_string(hotkey: str) -> str:
     """Normalize a hotkey string for comparison.
     
@@ -394,21 +427,30 @@ def screenshot_to_image_content(screenshot_data: dict[str, Any]) -> Optional[Ima
         return None
     
     # Remove data URI prefix if present (data:image/png;base64,)
-    if data.startswith("data:image"):
+    if data[:11] == "data:image/":
         data = data.split(",", 1)[1]
     
     # Determine MIME type from format or default to PNG
-    format_str = screenshot_data.get("format", "base64_png").lower()
-    if "png" in format_str:
-        mime_type = "image/png"
-    elif "jpeg" in format_str or "jpg" in format_str:
-        mime_type = "image/jpeg"
-    else:
-        mime_type = "image/png"  # Default to PNG
+    mime_type = _FORMAT_TO_MIME.get(screenshot_data.get("format", "base64_png"), "image/png")
     
-    return ImageContent(
+    # The payload is already valid base64 from our encoder; skip pydantic
+    # validation of the multi-megabyte string
+    return ImageContent.model_construct(
         type="image",
         data=data,
         mimeType=mime_type
     )
 
+
+def precise_sleep(seconds: float) -> None:
+    """Wait a short interval by spinning on the monotonic clock.
+    
+    time.sleep() wakes on scheduler ticks and can overshoot millisecond waits
+    several times over. This busy-waits instead, so only use it for short delays.
+    
+    Args:
+        seconds: Time to wait in seconds
+    """
+    end = time.perf_counter_ns() + int(seconds * 1_000_000_000)
+    while time.perf_counter_ns() < end:
+        pass
@@ -0,0 +1,69 @@
+"""Process name lookup on Windows.
+
+psutil.Process(pid).name() opens the process with query and VM-read access
+and builds a Process object on every call. QueryFullProcessImageNameW only
+needs PROCESS_QUERY_LIMITED_INFORMATION, which is also granted for most
+elevated and service processes, so the image name is read directly and
+psutil is only the fallback.
+"""
+
+import ntpath
+
+import psutil
+
+from computer_mcp.core.platform import IS_WINDOWS
+
+__all__ = ["get_process_name"]
+
+if IS_WINDOWS:
+    import ctypes
+    from ctypes import wintypes
+
+    _PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    _MAX_PATH = 260
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _OpenProcess = _kernel32.OpenProcess
+    _OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _OpenProcess.restype = wintypes.HANDLE
+    _QueryFullProcessImageNameW = _kernel32.QueryFullProcessImageNameW
+    _QueryFullProcessImageNameW.argtypes = (wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD))
+    _QueryFullProcessImageNameW.restype = wintypes.BOOL
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = (wintypes.HANDLE,)
+    _CloseHandle.restype = wintypes.BOOL
+
+
+def _image_name(pid: int) -> str | None:
+    """Executable file name of pid via QueryFullProcessImageNameW, or None."""
+    handle = _OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        buffer = ctypes.create_unicode_buffer(_MAX_PATH)
+        size = wintypes.DWORD(_MAX_PATH)
+        if not _QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+            return None
+        return ntpath.basename(buffer.value)
+    finally:
+        _CloseHandle(handle)
+
+
+def get_process_name(pid: int) -> str:
+    """Return the executable name of a process (e.g. "notepad.exe").
+    
+    Args:
+        pid: Process ID
+    
+    Returns:
+        The process name
+    
+    Raises:
+        psutil.NoSuchProcess: If the process does not exist
+        psutil.AccessDenied: If neither lookup is permitted
+    """
+    if IS_WINDOWS:
+        name = _image_name(pid)
+        if name:
+            return name
+    return psutil.Process(pid).name()
@@ -0,0 +1,127 @@
+"""Active window and pointer queries on Linux/X11.
+
+With python-xlib installed, one X connection is opened on first use and the
+active window title is read from its EWMH properties in-process. Without it
+(or when no display can be opened), xdotool is spawned instead, which costs
+a process start plus a fresh X connection per call. Pointer button and
+modifier state is only available through python-xlib.
+"""
+
+import subprocess
+import threading
+from contextlib import contextmanager
+
+from computer_mcp.core.platform import IS_LINUX
+
+__all__ = ["get_active_window_title", "get_pointer_state_mask", "locked_display"]
+
+HAS_XLIB = False
+if IS_LINUX:
+    try:
+        from Xlib import X, display as xdisplay  # pyright: ignore[reportMissingImports]
+        HAS_XLIB = True
+    except ImportError:
+        pass
+
+# Xlib connections are not thread-safe; observations run in worker threads
+_x_lock = threading.Lock()
+_x_display = None
+_x_atoms: dict[str, int] = {}
+
+
+def _open_display():
+    """Open the shared X connection and intern the atoms used below."""
+    global _x_display
+    _x_display = xdisplay.Display()
+    for name in ("_NET_ACTIVE_WINDOW", "_NET_WM_NAME", "UTF8_STRING"):
+        _x_atoms[name] = _x_display.intern_atom(name)
+    return _x_display
+
+
+@contextmanager
+def locked_display():
+    """Hold the shared X connection for a sequence of requests.
+
+    Only use when HAS_XLIB is true. Opening the display can raise if no X
+    server is reachable.
+    """
+    with _x_lock:
+        yield _x_display or _open_display()
+
+
+def _xlib_active_window_title() -> str | None:
+    """Read the active window's title over the shared X connection."""
+    with _x_lock:
+        display = _x_display or _open_display()
+        active = display.screen().root.get_full_property(_x_atoms["_NET_ACTIVE_WINDOW"], X.AnyPropertyType)
+        if active is None or not active.value or not active.value[0]:
+            return None
+        window = display.create_resource_object("window", active.value[0])
+        name = window.get_full_property(_x_atoms["_NET_WM_NAME"], _x_atoms["UTF8_STRING"])
+        if name is not None:
+            value = name.value
+        else:
+            # Window manager without EWMH names: fall back to ICCCM WM_NAME
+            value = window.get_wm_name()
+    if isinstance(value, bytes):
+        value = value.decode("utf-8", "replace")
+    return value.strip() if value else ""
+
+
+def get_active_window_title(timeout: float) -> str | None:
+    """Return the title of the focused X11 window.
+
+    Args:
+        timeout: Seconds to wait for xdotool (not used in-process)
+
+    Returns:
+        The window title, or None if there is no active window or the query failed
+
+    Raises:
+        subprocess.TimeoutExpired: If the xdotool fallback times out
+        FileNotFoundError: If the fallback is needed and xdotool is not installed
+    """
+    global HAS_XLIB
+    if HAS_XLIB:
+        try:
+            return _xlib_active_window_title()
+        except Exception:
+            if _x_display is None:
+                # No reachable display; stop retrying the connection
+                HAS_XLIB = False
+            else:
+                return None
+
+    result = subprocess.run(
+        ["xdotool", "getactivewindow", "getwindowname"],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        check=False
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def get_pointer_state_mask() -> int | None:
+    """Return the core state mask reported by query_pointer.
+
+    It holds the held pointer buttons (Button1Mask is 1 << 8), the active
+    modifiers (Shift, Lock, Control, Mod1-Mod5 in bits 0-7) and, with XKB,
+    the keyboard group in bits 13-14.
+
+    Returns:
+        The state mask, or None without python-xlib or a reachable display
+    """
+    global HAS_XLIB
+    if not HAS_XLIB:
+        return None
+    try:
+        with _x_lock:
+            display = _x_display or _open_display()
+            return display.screen().root.query_pointer().mask
+    except Exception:
+        if _x_display is None:
+            HAS_XLIB = False
+        return None
@@ -11,7 +11,7 @@ import subprocess
 from typing import Any
 
 if IS_WINDOWS:
-    import psutil
+    from computer_mcp.core.win_process import get_process_name
 
     def get_accessibility_tree() -> dict[str, Any]:
         """Get Windows accessibility tree."""
@@ -28,7 +28,7 @@ if IS_WINDOWS:
         
         try:
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            proc = psutil.Process(pid)
+            process_name = get_process_name(pid)
             window_title = win32gui.GetWindowText(hwnd)
             
             # Get window bounds
@@ -42,9 +42,9 @@ if IS_WINDOWS:
             
             return {
                 "tree": {
-                    "name": window_title or proc.name(),
+                    "name": window_title or process_name,
                     "control_type": "Window",
-                    "process": proc.name(),
+                    "process": process_name,
                     "pid": pid,
                     "bounds": bounds,
                     "children": [{
@@ -114,6 +114,12 @@ elif IS_DARWIN:
             return {"error": f"macOS accessibility error: {str(e)}"}
 
 elif IS_LINUX:
+    from computer_mcp.core.x11 import get_active_window_title
+
+    if IS_LINUX_ACCESSIBILITY_MODULES_SUPPORTED:
+        # Bounded breadth-first walk (depth, fan-out and node limits)
+        from computer_mcp.actions.accessibility_tree import walk_accessibility_tree
+
     def get_accessibility_tree() -> dict[str, Any]:
         """Get Linux accessibility tree using AT-SPI."""
         if IS_LINUX_ACCESSIBILITY_MODULES_SUPPORTED:
@@ -126,66 +132,17 @@ elif IS_LINUX:
                 Atspi.init()
                 
                 desktop = Atspi.get_desktop(0)
-                
-                def _object_to_dict(obj) -> dict[str, Any]:
-                    """Convert AT-SPI object to dictionary."""
-                    try:
-                        name = obj.get_name() if hasattr(obj, 'get_name') else ""
-                        role = str(obj.get_role_name()) if hasattr(obj, 'get_role_name') else ""
-                        
-                        # Get bounds
-                        bounds = None
-                        try:
-                            if hasattr(obj, 'get_extents'):
-                                extents = obj.get_extents(Atspi.CoordType.SCREEN)
-                                bounds = {
-                                    "x": extents.x,
-                                    "y": extents.y,
-                                    "width": extents.width,
-                                    "height": extents.height
-                                }
-                        except:
-                            pass
-                        
-                        # Get children
-                        children = []
-                        try:
-                            if hasattr(obj, 'get_child_count') and hasattr(obj, 'get_child_at_index'):
-                                child_count = obj.get_child_count()
-                                for i in range(child_count):
-                                    child = obj.get_child_at_index(i)
-                                    if child:
-                                        children.append(_object_to_dict(child))
-                        except:
-                            pass
-                        
-                        return {
-                            "name": name,
-                            "role": role,
-                            "bounds": bounds,
-                            "children": children
-                        }
-                    except Exception as e:
-                        return {"error": f"Error processing object: {str(e)}"}
-                
-                tree = _object_to_dict(desktop)
-                return {"tree": tree}
+                return walk_accessibility_tree(desktop)
             except Exception as e:
                 return {"error": f"Linux AT-SPI error: {str(e)}"}
         else:
-            # Fallback to xdotool for basic window info
+            # Fallback to the active window title for basic window info
             try:
-                result = subprocess.run(
-                    ["xdotool", "getactivewindow", "getwindowname"],
-                    capture_output=True,
-                    text=True,
-                    timeout=1,
-                    check=False
-                )
-                if result.returncode == 0:
+                title = get_active_window_title(timeout=1)
+                if title is not None:
                     return {
                         "tree": {
-                            "name": result.stdout.strip(),
+                            "name": title,
                             "note": "Simplified tree - install python3-gi and gir1.2-atspi-2.0 for full accessibility tree"
                         }
                     }
@@ -49,6 +49,15 @@ def handle_set_config(
     if "observe_system_metrics" in arguments:
         state.config["observe_system_metrics"] = arguments["observe_system_metrics"]
     
+    if "precise_drag" in arguments:
+        state.config["precise_drag"] = arguments["precise_drag"]
+    
+    if "screenshot_format" in arguments:
+        state.config["screenshot_format"] = arguments["screenshot_format"]
+    
+    # Start/stop listeners to match the new observe flags
+    state.mark_config_changed()
+    
     if "terminal_output_mode" in arguments:
         terminal_output_mode = arguments["terminal_output_mode"]
         if terminal_output_mode not in ("chars", "text"):
@@ -56,7 +65,7 @@ def handle_set_config(
                 "error": "terminal_output_mode must be 'chars' or 'text'",
                 "action": "set_config"
             }
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         state.config["terminal_output_mode"] = terminal_output_mode
     
     result = {
@@ -64,5 +73,5 @@ def handle_set_config(
         "action": "set_config",
         "config": state.config.copy()
     }
-    return format_response(result, state)
+    return format_response(result, state, include_state=arguments.get("include_state", True))
 
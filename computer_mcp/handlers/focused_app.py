@@ -8,8 +8,16 @@ from typing import Any
 if IS_WINDOWS:
     import psutil
 
+    from computer_mcp.core.win_process import get_process_name
+
+    # (hwnd, pid, process name) of the last foreground window: the name
+    # lookup opens the process, and the foreground window rarely changes
+    # between observations
+    _last_foreground: tuple[int, int, str] | None = None
+
     def get_focused_app() -> dict[str, Any]:
         """Get current focused application on Windows."""
+        global _last_foreground
         try:
             import win32gui
             import win32process
@@ -19,20 +27,33 @@ if IS_WINDOWS:
         hwnd = win32gui.GetForegroundWindow()
         if hwnd:
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            try:
-                proc = psutil.Process(pid)
-                return {
-                    "name": proc.name(),
-                    "pid": pid,
-                    "title": win32gui.GetWindowText(hwnd)
-                }
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                return {"error": "Could not access process information"}
+            cached = _last_foreground
+            if cached is not None and cached[0] == hwnd and cached[1] == pid:
+                name = cached[2]
+            else:
+                try:
+                    name = get_process_name(pid)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    return {"error": "Could not access process information"}
+                _last_foreground = (hwnd, pid, name)
+            # The title is read every time; it changes without a new window
+            return {
+                "name": name,
+                "pid": pid,
+                "title": win32gui.GetWindowText(hwnd)
+            }
         return {"error": "No focused window"}
 
 elif IS_DARWIN:
+    from computer_mcp.core.applescript import run_applescript
+    from computer_mcp.core.appkit import get_frontmost_app
+
     def get_focused_app() -> dict[str, Any]:
         """Get current focused application on macOS."""
+        app = get_frontmost_app()
+        if app is not None and app["title"]:
+            return app
+        
         script = '''
         tell application "System Events"
             set frontApp to name of first application process whose frontmost is true
@@ -40,34 +61,26 @@ elif IS_DARWIN:
             return frontApp & "|" & appTitle
         end tell
         '''
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            timeout=2,
-            check=False
-        )
-        if result.returncode == 0:
-            parts = result.stdout.strip().split("|")
+        output = run_applescript(script, timeout=2)
+        if output is not None:
+            parts = output.split("|")
             return {
                 "name": parts[0] if parts else "Unknown",
                 "title": parts[1] if len(parts) > 1 else ""
             }
+        if app is not None:
+            return app
         return {"error": "Could not retrieve focused app"}
 
 elif IS_LINUX:
+    from computer_mcp.core.x11 import get_active_window_title
+
     def get_focused_app() -> dict[str, Any]:
         """Get current focused application on Linux."""
         try:
-            result = subprocess.run(
-                ["xdotool", "getactivewindow", "getwindowname"],
-                capture_output=True,
-                text=True,
-                timeout=1,
-                check=False
-            )
-            if result.returncode == 0:
-                return {"title": result.stdout.strip()}
+            title = get_active_window_title(timeout=1)
+            if title is not None:
+                return {"title": title}
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
         
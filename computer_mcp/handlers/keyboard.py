@@ -1,12 +1,15 @@
 """Keyboard action handlers."""
 
+from functools import lru_cache
 from typing import Any, Union
 
 from mcp.types import ImageContent, TextContent
 from pynput.keyboard import Key
 
-from computer_mcp.core.response import format_response
+from computer_mcp.core.fast_type import type_fast
+from computer_mcp.core.response import format_response, text_content, to_json
 from computer_mcp.core.state import ComputerState
+from computer_mcp.core.ui_changes import changes_ui
 from computer_mcp.core.utils import is_hotkey_disallowed, key_from_string
 
 from computer_mcp.actions.keyboard import (
@@ -17,16 +20,42 @@ from computer_mcp.actions.keyboard import (
 )
 
 
+# Left/right variants of each modifier, built once at import
+_MODIFIER_GROUPS = (
+    frozenset({Key.ctrl, Key.ctrl_l, Key.ctrl_r}),
+    frozenset({Key.alt, Key.alt_l, Key.alt_r}),
+    frozenset({Key.shift, Key.shift_l, Key.shift_r}),
+    frozenset({Key.cmd, Key.cmd_l, Key.cmd_r}),
+)
+_MODIFIER_KEYS = frozenset().union(*_MODIFIER_GROUPS)
+
+
 def _is_modifier_key(key) -> bool:
     """Check if a key is a modifier key."""
-    if isinstance(key, Key):
-        return key in (Key.ctrl, Key.ctrl_l, Key.ctrl_r,
-                       Key.alt, Key.alt_l, Key.alt_r,
-                       Key.shift, Key.shift_l, Key.shift_r,
-                       Key.cmd, Key.cmd_l, Key.cmd_r)
-    return False
+    return isinstance(key, Key) and key in _MODIFIER_KEYS
+
+
+@lru_cache(maxsize=256)
+def _key_result_json(action: str, key_str: str) -> str:
+    """Serialized result for a key action (constant per action/key)."""
+    return to_json({"success": True, "action": action, "key": key_str})
 
 
+def _key_response(
+    action: str,
+    key_str: str,
+    state: ComputerState,
+    include_state: bool
+) -> list[Union[TextContent, ImageContent]]:
+    """Format the response for a successful key_down/key_up/key_press."""
+    if not (include_state and state._any_observe):
+        # Nothing observed: the response text is fully determined by action/key
+        return [text_content(_key_result_json(action, key_str))]
+    result = {"success": True, "action": action, "key": key_str}
+    return format_response(result, state, include_state=include_state)
+
+
+@changes_ui
 def handle_type(
     arguments: dict[str, Any],
     state: ComputerState,
@@ -40,14 +69,16 @@ def handle_type(
     if window_id is not None:
         # Use window-targeted typing
         result = type_text_to_window(text, window_id)
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
-    # Default to global keyboard input
-    keyboard_controller.type(text)
+    # Default to global keyboard input, in one native call where supported
+    if not type_fast(text):
+        keyboard_controller.type(text)
     result = {"success": True, "action": "type", "text": text}
-    return format_response(result, state)
+    return format_response(result, state, include_state=arguments.get("include_state", True))
 
 
+@changes_ui
 def handle_key_down(
     arguments: dict[str, Any],
     state: ComputerState,
@@ -61,7 +92,7 @@ def handle_key_down(
     if window_id is not None:
         # Use window-targeted key down
         result = key_down_to_window(key_str, window_id)
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     # Default to global keyboard input
     key = key_from_string(key_str)
@@ -76,7 +107,7 @@ def handle_key_down(
                 "key": key_str,
                 "error": f"Hotkey is disallowed: {key_str}"
             }
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
     
     keyboard_controller.press(key)
     
@@ -84,10 +115,10 @@ def handle_key_down(
     if _is_modifier_key(key) or key_str.lower() in ("ctrl", "alt", "shift", "cmd", "control", "win", "windows", "meta"):
         state._held_keys_for_hotkeys.add(key)
     
-    result = {"success": True, "action": "key_down", "key": key_str}
-    return format_response(result, state)
+    return _key_response("key_down", key_str, state, arguments.get("include_state", True))
 
 
+@changes_ui
 def handle_key_up(
     arguments: dict[str, Any],
     state: ComputerState,
@@ -101,7 +132,7 @@ def handle_key_up(
     if window_id is not None:
         # Use window-targeted key up
         result = key_up_to_window(key_str, window_id)
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     # Default to global keyboard input
     key = key_from_string(key_str)
@@ -111,22 +142,15 @@ def handle_key_up(
     state._held_keys_for_hotkeys.discard(key)
     # Also remove any variant of the same modifier key (e.g., Key.ctrl_l vs Key.ctrl)
     if _is_modifier_key(key):
-        from pynput.keyboard import Key as PynputKey
-        modifier_groups = [
-            {PynputKey.ctrl, PynputKey.ctrl_l, PynputKey.ctrl_r},
-            {PynputKey.alt, PynputKey.alt_l, PynputKey.alt_r},
-            {PynputKey.shift, PynputKey.shift_l, PynputKey.shift_r},
-            {PynputKey.cmd, PynputKey.cmd_l, PynputKey.cmd_r},
-        ]
-        for group in modifier_groups:
+        for group in _MODIFIER_GROUPS:
             if key in group:
-                state._held_keys_for_hotkeys = {k for k in state._held_keys_for_hotkeys if k not in group}
+                state._held_keys_for_hotkeys -= group
                 break
     
-    result = {"success": True, "action": "key_up", "key": key_str}
-    return format_response(result, state)
+    return _key_response("key_up", key_str, state, arguments.get("include_state", True))
 
 
+@changes_ui
 def handle_key_press(
     arguments: dict[str, Any],
     state: ComputerState,
@@ -140,7 +164,7 @@ def handle_key_press(
     if window_id is not None:
         # Use window-targeted key press
         result = key_press_to_window(key_str, window_id)
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     # Default to global keyboard input
     key = key_from_string(key_str)
@@ -155,10 +179,9 @@ def handle_key_press(
                 "key": key_str,
                 "error": f"Hotkey is disallowed: {key_str}"
             }
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
     
     keyboard_controller.press(key)
     keyboard_controller.release(key)
-    result = {"success": True, "action": "key_press", "key": key_str}
-    return format_response(result, state)
+    return _key_response("key_press", key_str, state, arguments.get("include_state", True))
 
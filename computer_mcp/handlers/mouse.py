@@ -1,109 +1,123 @@
 """Mouse action handlers."""
 
-import time
+from functools import lru_cache
 from typing import Any, Union
 
 from mcp.types import ImageContent, TextContent
 
-from computer_mcp.core.response import format_response
+from computer_mcp.actions import mouse as mouse_actions
+from computer_mcp.core.response import format_response, text_content, to_json
 from computer_mcp.core.state import ComputerState
+from computer_mcp.core.ui_changes import changes_ui
 from computer_mcp.core.utils import button_from_string, constrain_mouse_coordinates
 
 
+@lru_cache(maxsize=64)
+def _button_result_json(action: str, button: str) -> str:
+    """Serialized result for a button action (constant per action/button)."""
+    return to_json({"success": True, "action": action, "button": button})
+
+
+def _button_response(
+    action: str,
+    button: str,
+    state: ComputerState,
+    include_state: bool
+) -> list[Union[TextContent, ImageContent]]:
+    """Format the response for a click/button action."""
+    if not (include_state and state._any_observe):
+        # Nothing observed: the response text is fully determined by action/button
+        return [text_content(_button_result_json(action, button))]
+    result = {"success": True, "action": action, "button": button}
+    return format_response(result, state, include_state=include_state)
+
+
+def _constrain_current_position(state: ComputerState, mouse_controller) -> None:
+    """Move the cursor inside the constrained window, if one is configured."""
+    constrain_window = state.config.get("constrain_mouse_to_window")
+    if not constrain_window:
+        return
+    # Read and convert the current position once
+    current_x, current_y = mouse_controller.position
+    current = (int(current_x), int(current_y))
+    constrained = constrain_mouse_coordinates(current[0], current[1], constrain_window)
+    if constrained != current:
+        # Position was constrained, move to constrained position first
+        mouse_controller.position = constrained
+
+
+@changes_ui
 def handle_click(
     arguments: dict[str, Any],
     state: ComputerState,
     mouse_controller
 ) -> list[Union[TextContent, ImageContent]]:
     """Handle click action."""
-    # Get current mouse position and constrain it if needed
-    current_pos = mouse_controller.position
-    constrain_window = state.config.get("constrain_mouse_to_window")
-    if constrain_window:
-        constrained_x, constrained_y = constrain_mouse_coordinates(
-            int(current_pos[0]), int(current_pos[1]), constrain_window
-        )
-        if (constrained_x, constrained_y) != (int(current_pos[0]), int(current_pos[1])):
-            # Position was constrained, move to constrained position first
-            mouse_controller.position = (constrained_x, constrained_y)
+    _constrain_current_position(state, mouse_controller)
     
-    button = button_from_string(arguments.get("button", "left"))
+    btn_str = arguments.get("button", "left")
+    button = button_from_string(btn_str)
     mouse_controller.click(button)
-    result = {"success": True, "action": "click", "button": arguments.get("button", "left")}
-    return format_response(result, state)
+    return _button_response("click", btn_str, state, arguments.get("include_state", True))
 
 
+@changes_ui
 def handle_double_click(
     arguments: dict[str, Any],
     state: ComputerState,
     mouse_controller
 ) -> list[Union[TextContent, ImageContent]]:
     """Handle double_click action."""
-    # Get current mouse position and constrain it if needed
-    current_pos = mouse_controller.position
-    constrain_window = state.config.get("constrain_mouse_to_window")
-    if constrain_window:
-        constrained_x, constrained_y = constrain_mouse_coordinates(
-            int(current_pos[0]), int(current_pos[1]), constrain_window
-        )
-        if (constrained_x, constrained_y) != (int(current_pos[0]), int(current_pos[1])):
-            # Position was constrained, move to constrained position first
-            mouse_controller.position = (constrained_x, constrained_y)
+    _constrain_current_position(state, mouse_controller)
     
-    button = button_from_string(arguments.get("button", "left"))
+    btn_str = arguments.get("button", "left")
+    button = button_from_string(btn_str)
     mouse_controller.click(button, 2)
-    result = {"success": True, "action": "double_click", "button": arguments.get("button", "left")}
-    return format_response(result, state)
+    return _button_response("double_click", btn_str, state, arguments.get("include_state", True))
 
 
+@changes_ui
 def handle_triple_click(
     arguments: dict[str, Any],
     state: ComputerState,
     mouse_controller
 ) -> list[Union[TextContent, ImageContent]]:
     """Handle triple_click action."""
-    # Get current mouse position and constrain it if needed
-    current_pos = mouse_controller.position
-    constrain_window = state.config.get("constrain_mouse_to_window")
-    if constrain_window:
-        constrained_x, constrained_y = constrain_mouse_coordinates(
-            int(current_pos[0]), int(current_pos[1]), constrain_window
-        )
-        if (constrained_x, constrained_y) != (int(current_pos[0]), int(current_pos[1])):
-            # Position was constrained, move to constrained position first
-            mouse_controller.position = (constrained_x, constrained_y)
+    _constrain_current_position(state, mouse_controller)
     
-    button = button_from_string(arguments.get("button", "left"))
+    btn_str = arguments.get("button", "left")
+    button = button_from_string(btn_str)
     mouse_controller.click(button, 3)
-    result = {"success": True, "action": "triple_click", "button": arguments.get("button", "left")}
-    return format_response(result, state)
+    return _button_response("triple_click", btn_str, state, arguments.get("include_state", True))
 
 
+@changes_ui
 def handle_button_down(
     arguments: dict[str, Any],
     state: ComputerState,
     mouse_controller
 ) -> list[Union[TextContent, ImageContent]]:
     """Handle button_down action."""
-    button = button_from_string(arguments.get("button", "left"))
+    btn_str = arguments.get("button", "left")
+    button = button_from_string(btn_str)
     mouse_controller.press(button)
-    result = {"success": True, "action": "button_down", "button": arguments.get("button", "left")}
-    return format_response(result, state)
+    return _button_response("button_down", btn_str, state, arguments.get("include_state", True))
 
 
+@changes_ui
 def handle_button_up(
     arguments: dict[str, Any],
     state: ComputerState,
     mouse_controller
 ) -> list[Union[TextContent, ImageContent]]:
     """Handle button_up action."""
-    button = button_from_string(arguments.get("button", "left"))
+    btn_str = arguments.get("button", "left")
+    button = button_from_string(btn_str)
     mouse_controller.release(button)
-    result = {"success": True, "action": "button_up", "button": arguments.get("button", "left")}
-    return format_response(result, state)
+    return _button_response("button_up", btn_str, state, arguments.get("include_state", True))
 
 
-def handle_drag(
+async def handle_drag(
     arguments: dict[str, Any],
     state: ComputerState,
     mouse_controller
@@ -111,33 +125,25 @@ def handle_drag(
     """Handle drag action."""
     start = arguments["start"]
     end = arguments["end"]
-    button = button_from_string(arguments.get("button", "left"))
     
     # Constrain start and end positions to window bounds if configured
     constrain_window = state.config.get("constrain_mouse_to_window")
     if constrain_window:
-        start_x, start_y = constrain_mouse_coordinates(
-            start["x"], start["y"], constrain_window
-        )
-        end_x, end_y = constrain_mouse_coordinates(
-            end["x"], end["y"], constrain_window
-        )
-    else:
-        start_x, start_y = start["x"], start["y"]
-        end_x, end_y = end["x"], end["y"]
-    
-    # Move to start, press button, move to end, release button
-    mouse_controller.position = (start_x, start_y)
-    mouse_controller.press(button)
-    time.sleep(0.01)  # Small delay
-    mouse_controller.position = (end_x, end_y)
-    time.sleep(0.01)
-    mouse_controller.release(button)
+        start_x, start_y = constrain_mouse_coordinates(start["x"], start["y"], constrain_window)
+        end_x, end_y = constrain_mouse_coordinates(end["x"], end["y"], constrain_window)
+        start, end = {"x": start_x, "y": start_y}, {"x": end_x, "y": end_y}
     
-    result = {"success": True, "action": "drag", "start": {"x": start_x, "y": start_y}, "end": {"x": end_x, "y": end_y}, "button": arguments.get("button", "left")}
-    return format_response(result, state)
+    result = await mouse_actions.drag_async(
+        start,
+        end,
+        button=arguments.get("button", "left"),
+        controller=mouse_controller,
+        precise=state.config.get("precise_drag", True)
+    )
+    return format_response(result, state, include_state=arguments.get("include_state", True))
 
 
+@changes_ui
 def handle_mouse_move(
     arguments: dict[str, Any],
     state: ComputerState,
@@ -153,6 +159,10 @@ def handle_mouse_move(
         x, y = constrain_mouse_coordinates(x, y, constrain_window)
     
     mouse_controller.position = (x, y)
+    include_state = arguments.get("include_state", True)
+    if not (include_state and state._any_observe) and type(x) is int and type(y) is int:
+        # Nothing observed: fill the coordinates into the constant response
+        return [text_content(f'{{"success":true,"action":"mouse_move","x":{x},"y":{y}}}')]
     result = {"success": True, "action": "mouse_move", "x": x, "y": y}
-    return format_response(result, state)
+    return format_response(result, state, include_state=include_state)
 
@@ -4,21 +4,27 @@ from typing import Any, Union
 
 from mcp.types import ImageContent, TextContent
 
-from computer_mcp.core.response import format_response
-from computer_mcp.core.screenshot import capture_screenshot
+from computer_mcp.core.response import format_response, text_content, to_json
+from computer_mcp.core.screenshot import capture_screenshot_async
 from computer_mcp.core.state import ComputerState
 
 
-def handle_screenshot(
-    arguments: dict[str, Any],  # noqa: ARG001
+async def handle_screenshot(
+    arguments: dict[str, Any],
     state: ComputerState,
     mouse_controller  # noqa: ARG001
 ) -> list[Union[TextContent, ImageContent]]:
     """Handle screenshot action."""
-    screenshot_data = capture_screenshot()
-    result_state = state.get_state(include_screenshot=False)  # Don't double-capture
+    try:
+        screenshot_data = await capture_screenshot_async(
+            force=arguments.get("force", False),
+            region=arguments.get("region"),
+            image_format=arguments.get("format") or state.config["screenshot_format"]
+        )
+    except ValueError as e:
+        return [text_content(to_json({"error": str(e), "action": "screenshot"}))]
     result = {"success": True, "action": "screenshot"}
-    result.update(result_state)
-    # Pass the pre-captured screenshot to avoid double capture
-    return format_response(result, state, screenshot_data=screenshot_data)
+    # Pass the pre-captured screenshot so format_response returns it as
+    # ImageContent and only collects the remaining state once
+    return format_response(result, state, screenshot_data=screenshot_data, include_state=arguments.get("include_state", True))
 
@@ -19,17 +19,17 @@ async def handle_spawn_terminal(
     shell = arguments.get("shell", False)
     
     result = await terminal_actions.spawn_terminal(command=command, shell=shell)
-    return format_response(result, state)
+    return format_response(result, state, include_state=arguments.get("include_state", True))
 
 
 def handle_list_terminals(
-    arguments: dict[str, Any],  # noqa: ARG001
+    arguments: dict[str, Any],
     state: ComputerState,
     controller  # noqa: ARG001
 ) -> list[Union[TextContent, ImageContent]]:
     """Handle list_terminals action."""
     result = terminal_actions.list_terminals()
-    return format_response(result, state)
+    return format_response(result, state, include_state=arguments.get("include_state", True))
 
 
 async def handle_send_terminal_text(
@@ -43,19 +43,19 @@ async def handle_send_terminal_text(
     
     if pid is None:
         result = {"error": "pid is required"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     if text is None:
         result = {"error": "text is required"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     terminal = terminal_actions.get_terminal(pid)
     if terminal is None:
         result = {"error": f"Terminal with PID {pid} not found"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     result = await terminal.send_text(text)
-    return format_response(result, state)
+    return format_response(result, state, include_state=arguments.get("include_state", True))
 
 
 async def handle_read_terminal_output(
@@ -68,12 +68,12 @@ async def handle_read_terminal_output(
     
     if pid is None:
         result = {"error": "pid is required"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     terminal = terminal_actions.get_terminal(pid)
     if terminal is None:
         result = {"error": f"Terminal with PID {pid} not found"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     # Get output mode from config (default: "chars")
     output_mode = state.config.get("terminal_output_mode", "chars")
@@ -82,7 +82,7 @@ async def handle_read_terminal_output(
     count = arguments.get("count")  # Optional max count
     
     result = await terminal.read_output(as_chars=as_chars, count=count)
-    return format_response(result, state)
+    return format_response(result, state, include_state=arguments.get("include_state", True))
 
 
 async def handle_send_terminal_key(
@@ -97,23 +97,23 @@ async def handle_send_terminal_key(
     
     if pid is None:
         result = {"error": "pid is required"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     if key is None:
         result = {"error": "key is required"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     if event not in ("down", "up"):
         result = {"error": "event must be 'down' or 'up'"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     terminal = terminal_actions.get_terminal(pid)
     if terminal is None:
         result = {"error": f"Terminal with PID {pid} not found"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     result = await terminal.send_key(key, event)
-    return format_response(result, state)
+    return format_response(result, state, include_state=arguments.get("include_state", True))
 
 
 def handle_close_terminal(
@@ -126,8 +126,8 @@ def handle_close_terminal(
     
     if pid is None:
         result = {"error": "pid is required"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
     
     result = terminal_actions.close_terminal(pid)
-    return format_response(result, state)
+    return format_response(result, state, include_state=arguments.get("include_state", True))
 
@@ -3,6 +3,7 @@
 from computer_mcp.core.platform import IS_DARWIN, IS_LINUX, IS_WINDOWS
 from computer_mcp.core.response import format_response
 from computer_mcp.core.state import ComputerState
+from computer_mcp.core.ui_changes import changes_ui
 
 from mcp.types import ImageContent, TextContent
 import subprocess
@@ -14,6 +15,9 @@ if IS_WINDOWS:
     import ctypes
     from ctypes import wintypes
 
+    from computer_mcp.core.screenshot import capture_screen_rect
+    from computer_mcp.core.win_process import get_process_name
+
     # DWM constants
     DWMWA_EXTENDED_FRAME_BOUNDS = 9
     _dwmapi = ctypes.windll.dwmapi
@@ -54,8 +58,7 @@ if IS_WINDOWS:
             
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
             try:
-                proc = psutil.Process(pid)
-                process_name = proc.name()
+                process_name = get_process_name(pid)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 process_name = "Unknown"
             
@@ -269,7 +272,7 @@ if IS_WINDOWS:
             import win32gui
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         windows = []
         def enum_callback(hwnd, window_list):
@@ -281,8 +284,9 @@ if IS_WINDOWS:
         win32gui.EnumWindows(enum_callback, windows)
         
         result = {"success": True, "action": "list_windows", "windows": windows, "count": len(windows)}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_switch_to_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -294,7 +298,7 @@ if IS_WINDOWS:
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = None
         if "hwnd" in arguments:
@@ -303,10 +307,10 @@ if IS_WINDOWS:
             hwnd = _find_window_by_title(arguments["title"])
             if not hwnd:
                 result = {"error": f"Window with title pattern '{arguments['title']}' not found"}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
         else:
             result = {"error": "Either 'hwnd' or 'title' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             # Restore if minimized
@@ -316,11 +320,12 @@ if IS_WINDOWS:
             
             window_data = _get_window_data(hwnd)
             result = {"success": True, "action": "switch_to_window", "window": window_data}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to switch to window: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_move_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -332,12 +337,12 @@ if IS_WINDOWS:
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         x = arguments.get("x")
         y = arguments.get("y")
@@ -346,7 +351,7 @@ if IS_WINDOWS:
         
         if x is None or y is None:
             result = {"error": "'x' and 'y' parameters are required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             _set_dpi_aware_win()
@@ -363,11 +368,12 @@ if IS_WINDOWS:
             
             window_data = _get_window_data(hwnd)
             result = {"success": True, "action": "move_window", "window": window_data}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to move window: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_resize_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -379,7 +385,7 @@ if IS_WINDOWS:
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         width = arguments.get("width")
@@ -387,11 +393,11 @@ if IS_WINDOWS:
         
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         if width is None or height is None:
             result = {"error": "'width' and 'height' parameters are required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             _set_dpi_aware_win()
@@ -407,11 +413,12 @@ if IS_WINDOWS:
             
             window_data = _get_window_data(hwnd)
             result = {"success": True, "action": "resize_window", "window": window_data}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to resize window: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_minimize_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -423,22 +430,23 @@ if IS_WINDOWS:
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
             window_data = _get_window_data(hwnd)
             result = {"success": True, "action": "minimize_window", "window": window_data}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to minimize window: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_maximize_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -450,22 +458,23 @@ if IS_WINDOWS:
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
             window_data = _get_window_data(hwnd)
             result = {"success": True, "action": "maximize_window", "window": window_data}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to maximize window: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_restore_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -477,22 +486,23 @@ if IS_WINDOWS:
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
             window_data = _get_window_data(hwnd)
             result = {"success": True, "action": "restore_window", "window": window_data}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to restore window: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_set_window_topmost(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -504,14 +514,14 @@ if IS_WINDOWS:
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         topmost = arguments.get("topmost", True)
         
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             hwnd_insert_after = win32con.HWND_TOPMOST if topmost else win32con.HWND_NOTOPMOST
@@ -520,10 +530,10 @@ if IS_WINDOWS:
             
             window_data = _get_window_data(hwnd)
             result = {"success": True, "action": "set_window_topmost", "topmost": topmost, "window": window_data}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to set window topmost: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def handle_get_window_info(
         arguments: dict[str, Any],
@@ -535,21 +545,22 @@ if IS_WINDOWS:
             import win32gui
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         window_data = _get_window_data(hwnd)
         if not window_data:
             result = {"error": "Invalid window handle or window not accessible"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         result = {"success": True, "action": "get_window_info", "window": window_data}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_close_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -561,22 +572,22 @@ if IS_WINDOWS:
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             # Post WM_CLOSE message to gracefully close the window
             win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
             
             result = {"success": True, "action": "close_window", "hwnd": hwnd}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to close window: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def _get_screen_dimensions() -> tuple[int, int]:
         """Get primary screen dimensions (legacy - use _get_work_area_for_window for better results)."""
@@ -589,6 +600,7 @@ if IS_WINDOWS:
             # Fallback
             return 1920, 1080
 
+    @changes_ui
     def handle_snap_window_left(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -600,12 +612,12 @@ if IS_WINDOWS:
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             _set_dpi_aware_win()
@@ -627,11 +639,12 @@ if IS_WINDOWS:
             
             window_data = _get_window_data(hwnd)
             result = {"success": True, "action": "snap_window_left", "window": window_data}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to snap window left: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_right(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -643,12 +656,12 @@ if IS_WINDOWS:
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             _set_dpi_aware_win()
@@ -670,11 +683,12 @@ if IS_WINDOWS:
             
             window_data = _get_window_data(hwnd)
             result = {"success": True, "action": "snap_window_right", "window": window_data}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to snap window right: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_top(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -686,12 +700,12 @@ if IS_WINDOWS:
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             _set_dpi_aware_win()
@@ -713,11 +727,12 @@ if IS_WINDOWS:
             
             window_data = _get_window_data(hwnd)
             result = {"success": True, "action": "snap_window_top", "window": window_data}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to snap window top: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_bottom(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -729,12 +744,12 @@ if IS_WINDOWS:
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window management support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             _set_dpi_aware_win()
@@ -756,10 +771,10 @@ if IS_WINDOWS:
             
             window_data = _get_window_data(hwnd)
             result = {"success": True, "action": "snap_window_bottom", "window": window_data}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to snap window bottom: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def handle_screenshot_window(
         arguments: dict[str, Any],
@@ -769,22 +784,21 @@ if IS_WINDOWS:
         """Handle screenshot_window action."""
         try:
             import win32gui
-            import win32ui
             import win32con
         except ImportError:
             result = {"error": "pywin32 not installed", "note": "Install pywin32 for Windows window screenshot support"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         hwnd = arguments.get("hwnd")
         if not hwnd:
             result = {"error": "'hwnd' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             # Check if window exists and is valid
             if not win32gui.IsWindow(hwnd):
                 result = {"error": "Invalid window handle"}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             # Bring window to foreground before capturing
             # Restore if minimized, then activate
@@ -802,7 +816,7 @@ if IS_WINDOWS:
             
             if width <= 0 or height <= 0:
                 result = {"error": "Window has invalid dimensions"}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             # Get client area bounds (excluding title bar, borders)
             client_rect = win32gui.GetClientRect(hwnd)
@@ -810,91 +824,17 @@ if IS_WINDOWS:
             client_height = client_rect[3] - client_rect[1]
             
             # Get client area coordinates in screen space (for screen capture)
-            client_point_left_top = win32gui.ClientToScreen(hwnd, (0, 0))
-            client_point_right_bottom = win32gui.ClientToScreen(hwnd, (client_width, client_height))
-            
-            client_screen_x = client_point_left_top[0]
-            client_screen_y = client_point_left_top[1]
-            
-            # Create a memory DC compatible with the screen
-            screen_dc = win32gui.GetDC(0)
-            mem_dc = win32ui.CreateDCFromHandle(screen_dc)
-            save_dc = mem_dc.CreateCompatibleDC()
-            
-            # Create bitmap for the exact client area size
-            bitmap = win32ui.CreateBitmap()
-            bitmap.CreateCompatibleBitmap(mem_dc, client_width, client_height)
-            save_dc.SelectObject(bitmap)
-            
-            # Capture from screen at the window's client area coordinates
-            # This directly captures the screen region where the window's client area is
-            save_dc.BitBlt(
-                (0, 0),
-                (client_width, client_height),
-                mem_dc,
-                (client_screen_x, client_screen_y),
-                win32con.SRCCOPY
-            )
-            
-            # Convert to PIL Image
-            from PIL import Image
-            import base64
-            from io import BytesIO
-            
-            bmp_info = bitmap.GetInfo()
-            bmp_str = bitmap.GetBitmapBits(True)
-            
-            # Get actual bitmap dimensions
-            bmp_width = bmp_info["bmWidth"]
-            bmp_height = bmp_info["bmHeight"]
-            
-            # Create image from bitmap data
-            img = Image.frombuffer(
-                "RGB",
-                (bmp_width, bmp_height),
-                bmp_str,
-                "raw",
-                "BGRX",
-                0,
-                1
-            )
+            client_screen_x, client_screen_y = win32gui.ClientToScreen(hwnd, (0, 0))
             
-            # The bitmap should already be exactly client_width x client_height since we
-            # created it with those dimensions and BitBlt'd the exact region
-            # Just verify and fix if needed
-            if img.size != (client_width, client_height):
-                if img.size[0] >= client_width and img.size[1] >= client_height:
-                    img = img.crop((0, 0, client_width, client_height))
-                else:
-                    img = img.resize((client_width, client_height), Image.Resampling.LANCZOS)
-            
-            actual_width = client_width
-            actual_height = client_height
-            
-            # Cleanup
-            win32gui.DeleteObject(bitmap.GetHandle())
-            save_dc.DeleteDC()
-            mem_dc.DeleteDC()
-            win32gui.ReleaseDC(0, screen_dc)
-            
-            # Convert to base64
-            buffer = BytesIO()
-            img.save(buffer, format="PNG")
-            img_bytes = buffer.getvalue()
-            img_base64 = base64.b64encode(img_bytes).decode("utf-8")
-            
-            screenshot_data = {
-                "format": "base64_png",
-                "data": img_base64,
-                "width": actual_width,
-                "height": actual_height
-            }
+            # Grab the client area with the shared mss grabber instead of
+            # creating and tearing down DCs and a bitmap on every call
+            screenshot_data = capture_screen_rect(client_screen_x, client_screen_y, client_width, client_height)
             
             result = {"success": True, "action": "screenshot_window", "hwnd": hwnd}
-            return format_response(result, state, screenshot_data=screenshot_data)
+            return format_response(result, state, screenshot_data=screenshot_data, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to screenshot window: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def handle_list_virtual_desktops(
         arguments: dict[str, Any],
@@ -916,7 +856,7 @@ if IS_WINDOWS:
                     "desktops": [{"id": 0, "name": "Desktop 1", "is_current": True}],
                     "note": "VirtualDesktopAccessor.dll not available. Basic single desktop returned."
                 }
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             count = get_desktop_count()
             current = get_current_desktop_number()
@@ -928,7 +868,7 @@ if IS_WINDOWS:
                     "desktops": [{"id": 0, "name": "Desktop 1", "is_current": True}],
                     "note": "Failed to get desktop count. Basic single desktop returned."
                 }
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             desktops = []
             for i in range(count):
@@ -943,11 +883,12 @@ if IS_WINDOWS:
                 "action": "list_virtual_desktops",
                 "desktops": desktops
             }
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to list virtual desktops: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_switch_virtual_desktop(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -966,7 +907,7 @@ if IS_WINDOWS:
             
             if desktop_id is None and name is None:
                 result = {"error": "Either 'desktop_id' or 'name' parameter is required"}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             # Extract ID from name if needed
             if name and desktop_id is None:
@@ -975,14 +916,14 @@ if IS_WINDOWS:
                     desktop_id = int(name.split()[-1]) - 1
                 except (ValueError, IndexError):
                     result = {"error": f"Could not parse desktop ID from name: {name}"}
-                    return format_response(result, state)
+                    return format_response(result, state, include_state=arguments.get("include_state", True))
             
             if not is_available():
                 result = {
                     "error": "Virtual desktop switching requires VirtualDesktopAccessor.dll",
                     "note": "VirtualDesktopAccessor.dll not found. Please ensure it's available in the resources directory."
                 }
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             # Validate desktop number
             count = get_desktop_count()
@@ -990,7 +931,7 @@ if IS_WINDOWS:
                 result = {
                     "error": f"Desktop number {desktop_id} is out of range. Available desktops: 0-{count - 1}"
                 }
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             # Switch to the desktop
             success = go_to_desktop_number(desktop_id)
@@ -1003,11 +944,12 @@ if IS_WINDOWS:
                     "note": "The desktop number may be invalid or the operation failed."
                 }
             
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to switch virtual desktop: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_move_window_to_virtual_desktop(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1026,18 +968,18 @@ if IS_WINDOWS:
             
             if not hwnd:
                 result = {"error": "'hwnd' parameter is required"}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             if desktop_id is None:
                 result = {"error": "'desktop_id' parameter is required"}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             if not is_available():
                 result = {
                     "error": "Virtual desktop window moving requires VirtualDesktopAccessor.dll",
                     "note": "VirtualDesktopAccessor.dll not found. Please ensure it's available in the resources directory."
                 }
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             # Validate desktop number
             count = get_desktop_count()
@@ -1045,7 +987,7 @@ if IS_WINDOWS:
                 result = {
                     "error": f"Desktop number {desktop_id} is out of range. Available desktops: 0-{count - 1}"
                 }
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             # Validate window handle
             if not isinstance(hwnd, int):
@@ -1053,7 +995,7 @@ if IS_WINDOWS:
                     hwnd = int(hwnd)
                 except (ValueError, TypeError):
                     result = {"error": f"Invalid window handle: {hwnd}"}
-                    return format_response(result, state)
+                    return format_response(result, state, include_state=arguments.get("include_state", True))
             
             # Move the window
             success = move_window_to_desktop_number(hwnd, desktop_id)
@@ -1071,10 +1013,10 @@ if IS_WINDOWS:
                     "note": "The window handle may be invalid or the desktop number may be out of range."
                 }
             
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to move window to virtual desktop: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
 elif IS_DARWIN:
     # macOS placeholder implementations
@@ -1085,8 +1027,9 @@ elif IS_DARWIN:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle list_windows action (macOS - not yet implemented)."""
         result = {"error": "Window management not yet implemented for macOS"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_switch_to_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1094,8 +1037,9 @@ elif IS_DARWIN:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle switch_to_window action (macOS - not yet implemented)."""
         result = {"error": "Window management not yet implemented for macOS"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_move_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1103,8 +1047,9 @@ elif IS_DARWIN:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle move_window action (macOS - not yet implemented)."""
         result = {"error": "Window management not yet implemented for macOS"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_resize_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1112,8 +1057,9 @@ elif IS_DARWIN:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle resize_window action (macOS - not yet implemented)."""
         result = {"error": "Window management not yet implemented for macOS"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_minimize_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1121,8 +1067,9 @@ elif IS_DARWIN:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle minimize_window action (macOS - not yet implemented)."""
         result = {"error": "Window management not yet implemented for macOS"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_maximize_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1130,8 +1077,9 @@ elif IS_DARWIN:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle maximize_window action (macOS - not yet implemented)."""
         result = {"error": "Window management not yet implemented for macOS"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_restore_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1139,8 +1087,9 @@ elif IS_DARWIN:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle restore_window action (macOS - not yet implemented)."""
         result = {"error": "Window management not yet implemented for macOS"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_set_window_topmost(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1148,7 +1097,7 @@ elif IS_DARWIN:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle set_window_topmost action (macOS - not yet implemented)."""
         result = {"error": "Window management not yet implemented for macOS"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def handle_get_window_info(
         arguments: dict[str, Any],
@@ -1157,8 +1106,9 @@ elif IS_DARWIN:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle get_window_info action (macOS - not yet implemented)."""
         result = {"error": "Window management not yet implemented for macOS"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_close_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1168,7 +1118,7 @@ elif IS_DARWIN:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         script = f'''
         tell application "System Events"
@@ -1196,11 +1146,12 @@ elif IS_DARWIN:
                 result = {"success": True, "action": "close_window", "window_id": window_id}
             else:
                 result = {"error": "Failed to close window"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to close window: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_left(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1210,7 +1161,7 @@ elif IS_DARWIN:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         # Use visibleFrame to account for dock and menu bar
         script = f'''
@@ -1233,11 +1184,12 @@ elif IS_DARWIN:
         try:
             subprocess.run(["osascript", "-e", script], check=False, timeout=2)
             result = {"success": True, "action": "snap_window_left", "window_id": window_id}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to snap window left: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_right(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1247,7 +1199,7 @@ elif IS_DARWIN:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         # Use visibleFrame to account for dock and menu bar
         script = f'''
@@ -1269,11 +1221,12 @@ elif IS_DARWIN:
         try:
             subprocess.run(["osascript", "-e", script], check=False, timeout=2)
             result = {"success": True, "action": "snap_window_right", "window_id": window_id}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to snap window right: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_top(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1283,7 +1236,7 @@ elif IS_DARWIN:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         # Use visibleFrame to account for dock and menu bar
         script = f'''
@@ -1305,11 +1258,12 @@ elif IS_DARWIN:
         try:
             subprocess.run(["osascript", "-e", script], check=False, timeout=2)
             result = {"success": True, "action": "snap_window_top", "window_id": window_id}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to snap window top: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_bottom(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1319,7 +1273,7 @@ elif IS_DARWIN:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         # Use visibleFrame to account for dock and menu bar
         script = f'''
@@ -1342,10 +1296,10 @@ elif IS_DARWIN:
         try:
             subprocess.run(["osascript", "-e", script], check=False, timeout=2)
             result = {"success": True, "action": "snap_window_bottom", "window_id": window_id}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to snap window bottom: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def handle_screenshot_window(
         arguments: dict[str, Any],
@@ -1356,7 +1310,7 @@ elif IS_DARWIN:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             # First, bring the window to front by finding it across all processes
@@ -1406,7 +1360,7 @@ elif IS_DARWIN:
             
             if result_bounds.returncode != 0:
                 result = {"error": "Failed to get window bounds"}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             # Parse bounds: {left, top, right, bottom}
             bounds_str = result_bounds.stdout.strip()
@@ -1445,13 +1399,13 @@ elif IS_DARWIN:
                 }
                 
                 result = {"success": True, "action": "screenshot_window", "window_id": window_id}
-                return format_response(result, state, screenshot_data=screenshot_data)
+                return format_response(result, state, screenshot_data=screenshot_data, include_state=arguments.get("include_state", True))
             else:
                 result = {"error": "Failed to capture window screenshot"}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to screenshot window: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def handle_list_virtual_desktops(
         arguments: dict[str, Any],
@@ -1485,11 +1439,12 @@ elif IS_DARWIN:
                 "desktops": [{"id": 0, "name": "Space 1", "is_current": True}],
                 "note": "macOS Spaces enumeration is limited via AppleScript. Multiple Spaces may exist but are not easily enumerated."
             }
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to list virtual desktops: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_switch_virtual_desktop(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1501,7 +1456,7 @@ elif IS_DARWIN:
         
         if desktop_id is None and name is None:
             result = {"error": "Either 'desktop_id' or 'name' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         # Extract ID from name if needed
         if name and desktop_id is None:
@@ -1509,7 +1464,7 @@ elif IS_DARWIN:
                 desktop_id = int(name.split()[-1]) - 1
             except (ValueError, IndexError):
                 result = {"error": f"Could not parse desktop ID from name: {name}"}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
         
         # Use Control+Left/Right arrow keys to switch Spaces
         from pynput.keyboard import Controller as KeyboardController, Key
@@ -1524,8 +1479,9 @@ elif IS_DARWIN:
             "desktop_id": desktop_id,
             "note": "macOS Spaces switching via script is limited. Use Control+Left/Right manually or Mission Control API."
         }
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_move_window_to_virtual_desktop(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1537,11 +1493,11 @@ elif IS_DARWIN:
         
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         if desktop_id is None:
             result = {"error": "'desktop_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         result = {
             "success": True,
@@ -1550,7 +1506,7 @@ elif IS_DARWIN:
             "desktop_id": desktop_id,
             "note": "macOS Spaces window moving requires Mission Control API which is not easily accessible via AppleScript."
         }
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
 elif IS_LINUX:
     # Linux placeholder implementations
@@ -1561,8 +1517,9 @@ elif IS_LINUX:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle list_windows action (Linux - not yet implemented)."""
         result = {"error": "Window management not yet implemented for Linux"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_switch_to_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1570,8 +1527,9 @@ elif IS_LINUX:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle switch_to_window action (Linux - not yet implemented)."""
         result = {"error": "Window management not yet implemented for Linux"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_move_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1579,8 +1537,9 @@ elif IS_LINUX:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle move_window action (Linux - not yet implemented)."""
         result = {"error": "Window management not yet implemented for Linux"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_resize_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1588,8 +1547,9 @@ elif IS_LINUX:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle resize_window action (Linux - not yet implemented)."""
         result = {"error": "Window management not yet implemented for Linux"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_minimize_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1597,8 +1557,9 @@ elif IS_LINUX:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle minimize_window action (Linux - not yet implemented)."""
         result = {"error": "Window management not yet implemented for Linux"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_maximize_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1606,8 +1567,9 @@ elif IS_LINUX:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle maximize_window action (Linux - not yet implemented)."""
         result = {"error": "Window management not yet implemented for Linux"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_restore_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1615,8 +1577,9 @@ elif IS_LINUX:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle restore_window action (Linux - not yet implemented)."""
         result = {"error": "Window management not yet implemented for Linux"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_set_window_topmost(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1624,7 +1587,7 @@ elif IS_LINUX:
     ) -> list[Union[TextContent, ImageContent]]:
         """Handle set_window_topmost action (Linux - not yet implemented)."""
         result = {"error": "Window management not yet implemented for Linux"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def handle_get_window_info(
         arguments: dict[str, Any],
@@ -1635,7 +1598,7 @@ elif IS_LINUX:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             # Get window info using xdotool
@@ -1652,14 +1615,15 @@ elif IS_LINUX:
                 result = {"success": True, "action": "get_window_info", "window_id": window_id, "info": result_xdotool.stdout}
             else:
                 result = {"error": "Failed to get window info"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except FileNotFoundError:
             result = {"error": "xdotool not installed", "note": "Install xdotool: sudo apt install xdotool"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to get window info: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_close_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1669,19 +1633,20 @@ elif IS_LINUX:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             subprocess.run(["xdotool", "windowclose", str(window_id)], timeout=2, check=False)
             result = {"success": True, "action": "close_window", "window_id": window_id}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except FileNotFoundError:
             result = {"error": "xdotool not installed", "note": "Install xdotool: sudo apt install xdotool"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to close window: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_left(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1691,7 +1656,7 @@ elif IS_LINUX:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             # Get screen size
@@ -1717,14 +1682,15 @@ elif IS_LINUX:
                 result = {"success": True, "action": "snap_window_left", "window_id": window_id}
             else:
                 result = {"error": "Failed to get screen dimensions"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except FileNotFoundError:
             result = {"error": "xdotool not installed", "note": "Install xdotool: sudo apt install xdotool"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to snap window left: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_right(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1734,7 +1700,7 @@ elif IS_LINUX:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             result_screen = subprocess.run(
@@ -1760,14 +1726,15 @@ elif IS_LINUX:
                 result = {"success": True, "action": "snap_window_right", "window_id": window_id}
             else:
                 result = {"error": "Failed to get screen dimensions"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except FileNotFoundError:
             result = {"error": "xdotool not installed", "note": "Install xdotool: sudo apt install xdotool"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to snap window right: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_top(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1777,7 +1744,7 @@ elif IS_LINUX:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             result_screen = subprocess.run(
@@ -1802,14 +1769,15 @@ elif IS_LINUX:
                 result = {"success": True, "action": "snap_window_top", "window_id": window_id}
             else:
                 result = {"error": "Failed to get screen dimensions"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except FileNotFoundError:
             result = {"error": "xdotool not installed", "note": "Install xdotool: sudo apt install xdotool"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to snap window top: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_bottom(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -1819,7 +1787,7 @@ elif IS_LINUX:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             result_screen = subprocess.run(
@@ -1845,13 +1813,13 @@ elif IS_LINUX:
                 result = {"success": True, "action": "snap_window_bottom", "window_id": window_id}
             else:
                 result = {"error": "Failed to get screen dimensions"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except FileNotFoundError:
             result = {"error": "xdotool not installed", "note": "Install xdotool: sudo apt install xdotool"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to snap window bottom: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def handle_screenshot_window(
         arguments: dict[str, Any],
@@ -1862,7 +1830,7 @@ elif IS_LINUX:
         window_id = arguments.get("hwnd") or arguments.get("window_id")
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             import base64
@@ -1892,7 +1860,7 @@ elif IS_LINUX:
             
             if result_geom.returncode != 0:
                 result = {"error": "Failed to get window geometry"}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             # Parse geometry and capture
             # Use import or xwd to capture window
@@ -1933,16 +1901,16 @@ elif IS_LINUX:
                 }
                 
                 result = {"success": True, "action": "screenshot_window", "window_id": window_id}
-                return format_response(result, state, screenshot_data=screenshot_data)
+                return format_response(result, state, screenshot_data=screenshot_data, include_state=arguments.get("include_state", True))
             except Exception:
                 result = {"error": "Failed to process window screenshot. Install ImageMagick (import) or xwd+imagemagick (convert)"}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
         except FileNotFoundError:
             result = {"error": "Window screenshot tools not available", "note": "Install ImageMagick: sudo apt install imagemagick"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to screenshot window: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def handle_list_virtual_desktops(
         arguments: dict[str, Any],
@@ -1972,7 +1940,7 @@ elif IS_LINUX:
                     })
                 
                 result = {"success": True, "action": "list_virtual_desktops", "desktops": desktops}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             else:
                 # Fallback: try xdotool
                 result_xdotool = subprocess.run(
@@ -1988,14 +1956,15 @@ elif IS_LINUX:
                     current = int(subprocess.run(["xdotool", "get_desktop"], capture_output=True, text=True).stdout.strip())
                     desktops = [{"id": i, "name": f"Desktop {i + 1}", "is_current": (i == current)} for i in range(count)]
                     result = {"success": True, "action": "list_virtual_desktops", "desktops": desktops}
-                    return format_response(result, state)
+                    return format_response(result, state, include_state=arguments.get("include_state", True))
                 else:
                     result = {"error": "Virtual desktop enumeration requires wmctrl or xdotool", "note": "Install: sudo apt install wmctrl or sudo apt install xdotool"}
-                    return format_response(result, state)
+                    return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to list virtual desktops: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_switch_virtual_desktop(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2007,14 +1976,14 @@ elif IS_LINUX:
         
         if desktop_id is None and name is None:
             result = {"error": "Either 'desktop_id' or 'name' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         if name and desktop_id is None:
             try:
                 desktop_id = int(name.split()[-1]) - 1
             except (ValueError, IndexError):
                 result = {"error": f"Could not parse desktop ID from name: {name}"}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             # Try wmctrl first
@@ -2026,7 +1995,7 @@ elif IS_LINUX:
             
             if result_wmctrl.returncode == 0:
                 result = {"success": True, "action": "switch_virtual_desktop", "desktop_id": desktop_id}
-                return format_response(result, state)
+                return format_response(result, state, include_state=arguments.get("include_state", True))
             
             # Fallback: xdotool
             result_xdotool = subprocess.run(
@@ -2039,14 +2008,15 @@ elif IS_LINUX:
                 result = {"success": True, "action": "switch_virtual_desktop", "desktop_id": desktop_id}
             else:
                 result = {"error": "Virtual desktop switching requires wmctrl or xdotool", "note": "Install: sudo apt install wmctrl or sudo apt install xdotool"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except FileNotFoundError:
             result = {"error": "Virtual desktop switching requires wmctrl or xdotool", "note": "Install: sudo apt install wmctrl or sudo apt install xdotool"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to switch virtual desktop: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_move_window_to_virtual_desktop(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2058,11 +2028,11 @@ elif IS_LINUX:
         
         if not window_id:
             result = {"error": "'hwnd' or 'window_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         if desktop_id is None:
             result = {"error": "'desktop_id' parameter is required"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         
         try:
             # Use wmctrl to move window
@@ -2076,13 +2046,13 @@ elif IS_LINUX:
                 result = {"success": True, "action": "move_window_to_virtual_desktop", "window_id": window_id, "desktop_id": desktop_id}
             else:
                 result = {"error": "Moving windows to virtual desktops requires wmctrl", "note": "Install: sudo apt install wmctrl"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except FileNotFoundError:
             result = {"error": "Moving windows to virtual desktops requires wmctrl", "note": "Install: sudo apt install wmctrl"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
         except Exception as e:
             result = {"error": f"Failed to move window to virtual desktop: {str(e)}"}
-            return format_response(result, state)
+            return format_response(result, state, include_state=arguments.get("include_state", True))
 
 else:
     # Unsupported platform
@@ -2094,8 +2064,9 @@ else:
         """Handle list_windows action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_switch_to_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2104,8 +2075,9 @@ else:
         """Handle switch_to_window action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_move_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2114,8 +2086,9 @@ else:
         """Handle move_window action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_resize_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2124,8 +2097,9 @@ else:
         """Handle resize_window action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_minimize_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2134,8 +2108,9 @@ else:
         """Handle minimize_window action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_maximize_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2144,8 +2119,9 @@ else:
         """Handle maximize_window action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_restore_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2154,8 +2130,9 @@ else:
         """Handle restore_window action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_set_window_topmost(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2164,7 +2141,7 @@ else:
         """Handle set_window_topmost action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def handle_get_window_info(
         arguments: dict[str, Any],
@@ -2174,8 +2151,9 @@ else:
         """Handle get_window_info action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_close_window(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2184,8 +2162,9 @@ else:
         """Handle close_window action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_left(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2194,8 +2173,9 @@ else:
         """Handle snap_window_left action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_right(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2204,8 +2184,9 @@ else:
         """Handle snap_window_right action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_top(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2214,8 +2195,9 @@ else:
         """Handle snap_window_top action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_snap_window_bottom(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2224,7 +2206,7 @@ else:
         """Handle snap_window_bottom action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def handle_screenshot_window(
         arguments: dict[str, Any],
@@ -2234,7 +2216,7 @@ else:
         """Handle screenshot_window action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
     def handle_list_virtual_desktops(
         arguments: dict[str, Any],
@@ -2244,8 +2226,9 @@ else:
         """Handle list_virtual_desktops action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_switch_virtual_desktop(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2254,8 +2237,9 @@ else:
         """Handle switch_virtual_desktop action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
+    @changes_ui
     def handle_move_window_to_virtual_desktop(
         arguments: dict[str, Any],
         state: ComputerState,
@@ -2264,5 +2248,5 @@ else:
         """Handle move_window_to_virtual_desktop action (unsupported platform)."""
         import platform
         result = {"error": f"Unsupported platform: {platform.system()}"}
-        return format_response(result, state)
+        return format_response(result, state, include_state=arguments.get("include_state", True))
 
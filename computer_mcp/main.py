@@ -5,8 +5,7 @@ Main entry point for the MCP server (stdio mode, default).
 For CLI and HTTP/SSE modes, use: python -m computer_mcp
 """
 
-import asyncio
-
+from computer_mcp.core import event_loop
 from computer_mcp.mcp import run_stdio
 
 
@@ -17,7 +16,7 @@ async def main():
 
 def entry_point():
     """Synchronous entry point for setuptools console script."""
-    asyncio.run(main())
+    event_loop.run(main())
 
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 """MCP server adapter - supports stdio and HTTP/SSE transport modes."""
 
 import asyncio
-import json
-from typing import Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, Union
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -17,7 +18,7 @@ from computer_mcp.actions import (
     window as window_actions,
     config as config_actions,
 )
-from computer_mcp.core.response import format_response
+from computer_mcp.core.response import format_response_async, text_content, to_json
 from computer_mcp.core.state import ComputerState
 
 
@@ -26,729 +27,963 @@ computer_state = ComputerState()
 mouse_controller = MouseController()
 keyboard_controller = KeyboardController()
 
+# Mouse/keyboard injection runs on one dedicated thread: events stay in order,
+# and a slow pynput backend does not stall the event loop serving requests
+_INPUT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="computer-mcp-input")
+
 # Initialize MCP server
 server = Server("computer-mcp")
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="click",
-            description="Perform a mouse click at the current cursor position",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "middle", "right"],
-                        "description": "Mouse button to click",
-                        "default": "left"
-                    }
+# Shared by every tool that takes a mouse button
+_MOUSE_BUTTONS = ["left", "middle", "right"]
+
+# Tool definitions are static, so build them once at import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="click",
+        description="Perform a mouse click at the current cursor position",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "button": {
+                    "type": "string",
+                    "enum": _MOUSE_BUTTONS,
+                    "description": "Mouse button to click",
+                    "default": "left"
                 }
             }
-        ),
-        Tool(
-            name="double_click",
-            description="Perform a double mouse click at the current cursor position",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "middle", "right"],
-                        "description": "Mouse button to click",
-                        "default": "left"
-                    }
+        }
+    ),
+    Tool(
+        name="double_click",
+        description="Perform a double mouse click at the current cursor position",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "button": {
+                    "type": "string",
+                    "enum": _MOUSE_BUTTONS,
+                    "description": "Mouse button to click",
+                    "default": "left"
                 }
             }
-        ),
-        Tool(
-            name="triple_click",
-            description="Perform a triple mouse click at the current cursor position",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "middle", "right"],
-                        "description": "Mouse button to click",
-                        "default": "left"
-                    }
+        }
+    ),
+    Tool(
+        name="triple_click",
+        description="Perform a triple mouse click at the current cursor position",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "button": {
+                    "type": "string",
+                    "enum": _MOUSE_BUTTONS,
+                    "description": "Mouse button to click",
+                    "default": "left"
                 }
             }
-        ),
-        Tool(
-            name="button_down",
-            description="Press and hold a mouse button",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "middle", "right"],
-                        "description": "Mouse button to press",
-                        "default": "left"
-                    }
+        }
+    ),
+    Tool(
+        name="button_down",
+        description="Press and hold a mouse button",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "button": {
+                    "type": "string",
+                    "enum": _MOUSE_BUTTONS,
+                    "description": "Mouse button to press",
+                    "default": "left"
                 }
             }
-        ),
-        Tool(
-            name="button_up",
-            description="Release a mouse button",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "middle", "right"],
-                        "description": "Mouse button to release",
-                        "default": "left"
-                    }
+        }
+    ),
+    Tool(
+        name="button_up",
+        description="Release a mouse button",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "button": {
+                    "type": "string",
+                    "enum": _MOUSE_BUTTONS,
+                    "description": "Mouse button to release",
+                    "default": "left"
                 }
             }
-        ),
-        Tool(
-            name="drag",
-            description="Drag mouse from start to end position",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start": {
-                        "type": "object",
-                        "properties": {
-                            "x": {"type": "integer"},
-                            "y": {"type": "integer"}
-                        },
-                        "required": ["x", "y"],
-                        "description": "Start position"
+        }
+    ),
+    Tool(
+        name="drag",
+        description="Drag mouse from start to end position",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "integer"},
+                        "y": {"type": "integer"}
                     },
-                    "end": {
-                        "type": "object",
-                        "properties": {
-                            "x": {"type": "integer"},
-                            "y": {"type": "integer"}
-                        },
-                        "required": ["x", "y"],
-                        "description": "End position"
+                    "required": ["x", "y"],
+                    "description": "Start position"
+                },
+                "end": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "integer"},
+                        "y": {"type": "integer"}
                     },
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "middle", "right"],
-                        "description": "Mouse button to use for drag",
-                        "default": "left"
-                    }
+                    "required": ["x", "y"],
+                    "description": "End position"
                 },
-                "required": ["start", "end"]
-            }
-        ),
-        Tool(
-            name="mouse_move",
-            description="Move the mouse cursor to the specified coordinates",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "integer", "description": "X coordinate"},
-                    "y": {"type": "integer", "description": "Y coordinate"}
+                "button": {
+                    "type": "string",
+                    "enum": _MOUSE_BUTTONS,
+                    "description": "Mouse button to use for drag",
+                    "default": "left"
+                }
+            },
+            "required": ["start", "end"]
+        }
+    ),
+    Tool(
+        name="mouse_move",
+        description="Move the mouse cursor to the specified coordinates",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "x": {"type": "integer", "description": "X coordinate"},
+                "y": {"type": "integer", "description": "Y coordinate"}
+            },
+            "required": ["x", "y"]
+        }
+    ),
+    Tool(
+        name="type",
+        description="Type the specified text",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "Text to type"}
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="key_down",
+        description="Press and hold a key",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {"type": "string", "description": "Key to press (e.g., 'ctrl', 'a', 'space')"}
+            },
+            "required": ["key"]
+        }
+    ),
+    Tool(
+        name="key_up",
+        description="Release a key",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {"type": "string", "description": "Key to release (e.g., 'ctrl', 'a', 'space')"}
+            },
+            "required": ["key"]
+        }
+    ),
+    Tool(
+        name="key_press",
+        description="Press and release a key (convenience method)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {"type": "string", "description": "Key to press and release (e.g., 'ctrl', 'a', 'space')"}
+            },
+            "required": ["key"]
+        }
+    ),
+    Tool(
+        name="screenshot",
+        description="Capture a screenshot of the display and return it as a base64-encoded image (JPEG unless screenshot_format or format says otherwise; png, jpeg and webp are supported)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "force": {
+                    "type": "boolean",
+                    "description": "Re-encode even if the screen is unchanged since the last capture",
+                    "default": False
                 },
-                "required": ["x", "y"]
-            }
-        ),
-        Tool(
-            name="type",
-            description="Type the specified text",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "Text to type"}
+                "region": {
+                    "type": "object",
+                    "description": "Capture only this area of the display (pixels); only the region is encoded",
+                    "properties": {
+                        "x": {"type": "integer"},
+                        "y": {"type": "integer"},
+                        "width": {"type": "integer"},
+                        "height": {"type": "integer"}
+                    },
+                    "required": ["x", "y", "width", "height"]
                 },
-                "required": ["text"]
+                "format": {
+                    "type": "string",
+                    "enum": ["png", "jpeg", "webp"],
+                    "description": "Image format (default: the screenshot_format config, jpeg unless changed); jpeg and webp are lossy but several times smaller and faster to encode, png is lossless"
+                }
             }
-        ),
-        Tool(
-            name="key_down",
-            description="Press and hold a key",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Key to press (e.g., 'ctrl', 'a', 'space')"}
+        }
+    ),
+    Tool(
+        name="set_config",
+        description="Configure observation options",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "observe_screen": {
+                    "type": "boolean",
+                    "description": "Include screenshots in responses (default: true)",
+                    "default": True
                 },
-                "required": ["key"]
-            }
-        ),
-        Tool(
-            name="key_up",
-            description="Release a key",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Key to release (e.g., 'ctrl', 'a', 'space')"}
+                "observe_mouse_position": {
+                    "type": "boolean",
+                    "description": "Track and include mouse position",
+                    "default": False
                 },
-                "required": ["key"]
-            }
-        ),
-        Tool(
-            name="key_press",
-            description="Press and release a key (convenience method)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Key to press and release (e.g., 'ctrl', 'a', 'space')"}
+                "observe_mouse_button_states": {
+                    "type": "boolean",
+                    "description": "Track and include mouse button states",
+                    "default": False
                 },
-                "required": ["key"]
-            }
-        ),
-        Tool(
-            name="screenshot",
-            description="Capture a screenshot of the display and return it as base64-encoded PNG",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="set_config",
-            description="Configure observation options",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "observe_screen": {
-                        "type": "boolean",
-                        "description": "Include screenshots in responses (default: true)",
-                        "default": True
-                    },
-                    "observe_mouse_position": {
-                        "type": "boolean",
-                        "description": "Track and include mouse position",
-                        "default": False
-                    },
-                    "observe_mouse_button_states": {
-                        "type": "boolean",
-                        "description": "Track and include mouse button states",
-                        "default": False
-                    },
-                    "observe_keyboard_key_states": {
-                        "type": "boolean",
-                        "description": "Track and include keyboard key states",
-                        "default": False
-                    },
-                    "observe_focused_app": {
-                        "type": "boolean",
-                        "description": "Include focused application information",
-                        "default": False
-                    },
-                    "observe_accessibility_tree": {
-                        "type": "boolean",
-                        "description": "Include accessibility tree",
-                        "default": False
-                    },
-                    "disallowed_hotkeys": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        },
-                        "description": "List of hotkey strings to disallow (e.g., ['ctrl+c', 'alt+f4'])",
-                        "default": []
-                    },
-                    "constrain_mouse_to_window": {
-                        "type": "string",
-                        "description": "Constrain mouse movement and clicks to window bounds. Set to window handle (integer as string), window title pattern (string), or empty string to disable.",
-                        "default": ""
-                    },
-                    "observe_system_metrics": {
-                        "type": "boolean",
-                        "description": "Track and include system performance metrics (CPU, memory, disk I/O, network I/O)",
-                        "default": False
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="list_windows",
-            description="List all visible windows with their handles, titles, processes, and bounds",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="switch_to_window",
-            description="Switch focus to a window by handle or title pattern. Provide either hwnd OR title (not both).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle (from list_windows)"
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Window title pattern to search for (alternative to hwnd)"
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="move_window",
-            description="Move and/or resize a window to specified position and size",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    },
-                    "x": {
-                        "type": "integer",
-                        "description": "X coordinate for window position"
-                    },
-                    "y": {
-                        "type": "integer",
-                        "description": "Y coordinate for window position"
-                    },
-                    "width": {
-                        "type": "integer",
-                        "description": "Window width (optional, preserves current if not specified)"
-                    },
-                    "height": {
-                        "type": "integer",
-                        "description": "Window height (optional, preserves current if not specified)"
-                    }
+                "observe_keyboard_key_states": {
+                    "type": "boolean",
+                    "description": "Track and include keyboard key states",
+                    "default": False
                 },
-                "required": ["hwnd", "x", "y"]
-            }
-        ),
-        Tool(
-            name="resize_window",
-            description="Resize a window to specified dimensions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    },
-                    "width": {
-                        "type": "integer",
-                        "description": "Window width"
+                "observe_focused_app": {
+                    "type": "boolean",
+                    "description": "Include focused application information",
+                    "default": False
+                },
+                "observe_accessibility_tree": {
+                    "type": "boolean",
+                    "description": "Include accessibility tree",
+                    "default": False
+                },
+                "disallowed_hotkeys": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
                     },
-                    "height": {
-                        "type": "integer",
-                        "description": "Window height"
-                    }
+                    "description": "List of hotkey strings to disallow (e.g., ['ctrl+c', 'alt+f4'])",
+                    "default": []
                 },
-                "required": ["hwnd", "width", "height"]
-            }
-        ),
-        Tool(
-            name="minimize_window",
-            description="Minimize a window",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "constrain_mouse_to_window": {
+                    "type": "string",
+                    "description": "Constrain mouse movement and clicks to window bounds. Set to window handle (integer as string), window title pattern (string), or empty string to disable.",
+                    "default": ""
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="maximize_window",
-            description="Maximize a window",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "observe_system_metrics": {
+                    "type": "boolean",
+                    "description": "Track and include system performance metrics (CPU, memory, disk I/O, network I/O)",
+                    "default": False
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="restore_window",
-            description="Restore a minimized or maximized window to normal state",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "precise_drag": {
+                    "type": "boolean",
+                    "description": "Spin for ~2 ms between drag steps instead of sleeping 10 ms (lower latency, briefly uses CPU)",
+                    "default": True
                 },
-                "required": ["hwnd"]
+                "screenshot_format": {
+                    "type": "string",
+                    "enum": ["png", "jpeg", "webp"],
+                    "description": "Format of the screenshot in every response and the screenshot tool's default; jpeg and webp are lossy but several times smaller and faster to encode, png is lossless",
+                    "default": "jpeg"
+                }
             }
-        ),
-        Tool(
-            name="set_window_topmost",
-            description="Set or remove a window's always-on-top property",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    },
-                    "topmost": {
-                        "type": "boolean",
-                        "description": "Whether window should be always on top",
-                        "default": True
-                    }
+        }
+    ),
+    Tool(
+        name="list_windows",
+        description="List all visible windows with their handles, titles, processes, and bounds",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="switch_to_window",
+        description="Switch focus to a window by handle or title pattern. Provide either hwnd OR title (not both).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle (from list_windows)"
                 },
-                "required": ["hwnd"]
+                "title": {
+                    "type": "string",
+                    "description": "Window title pattern to search for (alternative to hwnd)"
+                }
             }
-        ),
-        Tool(
-            name="get_window_info",
-            description="Get detailed information about a window",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+        }
+    ),
+    Tool(
+        name="move_window",
+        description="Move and/or resize a window to specified position and size",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="close_window",
-            description="Close a window",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "x": {
+                    "type": "integer",
+                    "description": "X coordinate for window position"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="snap_window_left",
-            description="Snap window to fill left half of screen",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "y": {
+                    "type": "integer",
+                    "description": "Y coordinate for window position"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="snap_window_right",
-            description="Snap window to fill right half of screen",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "width": {
+                    "type": "integer",
+                    "description": "Window width (optional, preserves current if not specified)"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="snap_window_top",
-            description="Snap window to fill top half of screen",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "height": {
+                    "type": "integer",
+                    "description": "Window height (optional, preserves current if not specified)"
+                }
+            },
+            "required": ["hwnd", "x", "y"]
+        }
+    ),
+    Tool(
+        name="resize_window",
+        description="Resize a window to specified dimensions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="snap_window_bottom",
-            description="Snap window to fill bottom half of screen",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "width": {
+                    "type": "integer",
+                    "description": "Window width"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="screenshot_window",
-            description="Capture screenshot of a specific window",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "height": {
+                    "type": "integer",
+                    "description": "Window height"
+                }
+            },
+            "required": ["hwnd", "width", "height"]
+        }
+    ),
+    Tool(
+        name="minimize_window",
+        description="Minimize a window",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="maximize_window",
+        description="Maximize a window",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="restore_window",
+        description="Restore a minimized or maximized window to normal state",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="set_window_topmost",
+        description="Set or remove a window's always-on-top property",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="list_virtual_desktops",
-            description="List all virtual desktops with their IDs and names",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="switch_virtual_desktop",
-            description="Switch to a virtual desktop by ID or name. Provide either desktop_id OR name (not both).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "desktop_id": {
-                        "type": "integer",
-                        "description": "Virtual desktop ID (0-indexed)"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Virtual desktop name (alternative to desktop_id)"
-                    }
+                "topmost": {
+                    "type": "boolean",
+                    "description": "Whether window should be always on top",
+                    "default": True
                 }
-            }
-        ),
-        Tool(
-            name="move_window_to_virtual_desktop",
-            description="Move a window to a different virtual desktop",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    },
-                    "desktop_id": {
-                        "type": "integer",
-                        "description": "Target virtual desktop ID"
-                    }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="get_window_info",
+        description="Get detailed information about a window",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="close_window",
+        description="Close a window",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="snap_window_left",
+        description="Snap window to fill left half of screen",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="snap_window_right",
+        description="Snap window to fill right half of screen",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="snap_window_top",
+        description="Snap window to fill top half of screen",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="snap_window_bottom",
+        description="Snap window to fill bottom half of screen",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="screenshot_window",
+        description="Capture screenshot of a specific window",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="list_virtual_desktops",
+        description="List all virtual desktops with their IDs and names",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="switch_virtual_desktop",
+        description="Switch to a virtual desktop by ID or name. Provide either desktop_id OR name (not both).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "desktop_id": {
+                    "type": "integer",
+                    "description": "Virtual desktop ID (0-indexed)"
                 },
-                "required": ["hwnd", "desktop_id"]
+                "name": {
+                    "type": "string",
+                    "description": "Virtual desktop name (alternative to desktop_id)"
+                }
             }
-        ),
-    ]
+        }
+    ),
+    Tool(
+        name="move_window_to_virtual_desktop",
+        description="Move a window to a different virtual desktop",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                },
+                "desktop_id": {
+                    "type": "integer",
+                    "description": "Target virtual desktop ID"
+                }
+            },
+            "required": ["hwnd", "desktop_id"]
+        }
+    ),
+    Tool(
+        name="batch",
+        description="Run several tool actions in order and return the observed state once at the end. Stops at the first action that returns an error. If the batch takes screenshots, the last one is returned as the image.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "actions": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Tool name (e.g., 'mouse_move', 'click', 'type')"
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool"
+                            }
+                        },
+                        "required": ["name"]
+                    },
+                    "description": "Actions to run in order"
+                }
+            },
+            "required": ["actions"]
+        }
+    ),
+]
+
+# Every tool accepts include_state to skip the post-action observation
+for _tool in _TOOLS:
+    _tool.inputSchema.setdefault("properties", {})["include_state"] = {
+        "type": "boolean",
+        "description": "Collect observed state (screenshot, mouse, focused app, ...) after the action (default: true). Set false for fire-and-forget steps.",
+        "default": True
+    }
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    return _TOOLS
+
+
+# Tools that only read; every other tool may change the UI and invalidates
+# the cached accessibility tree
+_READ_ONLY_TOOLS = frozenset({
+    "screenshot", "set_config", "list_windows", "get_window_info", "screenshot_window",
+    "list_virtual_desktops", "list_terminals", "read_terminal_output",
+})
+
+
+async def _on_input_thread(func: Callable[..., dict[str, Any]], /, **kwargs: Any) -> dict[str, Any]:
+    """Run a mouse/keyboard action on the input thread and wait for its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_INPUT_EXECUTOR, partial(func, **kwargs))
+
+
+_ActionResult = tuple[dict[str, Any] | None, dict[str, Any] | None]
+
+
+# Tool actions. Each takes the tool arguments and returns (result,
+# pre-captured screenshot data or None); _ACTIONS maps tool names to them.
+
+def _button_action(func: Callable[..., dict[str, Any]]) -> Callable[[dict[str, Any]], Awaitable[_ActionResult]]:
+    """Build the action for a mouse tool that only takes a button."""
+    async def run(arguments: dict[str, Any]) -> _ActionResult:
+        result = await _on_input_thread(func, button=arguments.get("button", "left"), controller=mouse_controller)
+        return result, None
+    return run
+
+
+def _key_action(func: Callable[..., dict[str, Any]]) -> Callable[[dict[str, Any]], Awaitable[_ActionResult]]:
+    """Build the action for a keyboard tool that only takes a key."""
+    async def run(arguments: dict[str, Any]) -> _ActionResult:
+        result = await _on_input_thread(func, key=arguments["key"], controller=keyboard_controller)
+        return result, None
+    return run
+
+
+def _hwnd_action(func: Callable[..., dict[str, Any]]) -> Callable[[dict[str, Any]], Awaitable[_ActionResult]]:
+    """Build the action for a window tool that only takes a window handle."""
+    async def run(arguments: dict[str, Any]) -> _ActionResult:
+        return func(hwnd=arguments["hwnd"]), None
+    return run
+
+
+async def _drag(arguments: dict[str, Any]) -> _ActionResult:
+    """Run the drag tool."""
+    result = await _on_input_thread(
+        mouse_actions.drag,
+        start=arguments["start"],
+        end=arguments["end"],
+        button=arguments.get("button", "left"),
+        controller=mouse_controller,
+        precise=computer_state.config.get("precise_drag", True)
+    )
+    return result, None
+
+
+async def _mouse_move(arguments: dict[str, Any]) -> _ActionResult:
+    """Run the mouse_move tool."""
+    result = await _on_input_thread(
+        mouse_actions.move_mouse,
+        x=arguments["x"],
+        y=arguments["y"],
+        controller=mouse_controller
+    )
+    return result, None
+
+
+async def _type(arguments: dict[str, Any]) -> _ActionResult:
+    """Run the type tool."""
+    result = await _on_input_thread(
+        keyboard_actions.type_text,
+        text=arguments["text"],
+        controller=keyboard_controller
+    )
+    return result, None
+
+
+async def _screenshot(arguments: dict[str, Any]) -> _ActionResult:
+    """Run the screenshot tool."""
+    screenshot_result = await screenshot_actions.get_screenshot_async(
+        force=arguments.get("force", False),
+        region=arguments.get("region"),
+        image_format=arguments.get("format") or computer_state.config["screenshot_format"]
+    )
+    if "error" in screenshot_result:
+        return screenshot_result, None
+    return {"success": True, "action": "screenshot"}, screenshot_result
+
+
+async def _set_config(arguments: dict[str, Any]) -> _ActionResult:
+    """Run the set_config tool."""
+    # Update state config first
+    for key in ["observe_screen", "observe_mouse_position", "observe_mouse_button_states",
+               "observe_keyboard_key_states", "observe_focused_app", "observe_accessibility_tree",
+               "disallowed_hotkeys", "observe_system_metrics", "precise_drag", "screenshot_format"]:
+        if key in arguments:
+            computer_state.config[key] = arguments[key]
+    # Handle constrain_mouse_to_window separately - convert string to appropriate type
+    if "constrain_mouse_to_window" in arguments:
+        value = arguments["constrain_mouse_to_window"]
+        if value == "" or value is None:
+            computer_state.config["constrain_mouse_to_window"] = None
+        elif value.isdigit():
+            computer_state.config["constrain_mouse_to_window"] = int(value)
+        else:
+            computer_state.config["constrain_mouse_to_window"] = value
+    computer_state.mark_config_changed()
+    return {"success": True, "action": "set_config", "config": computer_state.config.copy()}, None
+
+
+async def _list_windows(arguments: dict[str, Any]) -> _ActionResult:  # noqa: ARG001
+    """Run the list_windows tool."""
+    return window_actions.list_windows(), None
+
+
+async def _switch_to_window(arguments: dict[str, Any]) -> _ActionResult:
+    """Run the switch_to_window tool."""
+    result = window_actions.switch_to_window(
+        hwnd=arguments.get("hwnd"),
+        title=arguments.get("title")
+    )
+    return result, None
+
+
+async def _move_window(arguments: dict[str, Any]) -> _ActionResult:
+    """Run the move_window tool."""
+    result = window_actions.move_window(
+        hwnd=arguments["hwnd"],
+        x=arguments["x"],
+        y=arguments["y"],
+        width=arguments.get("width"),
+        height=arguments.get("height")
+    )
+    return result, None
+
+
+async def _resize_window(arguments: dict[str, Any]) -> _ActionResult:
+    """Run the resize_window tool."""
+    result = window_actions.resize_window(
+        hwnd=arguments["hwnd"],
+        width=arguments["width"],
+        height=arguments["height"]
+    )
+    return result, None
+
+
+async def _set_window_topmost(arguments: dict[str, Any]) -> _ActionResult:
+    """Run the set_window_topmost tool."""
+    result = window_actions.set_window_topmost(
+        hwnd=arguments["hwnd"],
+        topmost=arguments.get("topmost", True)
+    )
+    return result, None
+
+
+async def _screenshot_window(arguments: dict[str, Any]) -> _ActionResult:
+    """Run the screenshot_window tool."""
+    screenshot_result = window_actions.screenshot_window(hwnd=arguments["hwnd"])
+    if "error" in screenshot_result:
+        return screenshot_result, None
+    screenshot_data = {
+        "format": screenshot_result.get("format", "base64_png"),
+        "data": screenshot_result.get("data"),
+        "width": screenshot_result.get("width"),
+        "height": screenshot_result.get("height")
+    }
+    result = {"success": screenshot_result.get("success"), "action": "screenshot_window", "hwnd": arguments["hwnd"]}
+    return result, screenshot_data
+
+
+async def _list_virtual_desktops(arguments: dict[str, Any]) -> _ActionResult:  # noqa: ARG001
+    """Run the list_virtual_desktops tool."""
+    return window_actions.list_virtual_desktops(), None
+
+
+async def _switch_virtual_desktop(arguments: dict[str, Any]) -> _ActionResult:
+    """Run the switch_virtual_desktop tool."""
+    result = window_actions.switch_virtual_desktop(
+        desktop_id=arguments.get("desktop_id"),
+        name=arguments.get("name")
+    )
+    return result, None
+
+
+async def _move_window_to_virtual_desktop(arguments: dict[str, Any]) -> _ActionResult:
+    """Run the move_window_to_virtual_desktop tool."""
+    result = window_actions.move_window_to_virtual_desktop(
+        hwnd=arguments["hwnd"],
+        desktop_id=arguments["desktop_id"]
+    )
+    return result, None
+
+
+# Tool name -> action, resolved once at import so dispatch is one dict lookup
+_ACTIONS: dict[str, Callable[[dict[str, Any]], Awaitable[_ActionResult]]] = {
+    # Mouse actions
+    "click": _button_action(mouse_actions.click),
+    "double_click": _button_action(mouse_actions.double_click),
+    "triple_click": _button_action(mouse_actions.triple_click),
+    "button_down": _button_action(mouse_actions.button_down),
+    "button_up": _button_action(mouse_actions.button_up),
+    "drag": _drag,
+    "mouse_move": _mouse_move,
+    
+    # Keyboard actions
+    "type": _type,
+    "key_down": _key_action(keyboard_actions.key_down),
+    "key_up": _key_action(keyboard_actions.key_up),
+    "key_press": _key_action(keyboard_actions.key_press),
+    
+    # Screenshot actions
+    "screenshot": _screenshot,
+    
+    # Config actions
+    "set_config": _set_config,
+    
+    # Window actions
+    "list_windows": _list_windows,
+    "switch_to_window": _switch_to_window,
+    "move_window": _move_window,
+    "resize_window": _resize_window,
+    "minimize_window": _hwnd_action(window_actions.minimize_window),
+    "maximize_window": _hwnd_action(window_actions.maximize_window),
+    "restore_window": _hwnd_action(window_actions.restore_window),
+    "set_window_topmost": _set_window_topmost,
+    "get_window_info": _hwnd_action(window_actions.get_window_info),
+    "close_window": _hwnd_action(window_actions.close_window),
+    "snap_window_left": _hwnd_action(window_actions.snap_window_left),
+    "snap_window_right": _hwnd_action(window_actions.snap_window_right),
+    "snap_window_top": _hwnd_action(window_actions.snap_window_top),
+    "snap_window_bottom": _hwnd_action(window_actions.snap_window_bottom),
+    "screenshot_window": _screenshot_window,
+    
+    # Virtual desktop actions
+    "list_virtual_desktops": _list_virtual_desktops,
+    "switch_virtual_desktop": _switch_virtual_desktop,
+    "move_window_to_virtual_desktop": _move_window_to_virtual_desktop,
+}
+
+
+async def _run_action(name: str, arguments: dict[str, Any]) -> _ActionResult:
+    """Run a single tool action without collecting state.
+    
+    Args:
+        name: Tool name
+        arguments: Tool arguments
+    
+    Returns:
+        Tuple of (action result, pre-captured screenshot data or None)
+    """
+    mutating = name not in _READ_ONLY_TOOLS
+    action = _ACTIONS.get(name)
+    if action is None:
+        return {"error": f"Unknown tool: {name}"}, None
+    try:
+        return await action(arguments)
+    finally:
+        if mutating:
+            # A snapshot taken before or during the action must not be reused
+            computer_state.invalidate_state()
+
+
+async def _run_batch(actions: list[dict[str, Any]]) -> _ActionResult:
+    """Run several tool actions in order, stopping at the first error.
+    
+    Args:
+        actions: List of {"name": <tool>, "arguments": {...}} entries
+    
+    Returns:
+        Tuple of (dictionary with per-action results, image from the last
+        screenshot/screenshot_window step or None)
+    """
+    results = []
+    screenshot_data = None
+    for action in actions:
+        action_name = action.get("name")
+        if action_name == "batch":
+            results.append({"error": "Nested batch actions are not supported"})
+            break
+        result, step_screenshot = await _run_action(action_name, action.get("arguments") or {})
+        if step_screenshot is not None:
+            screenshot_data = step_screenshot
+        if result is None:
+            result = {"error": "Action returned None"}
+        results.append(result)
+        if "error" in result:
+            break
+    
+    return {
+        "success": len(results) == len(actions) and all("error" not in r for r in results),
+        "action": "batch",
+        "results": results
+    }, screenshot_data
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[Union[TextContent, ImageContent]]:
     """Handle tool calls by routing to action functions."""
     try:
-        # Update listeners based on config
-        if computer_state.config["observe_mouse_position"] or computer_state.config["observe_mouse_button_states"]:
-            computer_state.start_mouse_listener()
-        else:
-            computer_state.stop_mouse_listener()
-        
-        if computer_state.config["observe_keyboard_key_states"]:
-            computer_state.start_keyboard_listener()
-        else:
-            computer_state.stop_keyboard_listener()
-        
         # Route to appropriate action function
-        result: dict[str, Any] | None = None
-        screenshot_data: dict[str, Any] | None = None
-        
-        # Mouse actions
-        if name == "click":
-            result = mouse_actions.click(
-                button=arguments.get("button", "left"),
-                controller=mouse_controller
-            )
-        elif name == "double_click":
-            result = mouse_actions.double_click(
-                button=arguments.get("button", "left"),
-                controller=mouse_controller
-            )
-        elif name == "triple_click":
-            result = mouse_actions.triple_click(
-                button=arguments.get("button", "left"),
-                controller=mouse_controller
-            )
-        elif name == "button_down":
-            result = mouse_actions.button_down(
-                button=arguments.get("button", "left"),
-                controller=mouse_controller
-            )
-        elif name == "button_up":
-            result = mouse_actions.button_up(
-                button=arguments.get("button", "left"),
-                controller=mouse_controller
-            )
-        elif name == "drag":
-            result = mouse_actions.drag(
-                start=arguments["start"],
-                end=arguments["end"],
-                button=arguments.get("button", "left"),
-                controller=mouse_controller
-            )
-        elif name == "mouse_move":
-            result = mouse_actions.move_mouse(
-                x=arguments["x"],
-                y=arguments["y"],
-                controller=mouse_controller
-            )
-        
-        # Keyboard actions
-        elif name == "type":
-            result = keyboard_actions.type_text(
-                text=arguments["text"],
-                controller=keyboard_controller
-            )
-        elif name == "key_down":
-            result = keyboard_actions.key_down(
-                key=arguments["key"],
-                controller=keyboard_controller
-            )
-        elif name == "key_up":
-            result = keyboard_actions.key_up(
-                key=arguments["key"],
-                controller=keyboard_controller
-            )
-        elif name == "key_press":
-            result = keyboard_actions.key_press(
-                key=arguments["key"],
-                controller=keyboard_controller
-            )
-        
-        # Screenshot actions
-        elif name == "screenshot":
-            screenshot_result = screenshot_actions.get_screenshot()
-            if "error" not in screenshot_result:
-                screenshot_data = screenshot_result
-                result = {"success": True, "action": "screenshot"}
-            else:
-                result = screenshot_result
-        
-        # Config actions
-        elif name == "set_config":
-            # Update state config first
-            for key in ["observe_screen", "observe_mouse_position", "observe_mouse_button_states",
-                       "observe_keyboard_key_states", "observe_focused_app", "observe_accessibility_tree",
-                       "disallowed_hotkeys", "observe_system_metrics"]:
-                if key in arguments:
-                    computer_state.config[key] = arguments[key]
-            # Handle constrain_mouse_to_window separately - convert string to appropriate type
-            if "constrain_mouse_to_window" in arguments:
-                value = arguments["constrain_mouse_to_window"]
-                if value == "" or value is None:
-                    computer_state.config["constrain_mouse_to_window"] = None
-                elif value.isdigit():
-                    computer_state.config["constrain_mouse_to_window"] = int(value)
-                else:
-                    computer_state.config["constrain_mouse_to_window"] = value
-            result = {"success": True, "action": "set_config", "config": computer_state.config.copy()}
-        
-        # Window actions
-        elif name == "list_windows":
-            result = window_actions.list_windows()
-        elif name == "switch_to_window":
-            result = window_actions.switch_to_window(
-                hwnd=arguments.get("hwnd"),
-                title=arguments.get("title")
-            )
-        elif name == "move_window":
-            result = window_actions.move_window(
-                hwnd=arguments["hwnd"],
-                x=arguments["x"],
-                y=arguments["y"],
-                width=arguments.get("width"),
-                height=arguments.get("height")
-            )
-        elif name == "resize_window":
-            result = window_actions.resize_window(
-                hwnd=arguments["hwnd"],
-                width=arguments["width"],
-                height=arguments["height"]
-            )
-        elif name == "minimize_window":
-            result = window_actions.minimize_window(hwnd=arguments["hwnd"])
-        elif name == "maximize_window":
-            result = window_actions.maximize_window(hwnd=arguments["hwnd"])
-        elif name == "restore_window":
-            result = window_actions.restore_window(hwnd=arguments["hwnd"])
-        elif name == "set_window_topmost":
-            result = window_actions.set_window_topmost(
-                hwnd=arguments["hwnd"],
-                topmost=arguments.get("topmost", True)
-            )
-        elif name == "get_window_info":
-            result = window_actions.get_window_info(hwnd=arguments["hwnd"])
-        elif name == "close_window":
-            result = window_actions.close_window(hwnd=arguments["hwnd"])
-        elif name == "snap_window_left":
-            result = window_actions.snap_window_left(hwnd=arguments["hwnd"])
-        elif name == "snap_window_right":
-            result = window_actions.snap_window_right(hwnd=arguments["hwnd"])
-        elif name == "snap_window_top":
-            result = window_actions.snap_window_top(hwnd=arguments["hwnd"])
-        elif name == "snap_window_bottom":
-            result = window_actions.snap_window_bottom(hwnd=arguments["hwnd"])
-        elif name == "screenshot_window":
-            screenshot_result = window_actions.screenshot_window(hwnd=arguments["hwnd"])
-            if "error" not in screenshot_result:
-                screenshot_data = {
-                    "format": screenshot_result.get("format", "base64_png"),
-                    "data": screenshot_result.get("data"),
-                    "width": screenshot_result.get("width"),
-                    "height": screenshot_result.get("height")
-                }
-                result = {"success": screenshot_result.get("success"), "action": "screenshot_window", "hwnd": arguments["hwnd"]}
-            else:
-                result = screenshot_result
-        
-        # Virtual desktop actions
-        elif name == "list_virtual_desktops":
-            result = window_actions.list_virtual_desktops()
-        elif name == "switch_virtual_desktop":
-            result = window_actions.switch_virtual_desktop(
-                desktop_id=arguments.get("desktop_id"),
-                name=arguments.get("name")
-            )
-        elif name == "move_window_to_virtual_desktop":
-            result = window_actions.move_window_to_virtual_desktop(
-                hwnd=arguments["hwnd"],
-                desktop_id=arguments["desktop_id"]
-            )
-        
+        if name == "batch":
+            result, screenshot_data = await _run_batch(arguments["actions"])
         else:
-            result = {"error": f"Unknown tool: {name}"}
+            result, screenshot_data = await _run_action(name, arguments)
         
         # Format response using MCP format_response helper
         if result is None:
             result = {"error": "Action returned None"}
         
-        return format_response(result, computer_state, screenshot_data=screenshot_data)
+        return await format_response_async(
+            result,
+            computer_state,
+            screenshot_data=screenshot_data,
+            include_state=arguments.get("include_state", True)
+        )
     
     except Exception as e:
         error_msg = {"error": str(e), "tool": name, "arguments": arguments}
-        return [TextContent(type="text", text=json.dumps(error_msg))]
+        return [text_content(to_json(error_msg))]
+
+
+async def _warm_up() -> None:
+    """Open the capture and observation backends before the first tool call.
+    
+    The first screenshot otherwise pays for opening the mss grabber on the
+    capture thread (a display connection or device context) and loading
+    Pillow's encoder plugin, and the first observed response for the enabled
+    observers' first queries. Exactly one capture is made, in the configured
+    screenshot_format, so it also seeds the unchanged-frame cache. Every
+    observer runs in a worker thread, so the initialize handshake is not
+    delayed. Errors are left for the tool calls to report.
+    """
+    try:
+        if computer_state._any_observe:
+            # Captures the screenshot too when observe_screen is on
+            await computer_state.get_state_async()
+        if not computer_state.config["observe_screen"]:
+            await screenshot_actions.get_screenshot_async(
+                image_format=computer_state.config["screenshot_format"]
+            )
+    except Exception:
+        pass
 
 
 async def run_stdio():
     """Run MCP server in stdio mode."""
     async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+        # Warm up in the background while the client initializes
+        warm_up = asyncio.create_task(_warm_up())
+        try:
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+        finally:
+            warm_up.cancel()
 
 
 async def run_http(host: str = "127.0.0.1", port: int = 8000):
@@ -764,7 +999,6 @@ async def run_http(host: str = "127.0.0.1", port: int = 8000):
     """
     try:
         from aiohttp import web, web_response
-        import json as json_lib
     except ImportError:
         raise ImportError(
             "aiohttp is required for HTTP/SSE mode. Install with: pip install aiohttp"
@@ -786,7 +1020,7 @@ async def run_http(host: str = "127.0.0.1", port: int = 8000):
                 # Process MCP messages (simplified - actual implementation would parse JSON-RPC)
                 await response.write(f"data: {line.decode()}\n\n".encode())
         except Exception as e:
-            await response.write(f"event: error\ndata: {json_lib.dumps({'error': str(e)})}\n\n".encode())
+            await response.write(f"event: error\ndata: {to_json({'error': str(e)})}\n\n".encode())
         finally:
             await response.write_eof()
         
@@ -814,9 +1048,10 @@ async def run_http(host: str = "127.0.0.1", port: int = 8000):
                         "mimeType": getattr(content, 'mimeType', 'image/png')
                     })
             
-            return web.json_response({"content": response_data})
+            # Image data is a large base64 string; encode with the fast serializer
+            return web.json_response({"content": response_data}, dumps=to_json)
         except Exception as e:
-            return web.json_response({"error": str(e)}, status=500)
+            return web.json_response({"error": str(e)}, status=500, dumps=to_json)
     
     app = web.Application()
     app.router.add_get('/sse', handle_sse)
@@ -831,11 +1066,14 @@ async def run_http(host: str = "127.0.0.1", port: int = 8000):
     print(f"SSE endpoint: http://{host}:{port}/sse")
     print(f"MCP endpoint: http://{host}:{port}/mcp")
     
+    warm_up = asyncio.create_task(_warm_up())
+    
     # Keep running
     try:
         await asyncio.Future()  # Run forever
     except KeyboardInterrupt:
         pass
     finally:
+        warm_up.cancel()
         await runner.cleanup()
 
@@ -1,5 +1,6 @@
 """MCP server setup and tool definitions."""
 
+import inspect
 from typing import Any, Union
 
 from mcp.server import Server
@@ -7,6 +8,7 @@ from mcp.types import ImageContent, Tool, TextContent
 from pynput.keyboard import Controller as KeyboardController
 from pynput.mouse import Controller as MouseController
 
+from computer_mcp.core.response import text_content, to_json
 from computer_mcp.core.state import ComputerState
 from computer_mcp.handlers import config, keyboard, mouse, screenshot, terminal, window
 
@@ -20,705 +22,766 @@ keyboard_controller = KeyboardController()
 server = Server("computer-mcp")
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="click",
-            description="Perform a mouse click at the current cursor position",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "middle", "right"],
-                        "description": "Mouse button to click",
-                        "default": "left"
-                    }
+# Shared by every tool that takes a mouse button
+_MOUSE_BUTTONS = ["left", "middle", "right"]
+
+# Tool definitions are static, so build them once at import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="click",
+        description="Perform a mouse click at the current cursor position",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "button": {
+                    "type": "string",
+                    "enum": _MOUSE_BUTTONS,
+                    "description": "Mouse button to click",
+                    "default": "left"
                 }
             }
-        ),
-        Tool(
-            name="double_click",
-            description="Perform a double mouse click at the current cursor position",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "middle", "right"],
-                        "description": "Mouse button to click",
-                        "default": "left"
-                    }
+        }
+    ),
+    Tool(
+        name="double_click",
+        description="Perform a double mouse click at the current cursor position",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "button": {
+                    "type": "string",
+                    "enum": _MOUSE_BUTTONS,
+                    "description": "Mouse button to click",
+                    "default": "left"
                 }
             }
-        ),
-        Tool(
-            name="triple_click",
-            description="Perform a triple mouse click at the current cursor position",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "middle", "right"],
-                        "description": "Mouse button to click",
-                        "default": "left"
-                    }
+        }
+    ),
+    Tool(
+        name="triple_click",
+        description="Perform a triple mouse click at the current cursor position",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "button": {
+                    "type": "string",
+                    "enum": _MOUSE_BUTTONS,
+                    "description": "Mouse button to click",
+                    "default": "left"
                 }
             }
-        ),
-        Tool(
-            name="button_down",
-            description="Press and hold a mouse button",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "middle", "right"],
-                        "description": "Mouse button to press",
-                        "default": "left"
-                    }
+        }
+    ),
+    Tool(
+        name="button_down",
+        description="Press and hold a mouse button",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "button": {
+                    "type": "string",
+                    "enum": _MOUSE_BUTTONS,
+                    "description": "Mouse button to press",
+                    "default": "left"
                 }
             }
-        ),
-        Tool(
-            name="button_up",
-            description="Release a mouse button",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "middle", "right"],
-                        "description": "Mouse button to release",
-                        "default": "left"
-                    }
+        }
+    ),
+    Tool(
+        name="button_up",
+        description="Release a mouse button",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "button": {
+                    "type": "string",
+                    "enum": _MOUSE_BUTTONS,
+                    "description": "Mouse button to release",
+                    "default": "left"
                 }
             }
-        ),
-        Tool(
-            name="drag",
-            description="Drag mouse from start to end position",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start": {
-                        "type": "object",
-                        "properties": {
-                            "x": {"type": "integer"},
-                            "y": {"type": "integer"}
-                        },
-                        "required": ["x", "y"],
-                        "description": "Start position"
+        }
+    ),
+    Tool(
+        name="drag",
+        description="Drag mouse from start to end position",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "integer"},
+                        "y": {"type": "integer"}
                     },
-                    "end": {
-                        "type": "object",
-                        "properties": {
-                            "x": {"type": "integer"},
-                            "y": {"type": "integer"}
-                        },
-                        "required": ["x", "y"],
-                        "description": "End position"
+                    "required": ["x", "y"],
+                    "description": "Start position"
+                },
+                "end": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "integer"},
+                        "y": {"type": "integer"}
                     },
-                    "button": {
-                        "type": "string",
-                        "enum": ["left", "middle", "right"],
-                        "description": "Mouse button to use for drag",
-                        "default": "left"
-                    }
+                    "required": ["x", "y"],
+                    "description": "End position"
                 },
-                "required": ["start", "end"]
-            }
-        ),
-        Tool(
-            name="mouse_move",
-            description="Move the mouse cursor to the specified coordinates",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "integer", "description": "X coordinate"},
-                    "y": {"type": "integer", "description": "Y coordinate"}
+                "button": {
+                    "type": "string",
+                    "enum": _MOUSE_BUTTONS,
+                    "description": "Mouse button to use for drag",
+                    "default": "left"
+                }
+            },
+            "required": ["start", "end"]
+        }
+    ),
+    Tool(
+        name="mouse_move",
+        description="Move the mouse cursor to the specified coordinates",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "x": {"type": "integer", "description": "X coordinate"},
+                "y": {"type": "integer", "description": "Y coordinate"}
+            },
+            "required": ["x", "y"]
+        }
+    ),
+    Tool(
+        name="type",
+        description="Type the specified text",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "Text to type"}
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="key_down",
+        description="Press and hold a key",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {"type": "string", "description": "Key to press (e.g., 'ctrl', 'a', 'space')"}
+            },
+            "required": ["key"]
+        }
+    ),
+    Tool(
+        name="key_up",
+        description="Release a key",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {"type": "string", "description": "Key to release (e.g., 'ctrl', 'a', 'space')"}
+            },
+            "required": ["key"]
+        }
+    ),
+    Tool(
+        name="key_press",
+        description="Press and release a key (convenience method)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {"type": "string", "description": "Key to press and release (e.g., 'ctrl', 'a', 'space')"}
+            },
+            "required": ["key"]
+        }
+    ),
+    Tool(
+        name="screenshot",
+        description="Capture a screenshot of the display and return it as a base64-encoded image (JPEG unless screenshot_format or format says otherwise; png, jpeg and webp are supported)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "force": {
+                    "type": "boolean",
+                    "description": "Re-encode even if the screen is unchanged since the last capture",
+                    "default": False
                 },
-                "required": ["x", "y"]
-            }
-        ),
-        Tool(
-            name="type",
-            description="Type the specified text",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "Text to type"}
+                "region": {
+                    "type": "object",
+                    "description": "Capture only this area of the display (pixels); only the region is encoded",
+                    "properties": {
+                        "x": {"type": "integer"},
+                        "y": {"type": "integer"},
+                        "width": {"type": "integer"},
+                        "height": {"type": "integer"}
+                    },
+                    "required": ["x", "y", "width", "height"]
                 },
-                "required": ["text"]
+                "format": {
+                    "type": "string",
+                    "enum": ["png", "jpeg", "webp"],
+                    "description": "Image format (default: the screenshot_format config, jpeg unless changed); jpeg and webp are lossy but several times smaller and faster to encode, png is lossless"
+                }
             }
-        ),
-        Tool(
-            name="key_down",
-            description="Press and hold a key",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Key to press (e.g., 'ctrl', 'a', 'space')"}
+        }
+    ),
+    Tool(
+        name="set_config",
+        description="Configure observation options",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "observe_screen": {
+                    "type": "boolean",
+                    "description": "Include screenshots in responses (default: true)",
+                    "default": True
                 },
-                "required": ["key"]
-            }
-        ),
-        Tool(
-            name="key_up",
-            description="Release a key",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Key to release (e.g., 'ctrl', 'a', 'space')"}
+                "observe_mouse_position": {
+                    "type": "boolean",
+                    "description": "Track and include mouse position",
+                    "default": False
                 },
-                "required": ["key"]
-            }
-        ),
-        Tool(
-            name="key_press",
-            description="Press and release a key (convenience method)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Key to press and release (e.g., 'ctrl', 'a', 'space')"}
+                "observe_mouse_button_states": {
+                    "type": "boolean",
+                    "description": "Track and include mouse button states",
+                    "default": False
                 },
-                "required": ["key"]
-            }
-        ),
-        Tool(
-            name="screenshot",
-            description="Capture a screenshot of the display and return it as base64-encoded PNG",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="set_config",
-            description="Configure observation options",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "observe_screen": {
-                        "type": "boolean",
-                        "description": "Include screenshots in responses (default: true)",
-                        "default": True
-                    },
-                    "observe_mouse_position": {
-                        "type": "boolean",
-                        "description": "Track and include mouse position",
-                        "default": False
-                    },
-                    "observe_mouse_button_states": {
-                        "type": "boolean",
-                        "description": "Track and include mouse button states",
-                        "default": False
-                    },
-                    "observe_keyboard_key_states": {
-                        "type": "boolean",
-                        "description": "Track and include keyboard key states",
-                        "default": False
-                    },
-                    "observe_focused_app": {
-                        "type": "boolean",
-                        "description": "Include focused application information",
-                        "default": False
-                    },
-                    "observe_accessibility_tree": {
-                        "type": "boolean",
-                        "description": "Include accessibility tree",
-                        "default": False
-                    },
-                    "disallowed_hotkeys": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        },
-                        "description": "List of hotkey strings to disallow (e.g., ['ctrl+c', 'alt+f4'])",
-                        "default": []
-                    },
-                    "constrain_mouse_to_window": {
-                        "type": "string",
-                        "description": "Constrain mouse movement and clicks to window bounds. Set to window handle (integer as string), window title pattern (string), or empty string to disable.",
-                        "default": ""
-                    },
-                    "observe_system_metrics": {
-                        "type": "boolean",
-                        "description": "Track and include system performance metrics (CPU, memory, disk I/O, network I/O)",
-                        "default": False
-                    },
-                    "terminal_output_mode": {
-                        "type": "string",
-                        "enum": ["chars", "text"],
-                        "description": "How to return terminal output: 'chars' (array of characters) or 'text' (accumulated string). Default: 'chars'",
-                        "default": "chars"
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="list_windows",
-            description="List all visible windows with their handles, titles, processes, and bounds",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="switch_to_window",
-            description="Switch focus to a window by handle or title pattern. Provide either hwnd OR title (not both).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle (from list_windows)"
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Window title pattern to search for (alternative to hwnd)"
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="move_window",
-            description="Move and/or resize a window to specified position and size",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    },
-                    "x": {
-                        "type": "integer",
-                        "description": "X coordinate for window position"
-                    },
-                    "y": {
-                        "type": "integer",
-                        "description": "Y coordinate for window position"
-                    },
-                    "width": {
-                        "type": "integer",
-                        "description": "Window width (optional, preserves current if not specified)"
-                    },
-                    "height": {
-                        "type": "integer",
-                        "description": "Window height (optional, preserves current if not specified)"
-                    }
+                "observe_keyboard_key_states": {
+                    "type": "boolean",
+                    "description": "Track and include keyboard key states",
+                    "default": False
                 },
-                "required": ["hwnd", "x", "y"]
-            }
-        ),
-        Tool(
-            name="resize_window",
-            description="Resize a window to specified dimensions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    },
-                    "width": {
-                        "type": "integer",
-                        "description": "Window width"
+                "observe_focused_app": {
+                    "type": "boolean",
+                    "description": "Include focused application information",
+                    "default": False
+                },
+                "observe_accessibility_tree": {
+                    "type": "boolean",
+                    "description": "Include accessibility tree",
+                    "default": False
+                },
+                "disallowed_hotkeys": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
                     },
-                    "height": {
-                        "type": "integer",
-                        "description": "Window height"
-                    }
+                    "description": "List of hotkey strings to disallow (e.g., ['ctrl+c', 'alt+f4'])",
+                    "default": []
                 },
-                "required": ["hwnd", "width", "height"]
-            }
-        ),
-        Tool(
-            name="minimize_window",
-            description="Minimize a window",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "constrain_mouse_to_window": {
+                    "type": "string",
+                    "description": "Constrain mouse movement and clicks to window bounds. Set to window handle (integer as string), window title pattern (string), or empty string to disable.",
+                    "default": ""
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="maximize_window",
-            description="Maximize a window",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "observe_system_metrics": {
+                    "type": "boolean",
+                    "description": "Track and include system performance metrics (CPU, memory, disk I/O, network I/O)",
+                    "default": False
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="restore_window",
-            description="Restore a minimized or maximized window to normal state",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "precise_drag": {
+                    "type": "boolean",
+                    "description": "Spin for ~2 ms between drag steps instead of sleeping 10 ms (lower latency, briefly uses CPU)",
+                    "default": True
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="set_window_topmost",
-            description="Set or remove a window's always-on-top property",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    },
-                    "topmost": {
-                        "type": "boolean",
-                        "description": "Whether window should be always on top",
-                        "default": True
-                    }
+                "terminal_output_mode": {
+                    "type": "string",
+                    "enum": ["chars", "text"],
+                    "description": "How to return terminal output: 'chars' (array of characters) or 'text' (accumulated string). Default: 'chars'",
+                    "default": "chars"
                 },
-                "required": ["hwnd"]
+                "screenshot_format": {
+                    "type": "string",
+                    "enum": ["png", "jpeg", "webp"],
+                    "description": "Format of the screenshot in every response and the screenshot tool's default; jpeg and webp are lossy but several times smaller and faster to encode, png is lossless",
+                    "default": "jpeg"
+                }
             }
-        ),
-        Tool(
-            name="get_window_info",
-            description="Get detailed information about a window",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+        }
+    ),
+    Tool(
+        name="list_windows",
+        description="List all visible windows with their handles, titles, processes, and bounds",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="switch_to_window",
+        description="Switch focus to a window by handle or title pattern. Provide either hwnd OR title (not both).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle (from list_windows)"
                 },
-                "required": ["hwnd"]
+                "title": {
+                    "type": "string",
+                    "description": "Window title pattern to search for (alternative to hwnd)"
+                }
             }
-        ),
-        Tool(
-            name="close_window",
-            description="Close a window",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+        }
+    ),
+    Tool(
+        name="move_window",
+        description="Move and/or resize a window to specified position and size",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="snap_window_left",
-            description="Snap window to fill left half of screen",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "x": {
+                    "type": "integer",
+                    "description": "X coordinate for window position"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="snap_window_right",
-            description="Snap window to fill right half of screen",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "y": {
+                    "type": "integer",
+                    "description": "Y coordinate for window position"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="snap_window_top",
-            description="Snap window to fill top half of screen",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "width": {
+                    "type": "integer",
+                    "description": "Window width (optional, preserves current if not specified)"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="snap_window_bottom",
-            description="Snap window to fill bottom half of screen",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "height": {
+                    "type": "integer",
+                    "description": "Window height (optional, preserves current if not specified)"
+                }
+            },
+            "required": ["hwnd", "x", "y"]
+        }
+    ),
+    Tool(
+        name="resize_window",
+        description="Resize a window to specified dimensions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="screenshot_window",
-            description="Capture screenshot of a specific window",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    }
+                "width": {
+                    "type": "integer",
+                    "description": "Window width"
                 },
-                "required": ["hwnd"]
-            }
-        ),
-        Tool(
-            name="list_virtual_desktops",
-            description="List all virtual desktops with their IDs and names",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="switch_virtual_desktop",
-            description="Switch to a virtual desktop by ID or name. Provide either desktop_id OR name (not both).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "desktop_id": {
-                        "type": "integer",
-                        "description": "Virtual desktop ID (0-indexed)"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Virtual desktop name (alternative to desktop_id)"
-                    }
+                "height": {
+                    "type": "integer",
+                    "description": "Window height"
                 }
-            }
-        ),
-        Tool(
-            name="move_window_to_virtual_desktop",
-            description="Move a window to a different virtual desktop",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwnd": {
-                        "type": "integer",
-                        "description": "Window handle"
-                    },
-                    "desktop_id": {
-                        "type": "integer",
-                        "description": "Target virtual desktop ID"
-                    }
+            },
+            "required": ["hwnd", "width", "height"]
+        }
+    ),
+    Tool(
+        name="minimize_window",
+        description="Minimize a window",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="maximize_window",
+        description="Maximize a window",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="restore_window",
+        description="Restore a minimized or maximized window to normal state",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="set_window_topmost",
+        description="Set or remove a window's always-on-top property",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
                 },
-                "required": ["hwnd", "desktop_id"]
-            }
-        ),
-        Tool(
-            name="spawn_terminal",
-            description="Spawn a new terminal process. Terminal lives for the server lifetime.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "command": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Command to execute (list of args). If not provided, uses platform default (pwsh/powershell/cmd on Windows, bash/sh on Linux/macOS)"
-                    },
-                    "shell": {
-                        "type": "boolean",
-                        "description": "Whether to run in shell mode",
-                        "default": False
-                    }
+                "topmost": {
+                    "type": "boolean",
+                    "description": "Whether window should be always on top",
+                    "default": True
                 }
-            }
-        ),
-        Tool(
-            name="list_terminals",
-            description="List all active terminal processes with their PIDs and status",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="send_terminal_text",
-            description="Send text input to a terminal process",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pid": {
-                        "type": "integer",
-                        "description": "Terminal process ID (from spawn_terminal or list_terminals)"
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Text to send to terminal stdin"
-                    }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="get_window_info",
+        description="Get detailed information about a window",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="close_window",
+        description="Close a window",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="snap_window_left",
+        description="Snap window to fill left half of screen",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="snap_window_right",
+        description="Snap window to fill right half of screen",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="snap_window_top",
+        description="Snap window to fill top half of screen",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="snap_window_bottom",
+        description="Snap window to fill bottom half of screen",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="screenshot_window",
+        description="Capture screenshot of a specific window",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
+                }
+            },
+            "required": ["hwnd"]
+        }
+    ),
+    Tool(
+        name="list_virtual_desktops",
+        description="List all virtual desktops with their IDs and names",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="switch_virtual_desktop",
+        description="Switch to a virtual desktop by ID or name. Provide either desktop_id OR name (not both).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "desktop_id": {
+                    "type": "integer",
+                    "description": "Virtual desktop ID (0-indexed)"
                 },
-                "required": ["pid", "text"]
+                "name": {
+                    "type": "string",
+                    "description": "Virtual desktop name (alternative to desktop_id)"
+                }
             }
-        ),
-        Tool(
-            name="read_terminal_output",
-            description="Read output from a terminal process. Returns characters array or text string based on terminal_output_mode config (default: chars)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pid": {
-                        "type": "integer",
-                        "description": "Terminal process ID"
-                    },
-                    "count": {
-                        "type": "integer",
-                        "description": "Maximum number of characters to read (optional, returns all available if not specified)"
-                    }
+        }
+    ),
+    Tool(
+        name="move_window_to_virtual_desktop",
+        description="Move a window to a different virtual desktop",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwnd": {
+                    "type": "integer",
+                    "description": "Window handle"
                 },
-                "required": ["pid"]
-            }
-        ),
-        Tool(
-            name="send_terminal_key",
-            description="Send key event (down/up) to a terminal process. Uses same key format as keyboard tools.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pid": {
-                        "type": "integer",
-                        "description": "Terminal process ID"
-                    },
-                    "key": {
-                        "type": "string",
-                        "description": "Key to send (e.g., 'a', 'ctrl', 'enter', 'ctrl+c')"
-                    },
-                    "event": {
-                        "type": "string",
-                        "enum": ["down", "up"],
-                        "description": "Key event type",
-                        "default": "down"
-                    }
+                "desktop_id": {
+                    "type": "integer",
+                    "description": "Target virtual desktop ID"
+                }
+            },
+            "required": ["hwnd", "desktop_id"]
+        }
+    ),
+    Tool(
+        name="spawn_terminal",
+        description="Spawn a new terminal process. Terminal lives for the server lifetime.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "command": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Command to execute (list of args). If not provided, uses platform default (pwsh/powershell/cmd on Windows, bash/sh on Linux/macOS)"
                 },
-                "required": ["pid", "key"]
+                "shell": {
+                    "type": "boolean",
+                    "description": "Whether to run in shell mode",
+                    "default": False
+                }
             }
-        ),
-        Tool(
-            name="close_terminal",
-            description="Close/kill a terminal process by PID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pid": {
-                        "type": "integer",
-                        "description": "Terminal process ID to close"
-                    }
+        }
+    ),
+    Tool(
+        name="list_terminals",
+        description="List all active terminal processes with their PIDs and status",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="send_terminal_text",
+        description="Send text input to a terminal process",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pid": {
+                    "type": "integer",
+                    "description": "Terminal process ID (from spawn_terminal or list_terminals)"
                 },
-                "required": ["pid"]
-            }
-        ),
-    ]
+                "text": {
+                    "type": "string",
+                    "description": "Text to send to terminal stdin"
+                }
+            },
+            "required": ["pid", "text"]
+        }
+    ),
+    Tool(
+        name="read_terminal_output",
+        description="Read output from a terminal process. Returns characters array or text string based on terminal_output_mode config (default: chars)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pid": {
+                    "type": "integer",
+                    "description": "Terminal process ID"
+                },
+                "count": {
+                    "type": "integer",
+                    "description": "Maximum number of characters to read (optional, returns all available if not specified)"
+                }
+            },
+            "required": ["pid"]
+        }
+    ),
+    Tool(
+        name="send_terminal_key",
+        description="Send key event (down/up) to a terminal process. Uses same key format as keyboard tools.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pid": {
+                    "type": "integer",
+                    "description": "Terminal process ID"
+                },
+                "key": {
+                    "type": "string",
+                    "description": "Key to send (e.g., 'a', 'ctrl', 'enter', 'ctrl+c')"
+                },
+                "event": {
+                    "type": "string",
+                    "enum": ["down", "up"],
+                    "description": "Key event type",
+                    "default": "down"
+                }
+            },
+            "required": ["pid", "key"]
+        }
+    ),
+    Tool(
+        name="close_terminal",
+        description="Close/kill a terminal process by PID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pid": {
+                    "type": "integer",
+                    "description": "Terminal process ID to close"
+                }
+            },
+            "required": ["pid"]
+        }
+    ),
+]
+
+# Every tool accepts include_state to skip the post-action observation
+for _tool in _TOOLS:
+    _tool.inputSchema.setdefault("properties", {})["include_state"] = {
+        "type": "boolean",
+        "description": "Collect observed state (screenshot, mouse, focused app, ...) after the action (default: true). Set false for fire-and-forget steps.",
+        "default": True
+    }
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    return _TOOLS
+
+
+# Route tool names to their handlers
+_HANDLERS = {
+    "click": mouse.handle_click,
+    "double_click": mouse.handle_double_click,
+    "triple_click": mouse.handle_triple_click,
+    "button_down": mouse.handle_button_down,
+    "button_up": mouse.handle_button_up,
+    "drag": mouse.handle_drag,
+    "mouse_move": mouse.handle_mouse_move,
+    "type": keyboard.handle_type,
+    "key_down": keyboard.handle_key_down,
+    "key_up": keyboard.handle_key_up,
+    "key_press": keyboard.handle_key_press,
+    "screenshot": screenshot.handle_screenshot,
+    "set_config": config.handle_set_config,
+    "list_windows": window.handle_list_windows,
+    "switch_to_window": window.handle_switch_to_window,
+    "move_window": window.handle_move_window,
+    "resize_window": window.handle_resize_window,
+    "minimize_window": window.handle_minimize_window,
+    "maximize_window": window.handle_maximize_window,
+    "restore_window": window.handle_restore_window,
+    "set_window_topmost": window.handle_set_window_topmost,
+    "get_window_info": window.handle_get_window_info,
+    "close_window": window.handle_close_window,
+    "snap_window_left": window.handle_snap_window_left,
+    "snap_window_right": window.handle_snap_window_right,
+    "snap_window_top": window.handle_snap_window_top,
+    "snap_window_bottom": window.handle_snap_window_bottom,
+    "screenshot_window": window.handle_screenshot_window,
+    "list_virtual_desktops": window.handle_list_virtual_desktops,
+    "switch_virtual_desktop": window.handle_switch_virtual_desktop,
+    "move_window_to_virtual_desktop": window.handle_move_window_to_virtual_desktop,
+    "spawn_terminal": terminal.handle_spawn_terminal,
+    "list_terminals": terminal.handle_list_terminals,
+    "send_terminal_text": terminal.handle_send_terminal_text,
+    "read_terminal_output": terminal.handle_read_terminal_output,
+    "send_terminal_key": terminal.handle_send_terminal_key,
+    "close_terminal": terminal.handle_close_terminal,
+}
+
+# Controller passed to each handler (tools not listed get None)
+_CONTROLLERS = {
+    "click": mouse_controller,
+    "double_click": mouse_controller,
+    "triple_click": mouse_controller,
+    "button_down": mouse_controller,
+    "button_up": mouse_controller,
+    "drag": mouse_controller,
+    "mouse_move": mouse_controller,
+    "type": keyboard_controller,
+    "key_down": keyboard_controller,
+    "key_up": keyboard_controller,
+    "key_press": keyboard_controller,
+}
+
+# Resolved once at import: tool name -> (handler, controller, is_async), so a
+# call costs a single lookup instead of two lookups plus a coroutine check
+_DISPATCH = {
+    name: (handler, _CONTROLLERS.get(name), inspect.iscoroutinefunction(handler))
+    for name, handler in _HANDLERS.items()
+}
+
+
+# Tools that only read; every other tool may change the UI and invalidates
+# the cached accessibility tree
+_READ_ONLY_TOOLS = frozenset({
+    "screenshot", "set_config", "list_windows", "get_window_info", "screenshot_window",
+    "list_virtual_desktops", "list_terminals", "read_terminal_output",
+})
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[Union[TextContent, ImageContent]]:
     """Handle tool calls."""
-    import json
-    
     try:
-        # Update listeners based on config
-        if computer_state.config["observe_mouse_position"] or computer_state.config["observe_mouse_button_states"]:
-            computer_state.start_mouse_listener()
-        else:
-            computer_state.stop_mouse_listener()
-        
-        if computer_state.config["observe_keyboard_key_states"]:
-            computer_state.start_keyboard_listener()
-        else:
-            computer_state.stop_keyboard_listener()
+        entry = _DISPATCH.get(name)
+        if entry is None:
+            return [text_content(to_json({"error": f"Unknown tool: {name}"}))]
         
-        # Route to appropriate handler
-        handlers = {
-            "click": mouse.handle_click,
-            "double_click": mouse.handle_double_click,
-            "triple_click": mouse.handle_triple_click,
-            "button_down": mouse.handle_button_down,
-            "button_up": mouse.handle_button_up,
-            "drag": mouse.handle_drag,
-            "mouse_move": mouse.handle_mouse_move,
-            "type": keyboard.handle_type,
-            "key_down": keyboard.handle_key_down,
-            "key_up": keyboard.handle_key_up,
-            "key_press": keyboard.handle_key_press,
-            "screenshot": screenshot.handle_screenshot,
-            "set_config": config.handle_set_config,
-            "list_windows": window.handle_list_windows,
-            "switch_to_window": window.handle_switch_to_window,
-            "move_window": window.handle_move_window,
-            "resize_window": window.handle_resize_window,
-            "minimize_window": window.handle_minimize_window,
-            "maximize_window": window.handle_maximize_window,
-            "restore_window": window.handle_restore_window,
-            "set_window_topmost": window.handle_set_window_topmost,
-            "get_window_info": window.handle_get_window_info,
-            "close_window": window.handle_close_window,
-            "snap_window_left": window.handle_snap_window_left,
-            "snap_window_right": window.handle_snap_window_right,
-            "snap_window_top": window.handle_snap_window_top,
-            "snap_window_bottom": window.handle_snap_window_bottom,
-            "screenshot_window": window.handle_screenshot_window,
-            "list_virtual_desktops": window.handle_list_virtual_desktops,
-            "switch_virtual_desktop": window.handle_switch_virtual_desktop,
-            "move_window_to_virtual_desktop": window.handle_move_window_to_virtual_desktop,
-            "spawn_terminal": terminal.handle_spawn_terminal,
-            "list_terminals": terminal.handle_list_terminals,
-            "send_terminal_text": terminal.handle_send_terminal_text,
-            "read_terminal_output": terminal.handle_read_terminal_output,
-            "send_terminal_key": terminal.handle_send_terminal_key,
-            "close_terminal": terminal.handle_close_terminal,
-        }
+        if name not in _READ_ONLY_TOOLS:
+            # Handlers collect state after acting; never reuse an older snapshot
+            computer_state.invalidate_state()
         
-        if name in handlers:
-            controller = None
-            if "mouse" in name or name == "drag":
-                controller = mouse_controller
-            elif "key" in name or name == "type":
-                controller = keyboard_controller
-            
-            handler = handlers[name]
-            # Check if handler is async (coroutine function)
-            import inspect
-            if inspect.iscoroutinefunction(handler):
-                return await handler(arguments, computer_state, controller)
-            else:
-                return handler(arguments, computer_state, controller)
-        else:
-            return [TextContent(type="text", text=json.dumps({"error": f"Unknown tool: {name}"}))]
+        handler, controller, is_async = entry
+        if is_async:
+            return await handler(arguments, computer_state, controller)
+        return handler(arguments, computer_state, controller)
     
     except Exception as e:
         error_msg = {"error": str(e), "tool": name, "arguments": arguments}
-        return [TextContent(type="text", text=json.dumps(error_msg))]
-
+        return [text_content(to_json(error_msg))]